@@ -18,37 +18,141 @@ Exit Codes:
     99 - Unexpected error
 """
 
+from __future__ import annotations
+
 import configparser
 import argparse
+import codecs
+import csv
+import functools
 import html
+import http.cookiejar
+import importlib
+import io
+import itertools
 import json
 import logging
 import os
 import pickle
 import re
+import signal
 import sys
+import tempfile
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from decimal import Decimal, InvalidOperation
 from logging.handlers import RotatingFileHandler
-from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import urlparse
-import csv
-import io
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse
 
-import mysql.connector
-import requests
-from mysql.connector import MySQLConnection
-from selenium import webdriver
-from selenium.common.exceptions import (
+# Taken after the stdlib imports so --profile-startup covers the eager
+# third-party imports below and the module body
+MODULE_IMPORT_STARTED = time.perf_counter()
+
+import requests  # noqa: E402
+from requests.adapters import HTTPAdapter  # noqa: E402
+from selenium.common.exceptions import (  # noqa: E402
     NoSuchElementException,
     TimeoutException,
     WebDriverException,
 )
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select, WebDriverWait
+
+if TYPE_CHECKING:
+    from mysql.connector import MySQLConnection
+    from selenium.webdriver.remote.webelement import WebElement
+
+
+# Seconds spent importing each lazily loaded dependency
+LAZY_IMPORT_STATS: Dict[str, float] = {}
+
+
+class LazyImport:
+    """Module (or module attribute) imported on first use.
+
+    Selenium, mysql.connector and lxml take hundreds of milliseconds to
+    import; --check-links / --warm-links runs never touch a browser, and the
+    HTTP-only session mode may not need one either. Attribute access and
+    calls are forwarded to the real object, submodules (mysql.connector,
+    lxml.html) are imported on attribute access. Tests can still patch
+    gogetlinks_parser.<name> as before.
+    """
+
+    def __init__(self, module: str, attr: Optional[str] = None) -> None:
+        self._module = module
+        self._attr = attr
+        self._target: Any = None
+
+    def _resolve(self) -> Any:
+        if self._target is None:
+            start = time.perf_counter()
+            module = importlib.import_module(self._module)
+            LAZY_IMPORT_STATS.setdefault(self._module, time.perf_counter() - start)
+            self._target = getattr(module, self._attr) if self._attr else module
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            # Introspection (mock.patch, copy, pickle) must not trigger import
+            raise AttributeError(name)
+        target = self._resolve()
+        try:
+            return getattr(target, name)
+        except AttributeError:
+            if self._attr:
+                raise
+            try:
+                return LazyImport(f"{self._module}.{name}")._resolve()
+            except ImportError:
+                raise AttributeError(
+                    f"module {self._module!r} has no attribute {name!r}"
+                ) from None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        target = f"{self._module}.{self._attr}" if self._attr else self._module
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<LazyImport {target} ({state})>"
+
+
+lxml = LazyImport("lxml")
+mysql = LazyImport("mysql")
+webdriver = LazyImport("selenium.webdriver")
+Options = LazyImport("selenium.webdriver.chrome.options", "Options")
+By = LazyImport("selenium.webdriver.common.by", "By")
+EC = LazyImport("selenium.webdriver.support.expected_conditions")
+Select = LazyImport("selenium.webdriver.support.ui", "Select")
+WebDriverWait = LazyImport("selenium.webdriver.support.ui", "WebDriverWait")
+
+
+def format_startup_profile() -> str:
+    """Format module import time and lazily imported dependencies."""
+    parts = [f"module import {MODULE_IMPORT_TIME * 1000:.0f} ms"]
+    for module, elapsed in sorted(
+        LAZY_IMPORT_STATS.items(), key=lambda item: -item[1]
+    ):
+        parts.append(f"{module} {elapsed * 1000:.0f} ms")
+    if not LAZY_IMPORT_STATS:
+        parts.append("no heavy dependencies loaded")
+    return ", ".join(parts)
+
 
 # =============================================================================
 # CONSTANTS
@@ -83,6 +187,49 @@ DB_TABLE = "ggl_tasks"
 DB_FULL_TABLE = f"{DB_SCHEMA}.{DB_TABLE}"
 DB_LINKS_TABLE = "ggl_links"
 DB_FULL_LINKS_TABLE = f"{DB_SCHEMA}.{DB_LINKS_TABLE}"
+DB_LINKS_STAGING_TABLE = "tmp_ggl_links_sync"
+DB_SITES_STAGING_TABLE = "tmp_ggl_domain_sync"
+
+# CSV export streaming
+CSV_EXPORT_ENCODING = "windows-1251"
+CSV_STREAM_CHUNK_SIZE = 64 * 1024
+CSV_SPOOL_MAX_MEMORY = 4 * 1024 * 1024  # larger exports spill to a temp file
+
+# (status, export page, download URL, form fields) for each links export
+CSV_EXPORTS = (
+    (
+        "paid",
+        PAID_LINKS_URL,
+        CSV_DOWNLOAD_PAID_URL,
+        {"url": "true", "date_paid": "true"},
+    ),
+    (
+        "wait_indexation",
+        WAIT_INDEXATION_URL,
+        CSV_DOWNLOAD_WAIT_URL,
+        {"url": "true"},
+    ),
+)
+
+# Rows per multi-row INSERT when saving parsed tasks
+TASKS_SAVE_BATCH_SIZE = 500
+
+# Maximum values bound to one IN (...) list; larger sets are queried in
+# chunks (see execute_in_chunks). Overridable via [database] in_chunk_size
+DB_IN_CHUNK_SIZE = 1000
+
+# Rows per multi-row INSERT when loading links into staging table
+LINKS_SYNC_BATCH_SIZE = 1000
+
+# Rows per multi-row INSERT when loading mySites metrics into staging table
+SITES_SAVE_BATCH_SIZE = 1000
+
+# Bump ggl_update_at of domains whose metrics did not change ("seen" touch)
+SITES_TOUCH_UNCHANGED = False
+
+# Link sync strategy: "bulk" (staging table) or "incremental" (in-memory diff)
+LINKS_SYNC_MODE = "bulk"
+LINKS_SYNC_MODES = ("bulk", "incremental")
 
 # Timeouts
 CAPTCHA_TIMEOUT = 120
@@ -92,6 +239,32 @@ PAGE_LOAD_TIMEOUT = 10
 IMPLICIT_WAIT = 5
 LINK_CHECK_TIMEOUT = 10
 
+# Run page parsing with implicit wait disabled, so probes for optional
+# elements (probe_element) fail instantly instead of after IMPLICIT_WAIT
+FAST_PROBES = True
+
+# Explicit waits (see wait_for): condition poll interval and the
+# "page settled" check — document loaded and no jQuery AJAX in flight
+WAIT_POLL_INTERVAL = 0.1
+JS_PAGE_READY = (
+    "return document.readyState === 'complete'"
+    " && (!window.jQuery || window.jQuery.active === 0);"
+)
+
+# Link check concurrency (overridable in [links] section of config.ini)
+LINK_CHECK_CONCURRENCY = 20
+LINK_CHECK_PER_HOST = 4
+
+# HTTP connection pools for link check/warm sessions
+HTTP_POOL_CONNECTIONS = 50  # number of per-host pools kept alive
+HTTP_POOL_MAXSIZE = 10  # keep-alive connections per host
+
+# Buffered writes of check/warm results: flush every N results or T seconds
+LINK_RESULTS_BATCH_SIZE = 200
+LINK_RESULTS_FLUSH_INTERVAL = 5.0
+# How often the flush interval is re-checked while no result arrives
+LINK_RESULTS_IDLE_POLL = 1.0
+
 # Exit codes
 EXIT_SUCCESS = 0
 EXIT_AUTH_FAILED = 1
@@ -116,15 +289,229 @@ SELECTOR_MODAL = ".jquery-modal.blocker"
 SELECTOR_MODAL_CONTENT = ".modal"
 SELECTOR_MODAL_CLOSE = "a[rel='modal:close']"
 
-# Rate limiting for detail parsing
+# Rate limiting for detail parsing (minimum seconds between modal requests)
 DETAIL_REQUEST_DELAY = 1.5
 
+# Detail fetching: "http" (view_task.php through the cookie session, parallel)
+# or "modal" (jQuery modal in the browser, one task at a time)
+DETAIL_FETCH_MODE = "http"
+DETAIL_FETCH_MODES = ("http", "modal")
+DETAIL_FETCH_CONCURRENCY = 4
+DETAIL_FETCH_RATE_LIMIT = 2.0  # requests per second
+DETAIL_FETCH_TIMEOUT = 15
+
+# Task list extraction: "script" (one execute_script call for all rows),
+# "html" (parse driver.page_source offline with lxml)
+# or "webdriver" (WebElement lookups per cell)
+TASK_EXTRACTION_MODE = "script"
+TASK_EXTRACTION_MODES = ("script", "html", "webdriver")
+
+# mySites data rows: "table tbody tr" with at least 10 cells. Both scripts
+# take the row selector and minimum cell count as arguments.
+MY_SITES_ROW_SELECTOR = "table tbody tr"
+MY_SITES_MIN_CELLS = 10
+
+# Returns cell texts of all mySites data rows in one WebDriver round trip
+JS_EXTRACT_MY_SITES_ROWS = """
+var text = function (el) {
+    return el ? (el.innerText || el.textContent || '') : null;
+};
+var minCells = arguments[1];
+var rows = Array.prototype.filter.call(
+    document.querySelectorAll(arguments[0]),
+    function (row) { return row.getElementsByTagName('td').length >= minCells; }
+);
+return rows.map(function (row) {
+    return {
+        cells: Array.prototype.map.call(row.getElementsByTagName('td'), text),
+        site: text(row.querySelector('.site-link__info'))
+    };
+});
+"""
+
+# Page-change marker of mySites table (see get_page_marker), one round trip
+JS_MY_SITES_MARKER = """
+var minCells = arguments[1];
+var rows = Array.prototype.filter.call(
+    document.querySelectorAll(arguments[0]),
+    function (row) { return row.getElementsByTagName('td').length >= minCells; }
+);
+if (!rows.length) {
+    return '';
+}
+var text = function (row) {
+    return (row.innerText || row.textContent || '').replace(/\\s+/g, ' ').trim();
+};
+return text(rows[0]) + '|' + text(rows[rows.length - 1]) + '|' + rows.length;
+"""
+
+# mySites pagination: "http" (replay the mySites.load() AJAX request through
+# the cookie session, pages fetched in parallel) or "browser" (click pages)
+MY_SITES_PAGINATION = "http"
+MY_SITES_PAGINATION_MODES = ("http", "browser")
+MY_SITES_FETCH_CONCURRENCY = 4
+MY_SITES_FETCH_RATE_LIMIT = 2.0  # requests per second
+MY_SITES_FETCH_TIMEOUT = 30
+# Upper bound for probing past the highest pagination link (the link window
+# may be cut); reaching it means the end was not found
+MY_SITES_MAX_PAGES = 1000
+# Form/query parameter names that carry the mySites page number
+MY_SITES_PAGE_PARAM_RE = re.compile(r"^(?:p|pg|.*page.*)$", re.IGNORECASE)
+
+# Highest page number offered by mySites pagination links (0 if none)
+JS_MY_SITES_PAGE_COUNT = """
+var pages = [0];
+document.querySelectorAll(".pagination a[onclick*='mySites.load(']").forEach(
+    function (link) {
+        var onclick = link.getAttribute('onclick') || '';
+        var match = /mySites\\.load\\((\\d+)\\)/.exec(onclick);
+        if (match) {
+            pages.push(parseInt(match[1], 10));
+        }
+    }
+);
+var current = document.querySelector('.pagination .pagination__item_current');
+if (current && /^\\d+$/.test((current.textContent || '').trim())) {
+    pages.push(parseInt(current.textContent.trim(), 10));
+}
+return Math.max.apply(null, pages);
+"""
+
+# Calls mySites.load(page) and reports the jQuery AJAX request it sends
+# (async script; null if mySites/jQuery are missing or nothing was sent)
+JS_CAPTURE_MY_SITES_REQUEST = """
+var done = arguments[arguments.length - 1];
+var page = arguments[0];
+if (!window.jQuery || !window.mySites || typeof window.mySites.load !== 'function') {
+    done(null);
+    return;
+}
+var finished = false;
+var finish = function (result) {
+    if (!finished) {
+        finished = true;
+        jQuery(document).off('ajaxSend', onSend);
+        done(result);
+    }
+};
+var onSend = function (event, xhr, settings) {
+    var data = settings.data || '';
+    finish({
+        url: settings.url,
+        method: (settings.type || settings.method || 'GET').toUpperCase(),
+        data: typeof data === 'string' ? data : jQuery.param(data)
+    });
+};
+jQuery(document).on('ajaxSend', onSend);
+try {
+    window.mySites.load(page);
+} catch (e) {
+    finish(null);
+}
+setTimeout(function () { finish(null); }, arguments[1]);
+"""
+
+# Tags that break text lines when rendered (approximates WebElement.text)
+HTML_BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl",
+    "dt", "fieldset", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+    "table", "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+})
+
+# Returns raw cell data of all task rows in a single WebDriver round trip
+JS_EXTRACT_TASK_ROWS = """
+var text = function (el) {
+    return el ? (el.innerText || el.textContent || '') : null;
+};
+return Array.prototype.map.call(
+    document.querySelectorAll(arguments[0]),
+    function (row) {
+        var cells = row.getElementsByTagName('td');
+        var first = cells[0] || null;
+        var second = cells[1] || null;
+        var customerLink = second ? second.querySelector('a') : null;
+        return {
+            id: row.id || '',
+            cells: Array.prototype.map.call(cells, text),
+            domain: first ? text(first.querySelector('a')) : null,
+            campaign: first ? text(first.querySelector('.site-link__campaign')) : null,
+            customer: text(customerLink),
+            customer_url: customerLink ? customerLink.href : null
+        };
+    }
+);
+"""
+
 # Stale tasks alert
 NO_NEW_TASKS_THRESHOLD_DAYS = 5
 
 # Session persistence
 COOKIE_FILE = "session_cookies.pkl"
 
+# "http": validate cached cookies with a plain request and run CSV sync and
+# task parsing without a browser; Chrome is started only for stages that
+# need it (mySites) or when a fresh login is required.
+# "browser": always start Chrome first (previous behaviour).
+SESSION_MODE = "http"
+SESSION_MODES = ("http", "browser")
+SESSION_CHECK_TIMEOUT = 15
+
+# Browser reuse between runs. An empty user_data_dir gives a fresh temporary
+# profile each run; a persistent profile keeps HTTP cache, cookies and
+# localStorage. debugger_address ("host:port") attaches to a long-lived
+# Chrome started with --remote-debugging-port instead of launching one.
+CHROME_USER_DATA_DIR = ""
+CHROME_DEBUGGER_ADDRESS = ""
+
+# Resource blocking in the headless browser (see apply_resource_blocking):
+# images via Chrome content settings, plus CDP Network.setBlockedURLs
+# patterns for images, fonts and third-party analytics/chat scripts.
+BLOCK_RESOURCES = True
+BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*mc.yandex.ru*", "*top-fwz1.mail.ru*", "*connect.facebook.net*",
+    "*vk.com/js/*", "*jivosite.com*", "*jivo.ru*", "*tawk.to*",
+    "*livechatinc.com*", "*carrotquest.io*",
+)
+# Hosts that must keep loading: the site itself, jQuery used by its pages
+# and reCAPTCHA needed by authenticate. Patterns naming them are dropped.
+RESOURCE_ALLOWED_HOSTS = (
+    "gogetlinks.net",
+    "code.jquery.com",
+    "ajax.googleapis.com",
+    "www.google.com",
+    "www.gstatic.com",
+    "www.recaptcha.net",
+)
+# Sample URLs of those resources; a configured blocked_urls pattern that
+# matches any of them is rejected by validate_config (e.g. "*.js").
+RESOURCE_REQUIRED_URLS = (
+    "https://gogetlinks.net/",
+    "https://gogetlinks.net/js/main.js",
+    "https://code.jquery.com/jquery-3.6.0.min.js",
+    "https://ajax.googleapis.com/ajax/libs/jquery/3.6.0/jquery.min.js",
+    "https://www.google.com/recaptcha/api.js",
+    "https://www.gstatic.com/recaptcha/releases/latest/recaptcha__ru.js",
+    "https://www.recaptcha.net/recaptcha/api.js",
+)
+JS_PAGE_TRANSFER = """
+var entries = performance.getEntriesByType('navigation')
+    .concat(performance.getEntriesByType('resource'));
+var bytes = 0;
+for (var i = 0; i < entries.length; i++) {
+    bytes += entries[i].transferSize || 0;
+}
+return [bytes, entries.length];
+"""
+
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
 # Anti-Captcha API
 ANTICAPTCHA_CREATE_TASK_URL = "https://api.anti-captcha.com/createTask"
 ANTICAPTCHA_GET_RESULT_URL = "https://api.anti-captcha.com/getTaskResult"
@@ -169,6 +556,27 @@ def load_config(config_path: str = "config.ini") -> Dict[str, Any]:
             "user": parser.get("database", "user"),
             "password": parser.get("database", "password"),
             "database": parser.get("database", "database"),
+            "in_chunk_size": parser.getint(
+                "database", "in_chunk_size", fallback=DB_IN_CHUNK_SIZE
+            ),
+        },
+        "browser": {
+            "user_data_dir": os.path.expanduser(parser.get(
+                "browser", "user_data_dir", fallback=CHROME_USER_DATA_DIR
+            ).strip()),
+            "debugger_address": parser.get(
+                "browser", "debugger_address", fallback=CHROME_DEBUGGER_ADDRESS
+            ).strip(),
+            "block_resources": parser.getboolean(
+                "browser", "block_resources", fallback=BLOCK_RESOURCES
+            ),
+            "blocked_urls": [
+                pattern.strip()
+                for pattern in parser.get(
+                    "browser", "blocked_urls", fallback=""
+                ).split(",")
+                if pattern.strip()
+            ],
         },
         "telegram": {
             "enabled": parser.getboolean("telegram", "enabled", fallback=False),
@@ -184,6 +592,70 @@ def load_config(config_path: str = "config.ini") -> Dict[str, Any]:
             "log_file": parser.get("logging", "log_file"),
             "log_level": parser.get("logging", "log_level"),
         },
+        "parser": {
+            "task_extraction": parser.get(
+                "parser", "task_extraction", fallback=TASK_EXTRACTION_MODE
+            ).strip().lower(),
+            "fast_probes": parser.getboolean(
+                "parser", "fast_probes", fallback=FAST_PROBES
+            ),
+            "sites_touch_unchanged": parser.getboolean(
+                "parser", "sites_touch_unchanged", fallback=SITES_TOUCH_UNCHANGED
+            ),
+            "sites_pagination": parser.get(
+                "parser", "sites_pagination", fallback=MY_SITES_PAGINATION
+            ).strip().lower(),
+            "detail_fetch": parser.get(
+                "parser", "detail_fetch", fallback=DETAIL_FETCH_MODE
+            ).strip().lower(),
+            "detail_concurrency": parser.getint(
+                "parser", "detail_concurrency", fallback=DETAIL_FETCH_CONCURRENCY
+            ),
+            "detail_rps": parser.getfloat(
+                "parser", "detail_rps", fallback=DETAIL_FETCH_RATE_LIMIT
+            ),
+            "session_mode": parser.get(
+                "parser", "session_mode", fallback=SESSION_MODE
+            ).strip().lower(),
+        },
+        "daemon": {
+            f"{stage}_interval": parser.getint(
+                "daemon", f"{stage}_interval", fallback=DAEMON_INTERVALS[stage]
+            )
+            for stage in DAEMON_STAGES
+        },
+        "links": {
+            "check_concurrency": parser.getint(
+                "links", "check_concurrency", fallback=LINK_CHECK_CONCURRENCY
+            ),
+            "check_per_host": parser.getint(
+                "links", "check_per_host", fallback=LINK_CHECK_PER_HOST
+            ),
+            "warm_concurrency": parser.getint(
+                "links", "warm_concurrency", fallback=WARM_CONCURRENCY
+            ),
+            "warm_per_host": parser.getint(
+                "links", "warm_per_host", fallback=WARM_PER_HOST
+            ),
+            "warm_rps": parser.getfloat(
+                "links", "warm_rps", fallback=WARM_RATE_LIMIT
+            ),
+            "db_batch_size": parser.getint(
+                "links", "db_batch_size", fallback=LINK_RESULTS_BATCH_SIZE
+            ),
+            "db_flush_interval": parser.getfloat(
+                "links", "db_flush_interval", fallback=LINK_RESULTS_FLUSH_INTERVAL
+            ),
+            "pool_connections": parser.getint(
+                "links", "pool_connections", fallback=HTTP_POOL_CONNECTIONS
+            ),
+            "pool_maxsize": parser.getint(
+                "links", "pool_maxsize", fallback=HTTP_POOL_MAXSIZE
+            ),
+            "sync_mode": parser.get(
+                "links", "sync_mode", fallback=LINKS_SYNC_MODE
+            ).strip().lower(),
+        },
     }
 
     return config
@@ -214,6 +686,70 @@ def validate_config(config: Dict[str, Any]) -> None:
     if not (1 <= port <= 65535):
         raise ValueError(f"Invalid database port: {port}")
 
+    # Validate task list extraction mode
+    extraction = config.get("parser", {}).get("task_extraction", TASK_EXTRACTION_MODE)
+    if extraction not in TASK_EXTRACTION_MODES:
+        raise ValueError(
+            f"Invalid parser task_extraction: {extraction} "
+            f"(expected one of: {', '.join(TASK_EXTRACTION_MODES)})"
+        )
+
+    # Validate task detail fetch mode
+    detail_fetch = config.get("parser", {}).get("detail_fetch", DETAIL_FETCH_MODE)
+    if detail_fetch not in DETAIL_FETCH_MODES:
+        raise ValueError(
+            f"Invalid parser detail_fetch: {detail_fetch} "
+            f"(expected one of: {', '.join(DETAIL_FETCH_MODES)})"
+        )
+
+    # Validate mySites pagination mode
+    sites_pagination = config.get("parser", {}).get(
+        "sites_pagination", MY_SITES_PAGINATION
+    )
+    if sites_pagination not in MY_SITES_PAGINATION_MODES:
+        raise ValueError(
+            f"Invalid parser sites_pagination: {sites_pagination} "
+            f"(expected one of: {', '.join(MY_SITES_PAGINATION_MODES)})"
+        )
+
+    # Validate session mode
+    session_mode = config.get("parser", {}).get("session_mode", SESSION_MODE)
+    if session_mode not in SESSION_MODES:
+        raise ValueError(
+            f"Invalid parser session_mode: {session_mode} "
+            f"(expected one of: {', '.join(SESSION_MODES)})"
+        )
+
+    # Validate remote debugging address of a long-lived Chrome
+    debugger_address = config.get("browser", {}).get("debugger_address", "")
+    if debugger_address and not re.match(r"^[\w.-]+:\d{1,5}$", debugger_address):
+        raise ValueError(
+            f"Invalid browser debugger_address: {debugger_address} "
+            "(expected host:port)"
+        )
+
+    # Validate extra blocked URL patterns against required resources
+    for pattern in config.get("browser", {}).get("blocked_urls", ()):
+        required = find_blocked_required_url(pattern)
+        if required is not None:
+            raise ValueError(
+                f"Invalid browser blocked_urls pattern: {pattern} "
+                f"(would block {required})"
+            )
+
+    # Validate daemon stage intervals
+    for key, interval in config.get("daemon", {}).items():
+        if interval < 0:
+            raise ValueError(f"Invalid daemon {key}: {interval} (expected >= 0)")
+
+    # Validate links sync mode
+    sync_mode = config.get("links", {}).get("sync_mode", LINKS_SYNC_MODE)
+    if sync_mode not in LINKS_SYNC_MODES:
+        raise ValueError(
+            f"Invalid links sync_mode: {sync_mode} "
+            f"(expected one of: {', '.join(LINKS_SYNC_MODES)})"
+        )
+
 
 def mask_email(email: str) -> str:
     """Mask email for safe logging.
@@ -451,6 +987,76 @@ def connect_to_database(config: Dict[str, Any], logger: logging.Logger) -> MySQL
                 raise
 
 
+def iter_chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yield consecutive slices of items with at most size elements."""
+    size = max(1, size)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def execute_in_chunks(
+    cursor: Any,
+    query: str,
+    values: List[Any],
+    logger: Optional[logging.Logger] = None,
+    chunk_size: int = DB_IN_CHUNK_SIZE,
+    params_before: Tuple[Any, ...] = (),
+    fetch: bool = False,
+) -> Tuple[List[Tuple[Any, ...]], int]:
+    """Run a query with an IN list once per chunk of values.
+
+    The query must contain a ``{placeholders}`` marker, replaced by
+    ``%s, %s, ...`` for each chunk, e.g.
+    ``"DELETE FROM t WHERE id IN ({placeholders})"``. This keeps statements
+    small for tens of thousands of values. Each chunk is timed and logged
+    at DEBUG level.
+
+    Args:
+        cursor: Cursor to execute with
+        query: SQL with ``{placeholders}`` marker
+        values: Values for the IN list
+        logger: Optional logger for per-chunk timing
+        chunk_size: Maximum values per statement
+        params_before: Parameters bound before the IN list values
+        fetch: Collect fetchall() rows of every chunk
+
+    Returns:
+        Tuple of (fetched rows, total affected row count)
+    """
+    rows: List[Tuple[Any, ...]] = []
+    affected = 0
+    chunks = list(iter_chunks(values, chunk_size))
+    total_start = time.perf_counter()
+
+    for index, chunk in enumerate(chunks, 1):
+        start = time.perf_counter()
+        cursor.execute(
+            query.format(placeholders=", ".join(["%s"] * len(chunk))),
+            (*params_before, *chunk),
+        )
+        if fetch:
+            rows.extend(cursor.fetchall())
+        elif isinstance(cursor.rowcount, int) and cursor.rowcount > 0:
+            affected += cursor.rowcount
+        if logger is not None:
+            logger.debug(
+                "IN chunk %d/%d: %d values in %.1f ms",
+                index,
+                len(chunks),
+                len(chunk),
+                (time.perf_counter() - start) * 1000,
+            )
+
+    if logger is not None and len(chunks) > 1:
+        logger.debug(
+            "IN query: %d values in %d chunks, %.1f ms total",
+            len(values),
+            len(chunks),
+            (time.perf_counter() - total_start) * 1000,
+        )
+    return rows, affected
+
+
 def task_exists(conn: MySQLConnection, task_id: int) -> bool:
     """Check if task_id exists in database.
 
@@ -498,6 +1104,59 @@ def task_has_details(conn: MySQLConnection, task_id: int) -> bool:
         cursor.close()
 
 
+def get_task_ids_with_details(
+    conn: MySQLConnection,
+    task_ids: Iterable[int],
+    cache: Optional[set] = None,
+    logger: Optional[logging.Logger] = None,
+    chunk_size: int = DB_IN_CHUNK_SIZE,
+) -> set:
+    """Return IDs of tasks that already have details parsed in database.
+
+    Set-based variant of task_has_details: one SELECT for all IDs.
+
+    Args:
+        conn: MySQL connection
+        task_ids: Task IDs to check
+        cache: Optional set of IDs known to have details (e.g. kept between
+            runs in daemon mode); hits skip the query and new hits are added
+        logger: Optional logger for query timing
+        chunk_size: Maximum IDs per IN list
+
+    Returns:
+        Set of task IDs that exist and have non-empty description
+    """
+    ids = list(dict.fromkeys(task_ids))
+    found: set = set()
+
+    if cache is not None:
+        found = {task_id for task_id in ids if task_id in cache}
+        ids = [task_id for task_id in ids if task_id not in cache]
+
+    if len(ids) == 0:
+        return found
+
+    cursor = conn.cursor()
+    try:
+        rows, _ = execute_in_chunks(
+            cursor,
+            f"SELECT task_id FROM {DB_FULL_TABLE} WHERE task_id IN ({{placeholders}})"
+            " AND description IS NOT NULL AND description != ''",
+            ids,
+            logger,
+            chunk_size,
+            fetch=True,
+        )
+        detailed = {int(row[0]) for row in rows}
+    finally:
+        cursor.close()
+
+    if cache is not None:
+        cache.update(detailed)
+
+    return found | detailed
+
+
 def insert_or_update_task(
     conn: MySQLConnection, task: Dict[str, Any], logger: logging.Logger
 ) -> Optional[bool]:
@@ -580,6 +1239,112 @@ def insert_or_update_task(
         cursor.close()
 
 
+def save_tasks_bulk(
+    conn: MySQLConnection,
+    tasks: List[Dict[str, Any]],
+    logger: logging.Logger,
+    batch_size: int = TASKS_SAVE_BATCH_SIZE,
+    chunk_size: int = DB_IN_CHUNK_SIZE,
+) -> Optional[set]:
+    """Insert or update all tasks in a single transaction.
+
+    Existing task IDs are read (and locked) with SELECT ... FOR UPDATE, then
+    all tasks are upserted with multi-row INSERT ... ON DUPLICATE KEY UPDATE
+    and committed once. Detail fields (description, url, requirements,
+    contacts, deadline) keep their stored value when the task was not
+    re-parsed in this run.
+
+    Args:
+        conn: MySQL connection
+        tasks: Task dictionaries
+        logger: Logger instance
+        batch_size: Rows per INSERT statement
+        chunk_size: Maximum IDs per IN list of the existing-ID lookup
+
+    Returns:
+        Set of newly inserted task IDs, or None if saving failed
+    """
+    if len(tasks) == 0:
+        return set()
+
+    task_ids = list(dict.fromkeys(task["task_id"] for task in tasks))
+    cursor = conn.cursor()
+
+    try:
+        rows, _ = execute_in_chunks(
+            cursor,
+            f"SELECT task_id FROM {DB_FULL_TABLE}"
+            " WHERE task_id IN ({placeholders}) FOR UPDATE",
+            task_ids,
+            logger,
+            chunk_size,
+            fetch=True,
+        )
+        existing_ids = {int(row[0]) for row in rows}
+
+        query = f"""
+            INSERT INTO {DB_FULL_TABLE} (
+                task_id, domain, customer, customer_url,
+                external_links, title, time_passed, price,
+                description, url, requirements, contacts, deadline,
+                is_new
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 1)
+            ON DUPLICATE KEY UPDATE
+                domain = VALUES(domain),
+                customer = VALUES(customer),
+                customer_url = VALUES(customer_url),
+                external_links = VALUES(external_links),
+                title = VALUES(title),
+                time_passed = VALUES(time_passed),
+                price = VALUES(price),
+                description = COALESCE(VALUES(description), description),
+                url = COALESCE(VALUES(url), url),
+                requirements = COALESCE(VALUES(requirements), requirements),
+                contacts = COALESCE(VALUES(contacts), contacts),
+                deadline = COALESCE(VALUES(deadline), deadline),
+                is_new = 0,
+                updated_at = CURRENT_TIMESTAMP
+        """
+
+        rows = [
+            (
+                task["task_id"],
+                task["domain"],
+                task["customer"],
+                task["customer_url"],
+                task["external_links"],
+                task["title"],
+                task["time_passed"],
+                task["price"],
+                task.get("description"),
+                task.get("url"),
+                task.get("requirements"),
+                task.get("contacts"),
+                task.get("deadline"),
+            )
+            for task in tasks
+        ]
+        for chunk in iter_chunks(rows, batch_size):
+            cursor.executemany(query, chunk)
+
+        conn.commit()
+
+        new_ids = set(task_ids) - existing_ids
+        logger.debug(
+            f"Bulk saved {len(task_ids)} tasks ({len(new_ids)} new) in one transaction"
+        )
+        return new_ids
+
+    except mysql.connector.Error as e:
+        logger.error(f"Failed to bulk save {len(tasks)} tasks: {e}")
+        conn.rollback()
+        return None
+
+    finally:
+        cursor.close()
+
+
 def close_database(conn: MySQLConnection, logger: logging.Logger) -> None:
     """Close database connection safely.
 
@@ -625,14 +1390,113 @@ def get_days_since_last_new_task(
 # =============================================================================
 
 
+def build_blocked_url_patterns(
+    extra_patterns: Iterable[str] = (),
+    allowed_hosts: Iterable[str] = RESOURCE_ALLOWED_HOSTS,
+) -> List[str]:
+    """Combine default and configured block patterns, minus allowed hosts.
+
+    Network.setBlockedURLs has no exceptions, so the allowlist is applied
+    to the patterns themselves: any pattern naming an allowed host is
+    dropped (e.g. a configured "*google.com*" must not break reCAPTCHA).
+    """
+    allowed = [host.lower() for host in allowed_hosts]
+    patterns: List[str] = []
+    for pattern in itertools.chain(BLOCKED_URL_PATTERNS, extra_patterns):
+        bare = pattern.lower().strip("*")
+        if any(host in bare or bare in host for host in allowed if bare):
+            continue
+        if pattern not in patterns:
+            patterns.append(pattern)
+    return patterns
+
+
+def find_blocked_required_url(
+    pattern: str, required_urls: Iterable[str] = RESOURCE_REQUIRED_URLS
+) -> Optional[str]:
+    """Return the first required URL a block pattern would match, if any.
+
+    Patterns use the Network.setBlockedURLs syntax, where "*" matches any
+    run of characters; matching is case-insensitive to err on the safe side.
+    """
+    regex = re.compile(
+        ".*".join(re.escape(part) for part in pattern.split("*")), re.IGNORECASE
+    )
+    for url in required_urls:
+        if regex.fullmatch(url):
+            return url
+    return None
+
+
+def apply_resource_blocking(
+    driver: webdriver.Chrome,
+    logger: logging.Logger,
+    patterns: List[str],
+) -> bool:
+    """Block URL patterns in the browser via CDP Network.setBlockedURLs.
+
+    Returns:
+        True if blocking is active
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except (WebDriverException, AttributeError) as e:
+        logger.warning(f"Failed to enable resource blocking: {e}")
+        return False
+    logger.info(f"Blocking {len(patterns)} resource URL patterns")
+    return True
+
+
+def log_page_transfer(
+    driver: webdriver.Chrome, logger: logging.Logger, page: str
+) -> Optional[int]:
+    """Log bytes transferred for the current page (Resource Timing API).
+
+    Costs an extra WebDriver round trip, so it only runs at DEBUG level.
+    Cross-origin resources without Timing-Allow-Origin report 0 bytes, so
+    the figure is a lower bound; it is meant for comparing runs with and
+    without resource blocking.
+
+    Returns:
+        Bytes transferred, or None if unavailable or not logged
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return None
+
+    try:
+        transferred, requests_count = driver.execute_script(JS_PAGE_TRANSFER)
+        transferred = int(transferred)
+    except Exception as e:
+        logger.debug(f"Page transfer size unavailable: {e}")
+        return None
+
+    logger.debug(
+        f"{page}: {transferred / 1024:.1f} KB transferred in "
+        f"{requests_count} requests"
+    )
+    return transferred
+
+
 def initialize_driver(
     logger: logging.Logger,
     proxy_server: Optional[str] = None,
+    user_data_dir: str = CHROME_USER_DATA_DIR,
+    debugger_address: str = CHROME_DEBUGGER_ADDRESS,
+    block_resources: bool = BLOCK_RESOURCES,
+    blocked_urls: Iterable[str] = (),
 ) -> webdriver.Chrome:
     """Initialize headless Chrome driver.
 
     Args:
         logger: Logger instance
+        proxy_server: Optional "host:port" of HTTP proxy
+        user_data_dir: Persistent Chrome profile directory ("" = temporary)
+        debugger_address: "host:port" of a running Chrome to attach to
+            instead of launching one; its own flags (headless, proxy,
+            profile) are used as is
+        block_resources: Block images, fonts and third-party scripts
+        blocked_urls: Extra URL patterns to block (see build_blocked_url_patterns)
 
     Returns:
         Chrome WebDriver instance
@@ -640,12 +1504,28 @@ def initialize_driver(
     Raises:
         WebDriverException: If driver initialization fails
     """
+    options = Options()
+    blocked_patterns = build_blocked_url_patterns(blocked_urls)
+
+    if debugger_address:
+        logger.info(f"Attaching to running Chrome at {debugger_address}")
+        options.add_experimental_option("debuggerAddress", debugger_address)
+        try:
+            driver = webdriver.Chrome(options=options)
+            driver.implicitly_wait(IMPLICIT_WAIT)
+            if block_resources:
+                apply_resource_blocking(driver, logger, blocked_patterns)
+            logger.info("WebDriver attached successfully")
+            return driver
+        except WebDriverException as e:
+            logger.error(f"Failed to attach to Chrome at {debugger_address}: {e}")
+            raise
+
     if proxy_server:
         logger.info(f"Initializing Chrome WebDriver (proxy: {proxy_server})")
     else:
         logger.info("Initializing Chrome WebDriver")
 
-    options = Options()
     options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
@@ -653,16 +1533,23 @@ def initialize_driver(
     options.add_argument("--window-size=1920,1080")
     if proxy_server:
         options.add_argument(f"--proxy-server=http://{proxy_server}")
+    if user_data_dir:
+        logger.info(f"Using persistent Chrome profile {user_data_dir}")
+        options.add_argument(f"--user-data-dir={user_data_dir}")
 
     # User-Agent spoofing
-    options.add_argument(
-        "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
+    options.add_argument(f"user-agent={BROWSER_USER_AGENT}")
+
+    if block_resources:
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
 
     try:
         driver = webdriver.Chrome(options=options)
         driver.implicitly_wait(IMPLICIT_WAIT)
+        if block_resources:
+            apply_resource_blocking(driver, logger, blocked_patterns)
         logger.info("WebDriver initialized successfully")
         return driver
 
@@ -671,19 +1558,211 @@ def initialize_driver(
         raise
 
 
-def is_anti_bot_blocked(driver: webdriver.Chrome) -> bool:
-    """Detect anti-bot/forbidden pages that block login flow."""
-    try:
-        current_url = (driver.current_url or "").lower()
-    except Exception:
-        current_url = ""
+def close_driver(
+    driver: webdriver.Chrome, logger: logging.Logger, attached: bool = False
+) -> None:
+    """Quit a launched Chrome, or only detach from an attached one.
 
-    if "/403.php" in current_url:
-        return True
+    quit() on a driver attached via debuggerAddress may close the long-lived
+    Chrome it shares, so for it only the local chromedriver is stopped and
+    the browser keeps running.
 
-    try:
-        source = (driver.page_source or "").lower()
-    except Exception:
+    Args:
+        driver: Chrome WebDriver
+        logger: Logger instance
+        attached: Driver was attached to a running Chrome (debugger_address)
+    """
+    try:
+        if attached:
+            driver.service.stop()
+            logger.info("WebDriver detached from running Chrome")
+        else:
+            driver.quit()
+            logger.info("WebDriver closed")
+    except Exception as e:
+        logger.warning(f"Error closing WebDriver: {e}")
+
+
+# Time spent in explicit waits, per wait description: [waits, timeouts, seconds]
+WAIT_STATS: Dict[str, List[float]] = {}
+WAIT_STATS_LOCK = threading.Lock()
+
+
+def wait_for(
+    driver: webdriver.Chrome,
+    condition: Callable[[Any], Any],
+    timeout: float = PAGE_LOAD_TIMEOUT,
+    description: str = "condition",
+    required: bool = True,
+) -> Any:
+    """Wait until condition(driver) returns a truthy value.
+
+    Replacement for fixed sleeps: returns as soon as the condition holds
+    and records the time spent in WAIT_STATS.
+
+    Args:
+        driver: Chrome WebDriver
+        condition: Expected condition (EC.* or any callable taking driver)
+        timeout: Maximum wait in seconds
+        description: Name the wait is accounted under
+        required: Raise TimeoutException on timeout (False returns None)
+
+    Returns:
+        Condition result, or None on timeout when not required
+
+    Raises:
+        TimeoutException: If condition is not met in time and required
+    """
+    start = time.monotonic()
+    timed_out = False
+    try:
+        return WebDriverWait(
+            driver, timeout, poll_frequency=WAIT_POLL_INTERVAL
+        ).until(condition)
+    except TimeoutException:
+        timed_out = True
+        if required:
+            raise
+        return None
+    finally:
+        elapsed = time.monotonic() - start
+        with WAIT_STATS_LOCK:
+            stats = WAIT_STATS.setdefault(description, [0, 0, 0.0])
+            stats[0] += 1
+            stats[1] += int(timed_out)
+            stats[2] += elapsed
+
+
+def is_page_ready(driver: webdriver.Chrome) -> bool:
+    """Check document.readyState is complete and no jQuery AJAX is pending."""
+    try:
+        return bool(driver.execute_script(JS_PAGE_READY))
+    except WebDriverException:
+        return False
+
+
+def wait_for_page_ready(
+    driver: webdriver.Chrome, timeout: float = PAGE_LOAD_TIMEOUT
+) -> bool:
+    """Wait for the page to settle (see is_page_ready); never raises.
+
+    Returns:
+        True if the page settled before timeout
+    """
+    return wait_for(
+        driver, is_page_ready, timeout, "page ready", required=False
+    ) is not None
+
+
+def format_wait_stats() -> str:
+    """Summarize WAIT_STATS for the log, longest waits first."""
+    with WAIT_STATS_LOCK:
+        items = sorted(WAIT_STATS.items(), key=lambda item: -item[1][2])
+    if not items:
+        return "no explicit waits"
+    total = sum(stats[2] for _, stats in items)
+    count = sum(int(stats[0]) for _, stats in items)
+    parts = []
+    for description, (waits, timeouts, seconds) in items:
+        part = f"{description} {seconds:.1f}s/{int(waits)}"
+        if timeouts:
+            part += f" ({int(timeouts)} timed out)"
+        parts.append(part)
+    return f"waited {total:.1f}s in {count} waits: " + ", ".join(parts)
+
+
+# Optional-element lookups, per selector: [probes, misses]
+PROBE_STATS: Dict[str, List[int]] = {}
+PROBE_STATS_LOCK = threading.Lock()
+
+
+def probe_element(parent: Any, by: str, selector: str) -> Optional[WebElement]:
+    """Look up an optional element, returning None instead of raising.
+
+    Meant to run under implicit_wait_disabled(): a miss then costs one
+    WebDriver round trip instead of the full implicit wait. Misses are
+    counted in PROBE_STATS.
+
+    Args:
+        parent: WebDriver or WebElement to search in
+        by: Locator strategy (By.*)
+        selector: Locator value
+
+    Returns:
+        First matching element or None
+    """
+    try:
+        element = parent.find_element(by, selector)
+        missed = False
+    except NoSuchElementException:
+        element = None
+        missed = True
+
+    with PROBE_STATS_LOCK:
+        stats = PROBE_STATS.setdefault(selector, [0, 0])
+        stats[0] += 1
+        stats[1] += int(missed)
+    return element
+
+
+@contextmanager
+def implicit_wait_disabled(
+    driver: webdriver.Chrome, enabled: bool = True
+) -> Iterator[None]:
+    """Temporarily set implicit wait to 0 (restored to IMPLICIT_WAIT).
+
+    Args:
+        driver: Chrome WebDriver
+        enabled: False makes this a no-op (keeps the global implicit wait)
+    """
+    if not enabled:
+        yield
+        return
+
+    driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        try:
+            driver.implicitly_wait(IMPLICIT_WAIT)
+        except WebDriverException:
+            pass
+
+
+def format_probe_stats() -> str:
+    """Summarize PROBE_STATS for the log, most missed selectors first."""
+    with PROBE_STATS_LOCK:
+        items = sorted(PROBE_STATS.items(), key=lambda item: -item[1][1])
+    probes = sum(stats[0] for _, stats in items)
+    misses = sum(stats[1] for _, stats in items)
+    summary = f"{misses}/{probes} optional lookups missed"
+    top = [f"{selector} {stats[1]}" for selector, stats in items[:5] if stats[1]]
+    if top:
+        summary += " (" + ", ".join(top) + ")"
+    return summary
+
+
+def reset_browser_stats() -> None:
+    """Clear WAIT_STATS and PROBE_STATS (the daemon logs them per stage)."""
+    with WAIT_STATS_LOCK:
+        WAIT_STATS.clear()
+    with PROBE_STATS_LOCK:
+        PROBE_STATS.clear()
+
+
+def is_anti_bot_blocked(driver: webdriver.Chrome) -> bool:
+    """Detect anti-bot/forbidden pages that block login flow."""
+    try:
+        current_url = (driver.current_url or "").lower()
+    except Exception:
+        current_url = ""
+
+    if "/403.php" in current_url:
+        return True
+
+    try:
+        source = (driver.page_source or "").lower()
+    except Exception:
         source = ""
 
     block_markers = (
@@ -728,36 +1807,59 @@ def save_cookies(driver: webdriver.Chrome, logger: logging.Logger) -> None:
         logger.warning(f"Failed to save cookies: {e}")
 
 
-def load_cookies(driver: webdriver.Chrome, logger: logging.Logger) -> bool:
-    """Load cookies from file and verify authentication.
+def read_cookie_file(logger: logging.Logger) -> Optional[List[Dict[str, Any]]]:
+    """Read pickled Selenium cookies from COOKIE_FILE.
 
     Args:
-        driver: Chrome WebDriver
         logger: Logger instance
 
     Returns:
-        True if cached session is valid, False otherwise
+        List of cookie dicts, or None if the file is missing, has insecure
+        permissions or cannot be unpickled
     """
     if not os.path.exists(COOKIE_FILE):
         logger.debug("No cookie file found")
-        return False
+        return None
 
     # Verify file permissions (not wider than 0o600)
     stat = os.stat(COOKIE_FILE)
     if stat.st_mode & 0o077:
         logger.warning("Cookie file has insecure permissions, skipping")
-        return False
+        return None
 
     try:
         with open(COOKIE_FILE, "rb") as f:
-            cookies = pickle.load(f)
+            return pickle.load(f)
     except Exception as e:
         logger.warning(f"Failed to load cookies: {e}")
+        return None
+
+
+def remove_cookie_file() -> None:
+    """Remove stale cookie file (ignore if already gone)."""
+    try:
+        os.remove(COOKIE_FILE)
+    except OSError:
+        pass
+
+
+def load_cookies(driver: webdriver.Chrome, logger: logging.Logger) -> bool:
+    """Load cookies from file and verify authentication.
+
+    Args:
+        driver: Chrome WebDriver
+        logger: Logger instance
+
+    Returns:
+        True if cached session is valid, False otherwise
+    """
+    cookies = read_cookie_file(logger)
+    if cookies is None:
         return False
 
     # Navigate to domain first (required for adding cookies)
     driver.get(HOME_URL)
-    time.sleep(2)
+    wait_for_page_ready(driver)
 
     for cookie in cookies:
         try:
@@ -767,21 +1869,109 @@ def load_cookies(driver: webdriver.Chrome, logger: logging.Logger) -> bool:
 
     # Refresh page with cookies applied
     driver.get(HOME_URL)
-    time.sleep(2)
+    wait_for_page_ready(driver)
 
     if is_authenticated(driver):
         logger.info("Using cached session (cookies loaded successfully)")
         return True
 
     logger.info("Cached session expired, need fresh authentication")
-    # Remove stale cookie file
-    try:
-        os.remove(COOKIE_FILE)
-    except OSError:
-        pass
+    remove_cookie_file()
     return False
 
 
+def has_browser_session(driver: webdriver.Chrome, logger: logging.Logger) -> bool:
+    """Check whether the browser is already logged in on its own.
+
+    Used with a persistent profile or an attached long-lived Chrome, whose
+    cookies survive between runs, so COOKIE_FILE need not be replayed.
+    """
+    driver.get(HOME_URL)
+    wait_for_page_ready(driver)
+    if is_authenticated(driver):
+        logger.info("Using browser profile session (already authenticated)")
+        return True
+    return False
+
+
+def is_authenticated_html(page_html: str, logger: logging.Logger) -> bool:
+    """Check if page markup belongs to an authenticated session.
+
+    Offline counterpart of is_authenticated for pages fetched over HTTP.
+    """
+    root = parse_html_document(page_html, logger)
+    return root is not None and len(root.cssselect(SELECTOR_PROFILE_LINK)) > 0
+
+
+def load_cookies_session(
+    logger: logging.Logger,
+    proxy_server: Optional[str] = None,
+) -> Optional[requests.Session]:
+    """Build requests.Session from cached cookies and verify it over HTTP.
+
+    Browserless counterpart of load_cookies: one GET of HOME_URL decides
+    whether the pickled session is still logged in, without starting Chrome.
+
+    Args:
+        logger: Logger instance
+        proxy_server: Optional "host:port" of HTTP proxy
+
+    Returns:
+        Authenticated session, or None if there are no usable cookies, the
+        session expired or the check request was blocked
+    """
+    cookies = read_cookie_file(logger)
+    if not cookies:
+        return None
+
+    session = requests.Session()
+    for cookie in cookies:
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain"),
+            path=cookie.get("path", "/"),
+            secure=cookie.get("secure", False),
+        )
+    session.headers["User-Agent"] = BROWSER_USER_AGENT
+    if proxy_server:
+        session.proxies = {
+            "http": f"http://{proxy_server}",
+            "https": f"http://{proxy_server}",
+        }
+
+    start = time.time()
+    try:
+        response = session.get(HOME_URL, timeout=SESSION_CHECK_TIMEOUT)
+    except requests.RequestException as e:
+        logger.warning(f"Cookie session check failed: {e}")
+        session.close()
+        return None
+
+    page = response.text or ""
+    lowered = page.lower()
+    if response.status_code != 200 or "qrator" in lowered or "/403.php" in response.url:
+        # Anti-bot page or server error: cookies may still be valid
+        logger.warning(
+            f"Cookie session check got HTTP {response.status_code}, "
+            "falling back to browser"
+        )
+        session.close()
+        return None
+
+    if not is_authenticated_html(page, logger):
+        logger.info("Cached session expired, need fresh authentication")
+        remove_cookie_file()
+        session.close()
+        return None
+
+    logger.info(
+        f"Using cached session over HTTP ({len(cookies)} cookies, "
+        f"checked in {time.time() - start:.2f}s)"
+    )
+    return session
+
+
 def extract_captcha_sitekey(driver: webdriver.Chrome, logger: logging.Logger) -> Optional[str]:
     """Extract reCAPTCHA sitekey from page.
 
@@ -938,7 +2128,7 @@ def authenticate(
         driver.get(HOME_URL)
 
         # Wait for page to fully load
-        time.sleep(2)
+        wait_for_page_ready(driver)
 
         # Check if already authenticated
         if is_authenticated(driver):
@@ -947,17 +2137,23 @@ def authenticate(
 
         # Click on "Войти" link to open login modal
         logger.debug(f"Looking for login button: {SELECTOR_LOGIN_BUTTON}")
-        wait = WebDriverWait(driver, PAGE_LOAD_TIMEOUT)
-
-        login_button = wait.until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, SELECTOR_LOGIN_BUTTON))
+        login_button = wait_for(
+            driver,
+            EC.element_to_be_clickable((By.CSS_SELECTOR, SELECTOR_LOGIN_BUTTON)),
+            description="login button",
         )
         logger.debug("Login button found, clicking to open modal")
         login_button.click()
 
-        # Wait for modal to appear and form fields to be visible
+        # Wait for modal (loaded via AJAX) to render its form
         logger.debug("Waiting for login modal to appear")
-        time.sleep(2)
+        wait_for(
+            driver,
+            EC.visibility_of_element_located((By.CSS_SELECTOR, SELECTOR_LOGIN_EMAIL)),
+            description="login modal",
+            required=False,
+        )
+        wait_for_page_ready(driver)
 
         # Extract captcha sitekey (optional - may not be present)
         sitekey = extract_captcha_sitekey(driver, logger)
@@ -983,8 +2179,10 @@ def authenticate(
         logger.debug("Filling login form in modal")
 
         logger.debug(f"Waiting for email field: {SELECTOR_LOGIN_EMAIL}")
-        email_field = wait.until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, SELECTOR_LOGIN_EMAIL))
+        email_field = wait_for(
+            driver,
+            EC.element_to_be_clickable((By.CSS_SELECTOR, SELECTOR_LOGIN_EMAIL)),
+            description="login form",
         )
         logger.debug("Email field found, filling...")
         email_field.clear()
@@ -992,8 +2190,10 @@ def authenticate(
 
         # Wait for password field
         logger.debug(f"Waiting for password field: {SELECTOR_LOGIN_PASSWORD}")
-        password_field = wait.until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, SELECTOR_LOGIN_PASSWORD))
+        password_field = wait_for(
+            driver,
+            EC.element_to_be_clickable((By.CSS_SELECTOR, SELECTOR_LOGIN_PASSWORD)),
+            description="login form",
         )
         logger.debug("Password field found, filling...")
         password_field.clear()
@@ -1023,8 +2223,10 @@ def authenticate(
 
         # Submit form - find button (it may be disabled initially)
         logger.debug(f"Waiting for submit button: {SELECTOR_LOGIN_SUBMIT}")
-        submit_button = wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, SELECTOR_LOGIN_SUBMIT))
+        submit_button = wait_for(
+            driver,
+            EC.presence_of_element_located((By.CSS_SELECTOR, SELECTOR_LOGIN_SUBMIT)),
+            description="login form",
         )
         logger.debug("Submit button found")
 
@@ -1035,7 +2237,6 @@ def authenticate(
         # Scroll to button to ensure it's in viewport
         logger.debug("Scrolling to submit button")
         driver.execute_script("arguments[0].scrollIntoView(true);", submit_button)
-        time.sleep(0.5)
 
         # Submit using JavaScript (more reliable than click)
         logger.debug("Submitting form via JavaScript")
@@ -1046,12 +2247,14 @@ def authenticate(
         # Wait for page to change after form submission (up to 15s)
         auth_timeout = 15
         logger.debug(f"Waiting up to {auth_timeout}s for auth redirect")
-        try:
-            WebDriverWait(driver, auth_timeout).until(
-                lambda d: is_authenticated(d)
-                or SELECTOR_LOGIN_BUTTON not in d.page_source
-            )
-        except TimeoutException:
+        if wait_for(
+            driver,
+            lambda d: is_authenticated(d)
+            or SELECTOR_LOGIN_BUTTON not in d.page_source,
+            auth_timeout,
+            description="auth redirect",
+            required=False,
+        ) is None:
             logger.debug("Auth redirect wait timed out")
 
         if is_authenticated(driver):
@@ -1191,27 +2394,24 @@ def parse_task_row(row: WebElement, logger: logging.Logger) -> Optional[Dict[str
             return None
 
         # Cell 0: Domain + task type (e.g. "stroimdacha.ru\nЗаметка")
-        try:
-            domain_link = cells[0].find_element(By.TAG_NAME, "a")
+        domain_link = probe_element(cells[0], By.TAG_NAME, "a")
+        if domain_link is not None:
             domain = sanitize_text(domain_link.text)
-        except NoSuchElementException:
+        else:
             domain = sanitize_text(cells[0].text)
 
         # Extract task type from campaign div under domain
-        try:
-            campaign_div = cells[0].find_element(
-                By.CSS_SELECTOR, ".site-link__campaign"
-            )
-            title = sanitize_text(campaign_div.text)
-        except NoSuchElementException:
-            title = ""
+        campaign_div = probe_element(
+            cells[0], By.CSS_SELECTOR, ".site-link__campaign"
+        )
+        title = sanitize_text(campaign_div.text) if campaign_div is not None else ""
 
         # Cell 1: Customer + customer_url
-        try:
-            customer_link = cells[1].find_element(By.TAG_NAME, "a")
+        customer_link = probe_element(cells[1], By.TAG_NAME, "a")
+        if customer_link is not None:
             customer = sanitize_text(customer_link.text)
             customer_url = customer_link.get_attribute("href") or ""
-        except NoSuchElementException:
+        else:
             customer = sanitize_text(cells[1].text)
             customer_url = ""
 
@@ -1249,145 +2449,363 @@ def parse_task_row(row: WebElement, logger: logging.Logger) -> Optional[Dict[str
         return None
 
 
-def parse_task_details(
-    driver: webdriver.Chrome, task_id: int, logger: logging.Logger
-) -> Dict[str, Any]:
-    """Parse task details from AJAX modal.
+def parse_task_row_data(
+    data: Dict[str, Any], logger: logging.Logger
+) -> Optional[Dict[str, Any]]:
+    """Build task from raw row data (see JS_EXTRACT_TASK_ROWS).
 
-    Opens the detail modal for a task via JavaScript, extracts additional
-    fields from the modal's .tv_params_block structure:
-    - description: "Текст задания" + "Комментарий оптимизатора"
-    - url: from #copy_url input or .param.link_to a
-    - requirements: "Требования к странице" block params
-    - contacts: not present in current modal format
-    - deadline: not present in current modal format
+    Pure-Python counterpart of parse_task_row: the same fields, but taken
+    from already extracted strings instead of live WebElements.
 
     Args:
-        driver: Chrome WebDriver
-        task_id: Task ID to fetch details for
+        data: Dict with keys id, cells (texts of all <td>), domain, campaign,
+            customer (texts of optional elements, None when absent) and
+            customer_url
         logger: Logger instance
 
     Returns:
-        Dictionary with detail fields (may be partially empty)
+        Task dictionary or None if parsing fails
     """
-    details: Dict[str, Any] = {
-        "description": None,
-        "url": None,
-        "requirements": None,
-        "contacts": None,
-        "deadline": None,
-    }
-
     try:
-        detail_url = TASK_DETAIL_URL.format(task_id)
-        logger.debug(f"Opening detail modal for task {task_id}: {detail_url}")
+        row_id = data.get("id")
+        if not row_id:
+            logger.warning("Row has no ID attribute")
+            return None
 
-        # Remove any leftover modals from previous iterations
-        driver.execute_script(
-            "$('.jquery-modal').remove(); $('.modal').remove();"
-        )
-        time.sleep(0.3)
+        task_id = extract_task_id(row_id)
 
-        driver.execute_script(
-            f"$.get('{detail_url}', function(data) {{"
-            f"  $('<div>').html(data).appendTo('body').modal();"
-            f"}});"
-        )
+        cells = data.get("cells") or []
+        if len(cells) < 6:
+            logger.warning(f"Task {task_id}: Expected 6+ cells, found {len(cells)}")
+            return None
 
-        wait = WebDriverWait(driver, PAGE_LOAD_TIMEOUT)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, SELECTOR_MODAL)))
-        time.sleep(0.5)
+        # Cell 0: Domain (link text, or whole cell) + task type under it
+        if data.get("domain") is not None:
+            domain = sanitize_text(data["domain"])
+        else:
+            domain = sanitize_text(cells[0] or "")
+        title = sanitize_text(data.get("campaign") or "")
 
-        modal = driver.find_element(By.CSS_SELECTOR, SELECTOR_MODAL_CONTENT)
+        # Cell 1: Customer + customer_url
+        if data.get("customer") is not None:
+            customer = sanitize_text(data["customer"])
+            customer_url = data.get("customer_url") or ""
+        else:
+            customer = sanitize_text(cells[1] or "")
+            customer_url = ""
 
-        # Extract URL from hidden #copy_url input
+        # Cell 2: External links
+        external_links_text = sanitize_text(cells[2] or "")
         try:
-            copy_url_input = modal.find_element(By.CSS_SELECTOR, "#copy_url")
-            url_value = copy_url_input.get_attribute("value")
-            if url_value:
-                details["url"] = url_value.strip()
-        except NoSuchElementException:
-            # Fallback: extract from .param.link_to a
-            try:
-                link_elem = modal.find_element(
-                    By.CSS_SELECTOR, ".param.link_to .block_value a"
-                )
-                href = link_elem.get_attribute("href") or ""
-                parsed = urlparse(href)
-                if parsed.netloc and "gogetlinks.net" not in parsed.netloc:
-                    details["url"] = href
-            except NoSuchElementException:
-                pass
+            external_links = int(external_links_text) if external_links_text else 0
+        except ValueError:
+            external_links = 0
 
-        # Extract structured data from .tv_params_block sections
-        blocks = modal.find_elements(By.CSS_SELECTOR, ".tv_params_block")
-        description_parts = []
+        # Cell 4: Time passed, cell 5: Price
+        time_passed = sanitize_text(cells[4] or "")
+        price_text = sanitize_text(cells[5] or "")
+        logger.debug(f"Task {task_id} price_text raw: {repr(price_text)}")
+        price = parse_price(price_text)
 
-        for block in blocks:
-            try:
-                title_elem = block.find_element(By.CSS_SELECTOR, ".block_title")
-                block_title = sanitize_text(title_elem.text).lower()
-            except NoSuchElementException:
-                continue
+        task = {
+            "task_id": task_id,
+            "domain": domain,
+            "customer": customer,
+            "customer_url": customer_url,
+            "external_links": external_links,
+            "title": title,
+            "time_passed": time_passed,
+            "price": price,
+        }
 
-            if "требовани" in block_title:
-                # Requirements block: collect all param name-value pairs
-                params = block.find_elements(By.CSS_SELECTOR, ".param")
+        logger.debug(f"Parsed task {task_id}: {title[:50]}...")
+        return task
+
+    except Exception as e:
+        logger.warning(f"Failed to parse task row: {e}")
+        return None
+
+
+def extract_task_rows_script(
+    driver: webdriver.Chrome, logger: logging.Logger
+) -> Optional[List[Dict[str, Any]]]:
+    """Extract raw data of all task rows with one execute_script call.
+
+    Returns:
+        List of raw row dicts, or None if the script failed (caller falls
+        back to per-element parsing)
+    """
+    try:
+        rows = driver.execute_script(JS_EXTRACT_TASK_ROWS, SELECTOR_TASK_ROWS)
+    except WebDriverException as e:
+        logger.warning(f"Task rows script extraction failed: {e}")
+        return None
+
+    if not isinstance(rows, list):
+        logger.warning("Task rows script returned unexpected result")
+        return None
+
+    return rows
+
+
+def html_element_text(element: Any) -> str:
+    """Return rendered-like text of an lxml element.
+
+    Unlike text_content(), block tags and <br> produce line breaks and
+    <script>/<style> bodies are skipped, so the result matches
+    WebElement.text once passed through sanitize_text.
+
+    Args:
+        element: lxml.html element
+
+    Returns:
+        Element text
+    """
+    parts: List[str] = []
+
+    def walk(node: Any) -> None:
+        tag = node.tag if isinstance(node.tag, str) else None
+        if tag is not None and tag not in ("script", "style"):
+            if tag in HTML_BLOCK_TAGS:
+                parts.append("\n")
+            if node.text:
+                parts.append(node.text)
+            for child in node:
+                walk(child)
+                if child.tail:
+                    parts.append(child.tail)
+            if tag in HTML_BLOCK_TAGS:
+                parts.append("\n")
+
+    walk(element)
+    return "".join(parts).strip()
+
+
+def parse_html_document(page_html: str, logger: logging.Logger) -> Optional[Any]:
+    """Parse HTML string into an lxml tree.
+
+    Returns:
+        Root element, or None if the markup is empty or unparseable
+    """
+    if not page_html or not page_html.strip():
+        logger.warning("Empty HTML document")
+        return None
+
+    try:
+        return lxml.html.fromstring(page_html)
+    except Exception as e:
+        logger.warning(f"Failed to parse HTML document: {e}")
+        return None
+
+
+def extract_task_rows_html(
+    page_html: str, logger: logging.Logger, base_url: str = TASK_LIST_URL
+) -> Optional[List[Dict[str, Any]]]:
+    """Extract raw data of all task rows from task list HTML.
+
+    Offline counterpart of extract_task_rows_script: works on a captured
+    driver.page_source or a saved snapshot and returns the same row dicts,
+    ready for parse_task_row_data.
+
+    Args:
+        page_html: Task list page markup
+        logger: Logger instance
+        base_url: URL the page was loaded from, used to resolve customer links
+
+    Returns:
+        List of raw row dicts, or None if the HTML could not be parsed
+    """
+    root = parse_html_document(page_html, logger)
+    if root is None:
+        return None
+
+    def first(element: Any, selector: str) -> Optional[Any]:
+        found = element.cssselect(selector) if element is not None else []
+        return found[0] if found else None
+
+    def text(element: Any) -> Optional[str]:
+        return html_element_text(element) if element is not None else None
+
+    rows = []
+    for row in root.cssselect(SELECTOR_TASK_ROWS):
+        cells = list(row.iter("td"))
+        first_cell = cells[0] if len(cells) > 0 else None
+        second_cell = cells[1] if len(cells) > 1 else None
+        customer_link = first(second_cell, "a")
+        customer_href = (
+            customer_link.get("href") if customer_link is not None else None
+        )
+        rows.append({
+            "id": row.get("id") or "",
+            "cells": [html_element_text(cell) for cell in cells],
+            "domain": text(first(first_cell, "a")),
+            "campaign": text(first(first_cell, ".site-link__campaign")),
+            "customer": text(customer_link),
+            "customer_url": (
+                urljoin(base_url, customer_href) if customer_href else None
+            ),
+        })
+
+    return rows
+
+
+def parse_task_list_html(
+    page_html: str, logger: logging.Logger, base_url: str = TASK_LIST_URL
+) -> List[Dict[str, Any]]:
+    """Parse tasks (without details) from task list HTML.
+
+    Args:
+        page_html: Task list page markup
+        logger: Logger instance
+        base_url: URL the page was loaded from
+
+    Returns:
+        List of task dictionaries
+    """
+    tasks = []
+    for data in extract_task_rows_html(page_html, logger, base_url) or []:
+        task = parse_task_row_data(data, logger)
+        if task:
+            tasks.append(task)
+    return tasks
+
+
+def parse_task_details(
+    driver: webdriver.Chrome,
+    task_id: int,
+    logger: logging.Logger,
+    throttle: Optional[Callable[[], None]] = None,
+) -> Dict[str, Any]:
+    """Parse task details from AJAX modal.
+
+    Opens the detail modal for a task via JavaScript, extracts additional
+    fields from the modal's .tv_params_block structure:
+    - description: "Текст задания" + "Комментарий оптимизатора"
+    - url: from #copy_url input or .param.link_to a
+    - requirements: "Требования к странице" block params
+    - contacts: not present in current modal format
+    - deadline: not present in current modal format
+
+    Args:
+        driver: Chrome WebDriver
+        task_id: Task ID to fetch details for
+        logger: Logger instance
+        throttle: Optional limiter called before the request (see
+            make_rate_limiter); spaces consecutive modals without sleeping
+            after each one
+
+    Returns:
+        Dictionary with detail fields (may be partially empty)
+    """
+    details: Dict[str, Any] = {
+        "description": None,
+        "url": None,
+        "requirements": None,
+        "contacts": None,
+        "deadline": None,
+    }
+
+    if throttle is not None:
+        throttle()
+
+    try:
+        detail_url = TASK_DETAIL_URL.format(task_id)
+        logger.debug(f"Opening detail modal for task {task_id}: {detail_url}")
+
+        # Remove any leftover modals from previous iterations
+        driver.execute_script(
+            "$('.jquery-modal').remove(); $('.modal').remove();"
+        )
+
+        driver.execute_script(
+            f"$.get('{detail_url}', function(data) {{"
+            f"  $('<div>').html(data).appendTo('body').modal();"
+            f"}});"
+        )
+
+        wait_for(
+            driver,
+            EC.presence_of_element_located((By.CSS_SELECTOR, SELECTOR_MODAL)),
+            description="detail modal",
+        )
+        modal = wait_for(
+            driver,
+            EC.presence_of_element_located((By.CSS_SELECTOR, SELECTOR_MODAL_CONTENT)),
+            description="detail modal",
+        )
+
+        # Extract URL from hidden #copy_url input
+        copy_url_input = probe_element(modal, By.CSS_SELECTOR, "#copy_url")
+        if copy_url_input is not None:
+            url_value = copy_url_input.get_attribute("value")
+            if url_value:
+                details["url"] = url_value.strip()
+        else:
+            # Fallback: extract from .param.link_to a
+            link_elem = probe_element(
+                modal, By.CSS_SELECTOR, ".param.link_to .block_value a"
+            )
+            if link_elem is not None:
+                href = link_elem.get_attribute("href") or ""
+                parsed = urlparse(href)
+                if parsed.netloc and "gogetlinks.net" not in parsed.netloc:
+                    details["url"] = href
+
+        # Extract structured data from .tv_params_block sections
+        blocks = modal.find_elements(By.CSS_SELECTOR, ".tv_params_block")
+        description_parts = []
+
+        for block in blocks:
+            title_elem = probe_element(block, By.CSS_SELECTOR, ".block_title")
+            if title_elem is None:
+                continue
+            block_title = sanitize_text(title_elem.text).lower()
+
+            if "требовани" in block_title:
+                # Requirements block: collect all param name-value pairs
+                params = block.find_elements(By.CSS_SELECTOR, ".param")
                 req_parts = []
                 for param in params:
-                    try:
-                        name = sanitize_text(
-                            param.find_element(
-                                By.CSS_SELECTOR, ".block_name"
-                            ).text
-                        )
-                        value = sanitize_text(
-                            param.find_element(
-                                By.CSS_SELECTOR, ".block_value"
-                            ).text
-                        )
-                        if name and value:
-                            req_parts.append(f"{name}: {value}")
-                    except NoSuchElementException:
+                    name_elem = probe_element(param, By.CSS_SELECTOR, ".block_name")
+                    value_elem = probe_element(param, By.CSS_SELECTOR, ".block_value")
+                    if name_elem is None or value_elem is None:
                         continue
+                    name = sanitize_text(name_elem.text)
+                    value = sanitize_text(value_elem.text)
+                    if name and value:
+                        req_parts.append(f"{name}: {value}")
                 if len(req_parts) > 0:
                     details["requirements"] = "; ".join(req_parts)
 
             elif "текст задани" in block_title:
                 # Task description text
-                try:
-                    value_elem = block.find_element(
-                        By.CSS_SELECTOR, ".params .block_value"
-                    )
+                value_elem = probe_element(
+                    block, By.CSS_SELECTOR, ".params .block_value"
+                )
+                if value_elem is not None:
                     text = sanitize_text(value_elem.text)
                     if len(text) > 0:
                         description_parts.append(text)
-                except NoSuchElementException:
-                    pass
 
             elif "комментарий" in block_title:
                 # Optimizer's comment — append to description
-                try:
-                    value_elem = block.find_element(
-                        By.CSS_SELECTOR, ".params .block_value"
-                    )
+                value_elem = probe_element(
+                    block, By.CSS_SELECTOR, ".params .block_value"
+                )
+                if value_elem is not None:
                     text = sanitize_text(value_elem.text)
                     if len(text) > 0:
                         description_parts.append(f"[Комментарий] {text}")
-                except NoSuchElementException:
-                    pass
 
             elif "ссылк" in block_title:
                 # Link block: extract anchor text
-                try:
-                    anchor_elem = block.find_element(
-                        By.CSS_SELECTOR, ".param.unchor .block_value"
-                    )
+                anchor_elem = probe_element(
+                    block, By.CSS_SELECTOR, ".param.unchor .block_value"
+                )
+                if anchor_elem is not None:
                     anchor_text = sanitize_text(anchor_elem.text)
-                    if anchor_text and len(anchor_text) > 0:
+                    if anchor_text:
                         description_parts.append(f"[Анкор] {anchor_text}")
-                except NoSuchElementException:
-                    pass
 
         if len(description_parts) > 0:
             details["description"] = "\n".join(description_parts)
@@ -1420,16 +2838,314 @@ def parse_task_details(
         except Exception:
             pass
 
-        # Rate limiting
-        time.sleep(DETAIL_REQUEST_DELAY)
+    return details
+
+
+def parse_task_details_html(
+    modal_html: str, task_id: int, logger: logging.Logger
+) -> Dict[str, Any]:
+    """Parse task details from detail modal HTML (view_task.php response).
+
+    Offline counterpart of parse_task_details: same fields, same rules,
+    but no browser involved.
+
+    Args:
+        modal_html: Markup returned by TASK_DETAIL_URL (or the modal's HTML)
+        task_id: Task ID, for logging
+        logger: Logger instance
+
+    Returns:
+        Dictionary with detail fields (may be partially empty)
+    """
+    details: Dict[str, Any] = {
+        "description": None,
+        "url": None,
+        "requirements": None,
+        "contacts": None,
+        "deadline": None,
+    }
+
+    root = parse_html_document(modal_html, logger)
+    if root is None:
+        logger.warning(f"No detail markup for task {task_id}")
+        return details
+
+    def first(element: Any, selector: str) -> Optional[Any]:
+        found = element.cssselect(selector)
+        return found[0] if found else None
+
+    try:
+        modal = first(root, SELECTOR_MODAL_CONTENT)
+        if modal is None:
+            modal = root
+
+        # Extract URL from hidden #copy_url input, fallback to .param.link_to a
+        copy_url_input = first(modal, "#copy_url")
+        if copy_url_input is not None:
+            url_value = copy_url_input.get("value")
+            if url_value:
+                details["url"] = url_value.strip()
+        else:
+            link_elem = first(modal, ".param.link_to .block_value a")
+            if link_elem is not None:
+                href = link_elem.get("href") or ""
+                parsed = urlparse(href)
+                if parsed.netloc and "gogetlinks.net" not in parsed.netloc:
+                    details["url"] = href
+
+        description_parts = []
+        for block in modal.cssselect(".tv_params_block"):
+            title_elem = first(block, ".block_title")
+            if title_elem is None:
+                continue
+            block_title = sanitize_text(html_element_text(title_elem)).lower()
+
+            if "требовани" in block_title:
+                req_parts = []
+                for param in block.cssselect(".param"):
+                    name_elem = first(param, ".block_name")
+                    value_elem = first(param, ".block_value")
+                    if name_elem is None or value_elem is None:
+                        continue
+                    name = sanitize_text(html_element_text(name_elem))
+                    value = sanitize_text(html_element_text(value_elem))
+                    if name and value:
+                        req_parts.append(f"{name}: {value}")
+                if len(req_parts) > 0:
+                    details["requirements"] = "; ".join(req_parts)
+
+            elif "текст задани" in block_title or "комментарий" in block_title:
+                value_elem = first(block, ".params .block_value")
+                if value_elem is not None:
+                    text = sanitize_text(html_element_text(value_elem))
+                    if len(text) > 0:
+                        if "текст задани" not in block_title:
+                            text = f"[Комментарий] {text}"
+                        description_parts.append(text)
+
+            elif "ссылк" in block_title:
+                anchor_elem = first(block, ".param.unchor .block_value")
+                if anchor_elem is not None:
+                    anchor_text = sanitize_text(html_element_text(anchor_elem))
+                    if anchor_text:
+                        description_parts.append(f"[Анкор] {anchor_text}")
+
+        if len(description_parts) > 0:
+            details["description"] = "\n".join(description_parts)
+
+        logger.debug(
+            f"Task {task_id} details (html): "
+            f"desc={'yes' if details['description'] else 'no'}, "
+            f"url={'yes' if details['url'] else 'no'}, "
+            f"req={'yes' if details['requirements'] else 'no'}"
+        )
+
+    except Exception as e:
+        logger.warning(f"Failed to parse details HTML for task {task_id}: {e}")
 
     return details
 
 
+def fetch_task_detail_html(session: requests.Session, url: str) -> Optional[str]:
+    """GET detail modal markup the way the page's $.get() does.
+
+    Redirects are not followed: an expired session is redirected to the
+    login page, which must not be mistaken for task details.
+
+    Returns:
+        Response HTML, or None on network error or non-200 status
+    """
+    try:
+        response = session.get(
+            url,
+            headers={
+                "X-Requested-With": "XMLHttpRequest",
+                "Referer": TASK_LIST_URL,
+            },
+            timeout=DETAIL_FETCH_TIMEOUT,
+            allow_redirects=False,
+        )
+    except requests.RequestException:
+        return None
+
+    if response.status_code != 200:
+        return None
+
+    if "charset" not in response.headers.get("Content-Type", "").lower():
+        response.encoding = response.apparent_encoding
+    return response.text
+
+
+def fetch_task_details_http(
+    session: requests.Session,
+    task_ids: List[int],
+    logger: logging.Logger,
+    max_workers: int = DETAIL_FETCH_CONCURRENCY,
+    rate_limit: float = DETAIL_FETCH_RATE_LIMIT,
+) -> Dict[int, Dict[str, Any]]:
+    """Fetch and parse detail modals of several tasks over plain HTTP.
+
+    Requests go through the cookie-authenticated session with bounded
+    concurrency and a shared rate limit; markup is parsed offline with
+    parse_task_details_html.
+
+    Args:
+        session: Session with cookies from Selenium (get_selenium_cookies_session)
+        task_ids: Task IDs to fetch details for
+        logger: Logger instance
+        max_workers: Maximum requests in flight
+        rate_limit: Maximum requests per second (0 = unlimited)
+
+    Returns:
+        Dict task_id -> details for tasks fetched successfully; missing IDs
+        should be retried through the browser
+    """
+    rows = [
+        {"url": TASK_DETAIL_URL.format(task_id), "task_id": task_id}
+        for task_id in task_ids
+    ]
+    fetch = functools.partial(fetch_task_detail_html, session)
+    results: Dict[int, Dict[str, Any]] = {}
+    start = time.time()
+
+    for row, page, elapsed in run_link_requests(
+        rows, fetch, max_workers, max_workers, rate_limit
+    ):
+        task_id = row["task_id"]
+        if page is None or (
+            "tv_params_block" not in page and "copy_url" not in page
+        ):
+            logger.warning(f"No detail markup over HTTP for task {task_id}")
+            continue
+        logger.debug(f"Fetched details for task {task_id} in {elapsed:.2f}s")
+        results[task_id] = parse_task_details_html(page, task_id, logger)
+
+    logger.info(
+        f"Fetched details over HTTP: {len(results)}/{len(rows)} tasks "
+        f"in {time.time() - start:.1f}s"
+    )
+    return results
+
+
+def select_tasks_without_details(
+    tasks: List[Dict[str, Any]],
+    conn: Optional[MySQLConnection],
+    detail_cache: Optional[set],
+    logger: logging.Logger,
+    chunk_size: int = DB_IN_CHUNK_SIZE,
+) -> List[Dict[str, Any]]:
+    """Return tasks whose details are not stored in the database yet."""
+    detailed_ids: set = set()
+    if conn is not None:
+        detailed_ids = get_task_ids_with_details(
+            conn, [t["task_id"] for t in tasks], detail_cache, logger,
+            chunk_size=chunk_size,
+        )
+    tasks_to_fetch = [t for t in tasks if t["task_id"] not in detailed_ids]
+    skipped = len(tasks) - len(tasks_to_fetch)
+    if skipped > 0:
+        logger.info(f"Skipping detail fetch for {skipped} already-parsed tasks")
+    return tasks_to_fetch
+
+
+def parse_task_list_http(
+    session: requests.Session,
+    logger: logging.Logger,
+    conn: Optional[MySQLConnection] = None,
+    detail_cache: Optional[set] = None,
+    detail_concurrency: int = DETAIL_FETCH_CONCURRENCY,
+    detail_rps: float = DETAIL_FETCH_RATE_LIMIT,
+    chunk_size: int = DB_IN_CHUNK_SIZE,
+) -> Optional[List[Dict[str, Any]]]:
+    """Parse task list and details over plain HTTP, without a browser.
+
+    Used when the cached cookie session is valid (see load_cookies_session).
+    If any task details cannot be fetched, None is returned so the browser
+    path parses the list again and opens the detail modal for them.
+
+    Args:
+        session: Authenticated cookie session
+        logger: Logger instance
+        conn: Optional MySQL connection (skip tasks that already have details)
+        detail_cache: Optional in-process set of task IDs known to have details
+        detail_concurrency: Parallel detail requests
+        detail_rps: Detail requests per second (0 = unlimited)
+        chunk_size: Maximum task IDs per IN list in the details lookup
+
+    Returns:
+        List of task dictionaries, or None if the task list page could not be
+        loaded or parsed, has no task rows, or some details failed (caller
+        should retry through the browser)
+    """
+    logger.info("Parsing task list over HTTP")
+
+    try:
+        response = session.get(
+            TASK_LIST_URL, timeout=DETAIL_FETCH_TIMEOUT, allow_redirects=False
+        )
+    except requests.RequestException as e:
+        logger.warning(f"Failed to load task list over HTTP: {e}")
+        return None
+
+    if response.status_code != 200:
+        logger.warning(f"Task list request returned HTTP {response.status_code}")
+        return None
+
+    if "charset" not in response.headers.get("Content-Type", "").lower():
+        response.encoding = response.apparent_encoding
+    page_html = response.text
+    if not is_authenticated_html(page_html, logger):
+        logger.warning("Task list page is not authenticated")
+        return None
+
+    try:
+        tasks = parse_task_list_html(page_html, logger)
+    except Exception as e:
+        logger.warning(
+            f"Failed to parse task list over HTTP: {type(e).__name__}: {e}"
+        )
+        return None
+    if len(tasks) == 0:
+        logger.warning("No task rows found over HTTP")
+        return None
+    logger.info(f"Successfully parsed {len(tasks)} tasks from list")
+
+    tasks_to_fetch = select_tasks_without_details(
+        tasks, conn, detail_cache, logger, chunk_size
+    )
+    if len(tasks_to_fetch) > 0:
+        logger.info(f"Parsing details for {len(tasks_to_fetch)} tasks")
+        fetched = fetch_task_details_http(
+            session,
+            [t["task_id"] for t in tasks_to_fetch],
+            logger,
+            max_workers=detail_concurrency,
+            rate_limit=detail_rps,
+        )
+        missing = len(tasks_to_fetch) - len(fetched)
+        if missing > 0:
+            # The browser path falls back to the detail modal for these
+            logger.warning(f"Details of {missing} tasks not fetched over HTTP")
+            return None
+        for task in tasks_to_fetch:
+            task.update(fetched[task["task_id"]])
+
+    logger.info("Detail parsing completed")
+
+    return tasks
+
+
 def parse_task_list(
     driver: webdriver.Chrome,
     logger: logging.Logger,
     conn: Optional[MySQLConnection] = None,
+    detail_cache: Optional[set] = None,
+    extraction: str = TASK_EXTRACTION_MODE,
+    detail_session: Optional[requests.Session] = None,
+    detail_concurrency: int = DETAIL_FETCH_CONCURRENCY,
+    detail_rps: float = DETAIL_FETCH_RATE_LIMIT,
+    fast_probes: bool = FAST_PROBES,
+    chunk_size: int = DB_IN_CHUNK_SIZE,
 ) -> List[Dict[str, Any]]:
     """Parse all tasks from task list page.
 
@@ -1437,64 +3153,113 @@ def parse_task_list(
         driver: Chrome WebDriver
         logger: Logger instance
         conn: Optional MySQL connection. When provided, detail modals are
-            skipped for tasks that already have a description in the database.
+            skipped for tasks that already have a description in the database
+            (looked up with a single query).
+        detail_cache: Optional in-process set of task IDs known to have
+            details, see get_task_ids_with_details
+        extraction: "script" to read all rows in one execute_script call,
+            "html" to parse driver.page_source offline,
+            "webdriver" to parse WebElements row by row
+        detail_session: Optional cookie session. When provided, details are
+            fetched over HTTP in parallel (fetch_task_details_http); tasks it
+            could not fetch fall back to the browser modal.
+        detail_concurrency: Parallel detail requests (HTTP only)
+        detail_rps: Detail requests per second (HTTP only, 0 = unlimited)
+        fast_probes: Parse with implicit wait disabled (see probe_element)
+        chunk_size: Maximum task IDs per IN list in the details lookup
 
     Returns:
         List of task dictionaries
     """
     logger.info("Parsing task list")
 
-    try:
-        # Navigate to task list page
-        logger.debug(f"Navigating to {TASK_LIST_URL}")
-        driver.get(TASK_LIST_URL)
-
-        # Wait for task rows to load
-        logger.debug("Waiting for task rows")
-        wait = WebDriverWait(driver, PAGE_LOAD_TIMEOUT)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, SELECTOR_TASK_ROWS)))
-
-        # Find all task rows
-        rows = driver.find_elements(By.CSS_SELECTOR, SELECTOR_TASK_ROWS)
-        logger.info(f"Found {len(rows)} task rows")
-
-        # Parse each row
-        tasks = []
-        for row in rows:
-            task = parse_task_row(row, logger)
-            if task:
-                tasks.append(task)
-
-        logger.info(f"Successfully parsed {len(tasks)} tasks from list")
-
-        # Parse details for each task (skip tasks already in DB with details)
-        if len(tasks) > 0:
-            tasks_to_fetch = [
-                t for t in tasks
-                if conn is None or not task_has_details(conn, t["task_id"])
-            ]
-            skipped = len(tasks) - len(tasks_to_fetch)
-            if skipped > 0:
+    with implicit_wait_disabled(driver, fast_probes):
+        try:
+            # Navigate to task list page
+            logger.debug(f"Navigating to {TASK_LIST_URL}")
+            driver.get(TASK_LIST_URL)
+
+            # Wait for task rows to load
+            logger.debug("Waiting for task rows")
+            wait_for(
+                driver,
+                EC.presence_of_element_located((By.CSS_SELECTOR, SELECTOR_TASK_ROWS)),
+                description="task rows",
+            )
+            log_page_transfer(driver, logger, "Task list page")
+
+            tasks = []
+            row_data = None
+            if extraction == "script":
+                row_data = extract_task_rows_script(driver, logger)
+            elif extraction == "html":
+                row_data = extract_task_rows_html(driver.page_source, logger)
+
+            if row_data is not None:
                 logger.info(
-                    f"Skipping detail fetch for {skipped} already-parsed tasks"
+                    f"Found {len(row_data)} task rows ({extraction} extraction)"
+                )
+                for data in row_data:
+                    task = parse_task_row_data(data, logger)
+                    if task:
+                        tasks.append(task)
+            else:
+                # Find all task rows
+                rows = driver.find_elements(By.CSS_SELECTOR, SELECTOR_TASK_ROWS)
+                logger.info(f"Found {len(rows)} task rows")
+
+                # Parse each row
+                for row in rows:
+                    task = parse_task_row(row, logger)
+                    if task:
+                        tasks.append(task)
+
+            logger.info(f"Successfully parsed {len(tasks)} tasks from list")
+
+            # Parse details for each task (skip tasks already in DB with details)
+            if len(tasks) > 0:
+                tasks_to_fetch = select_tasks_without_details(
+                    tasks, conn, detail_cache, logger, chunk_size
                 )
-            if len(tasks_to_fetch) > 0:
-                logger.info(f"Parsing details for {len(tasks_to_fetch)} tasks")
-                for task in tasks_to_fetch:
-                    details = parse_task_details(driver, task["task_id"], logger)
-                    task.update(details)
+                if len(tasks_to_fetch) > 0:
+                    logger.info(f"Parsing details for {len(tasks_to_fetch)} tasks")
+                    if detail_session is not None:
+                        fetched = fetch_task_details_http(
+                            detail_session,
+                            [t["task_id"] for t in tasks_to_fetch],
+                            logger,
+                            max_workers=detail_concurrency,
+                            rate_limit=detail_rps,
+                        )
+                        for task in tasks_to_fetch:
+                            if task["task_id"] in fetched:
+                                task.update(fetched[task["task_id"]])
+                        tasks_to_fetch = [
+                            t for t in tasks_to_fetch if t["task_id"] not in fetched
+                        ]
+                        if len(tasks_to_fetch) > 0:
+                            logger.info(
+                                f"Falling back to detail modal for "
+                                f"{len(tasks_to_fetch)} tasks"
+                            )
+                    throttle = make_rate_limiter(1.0 / DETAIL_REQUEST_DELAY)
+                    for task in tasks_to_fetch:
+                        details = parse_task_details(
+                            driver, task["task_id"], logger, throttle=throttle
+                        )
+                        task.update(details)
 
-            logger.info("Detail parsing completed")
+                logger.info("Detail parsing completed")
 
-        return tasks
+            return tasks
 
-    except TimeoutException:
-        logger.error("Timeout waiting for task rows to load")
-        return []
+        except TimeoutException:
+            logger.error("Timeout waiting for task rows to load")
+            return []
 
-    except Exception as e:
-        logger.error(f"Failed to parse task list: {e}")
-        return []
+        except Exception as e:
+            logger.error(f"Failed to parse task list: {e}")
+            return []
 
 
 def extract_digits_only(text: str) -> Optional[int]:
@@ -1519,13 +3284,25 @@ def extract_digits_only(text: str) -> Optional[int]:
 
 
 def set_my_sites_count_in_page(driver: webdriver.Chrome, logger: logging.Logger) -> None:
-    """Try to set mySites page size to maximum value."""
+    """Try to set mySites page size to maximum value.
+
+    The page-size selector is waited for explicitly (up to IMPLICIT_WAIT),
+    so it is found even when parse_my_sites runs with implicit wait off.
+    """
     select_candidates = [
         "select[name='count_in_page']",
         "select#count_in_page",
         "select.js-count-in-page",
     ]
 
+    wait_for(
+        driver,
+        EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(select_candidates))),
+        timeout=IMPLICIT_WAIT,
+        description="mySites page size selector",
+        required=False,
+    )
+
     for selector in select_candidates:
         try:
             select_elements = driver.find_elements(By.CSS_SELECTOR, selector)
@@ -1550,7 +3327,7 @@ def set_my_sites_count_in_page(driver: webdriver.Chrome, logger: logging.Logger)
                 select.select_by_visible_text(str(max_value))
 
             logger.info(f"mySites page size changed via selector to {max_value}")
-            time.sleep(1.5)
+            wait_for_page_ready(driver)
             return
 
         except Exception as e:
@@ -1582,7 +3359,6 @@ def set_my_sites_count_in_page(driver: webdriver.Chrome, logger: logging.Logger)
 
         if isinstance(result, dict) and result.get("ok"):
             logger.info("mySites page size changed via POST to 2000")
-            time.sleep(1.0)
             return
 
         logger.warning(f"mySites page size POST returned unexpected result: {result}")
@@ -1600,10 +3376,10 @@ def parse_site_row(
         return None
 
     site = ""
-    try:
-        site_link = row.find_element(By.CSS_SELECTOR, ".site-link__info")
+    site_link = probe_element(row, By.CSS_SELECTOR, ".site-link__info")
+    if site_link is not None:
         site = sanitize_text(site_link.text)
-    except NoSuchElementException:
+    else:
         try:
             site = sanitize_text(cells[0].text)
         except Exception:
@@ -1632,12 +3408,93 @@ def parse_site_row(
     }
 
 
+def parse_site_row_data(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build site metrics from raw row data (see JS_EXTRACT_MY_SITES_ROWS).
+
+    Pure-Python counterpart of parse_site_row.
+
+    Args:
+        data: Dict with keys cells (texts of all <td>) and site (text of
+            .site-link__info, None when absent)
+
+    Returns:
+        Site dictionary or None if the row is not a site row
+    """
+    cells = data.get("cells") or []
+    if len(cells) < MY_SITES_MIN_CELLS:
+        return None
+
+    if data.get("site") is not None:
+        site = sanitize_text(data["site"])
+    else:
+        site = sanitize_text(cells[0] or "")
+
+    if not site:
+        return None
+
+    def cell_digits(index: int) -> Optional[int]:
+        return extract_digits_only(sanitize_text(cells[index] or ""))
+
+    return {
+        "site": site.lower(),
+        "status": sanitize_text(cells[1] or ""),
+        "sqi": cell_digits(2),
+        "cf_tf": cell_digits(3),
+        "traffic": cell_digits(5),
+        "trust": cell_digits(9),
+        "description": None,
+    }
+
+
+def extract_my_sites_rows_script(
+    driver: webdriver.Chrome, logger: logging.Logger
+) -> Optional[List[Dict[str, Any]]]:
+    """Extract raw data of all mySites rows with one execute_script call.
+
+    Returns:
+        List of raw row dicts, or None if the script failed (caller falls
+        back to per-element parsing)
+    """
+    try:
+        rows = driver.execute_script(
+            JS_EXTRACT_MY_SITES_ROWS, MY_SITES_ROW_SELECTOR, MY_SITES_MIN_CELLS
+        )
+    except WebDriverException as e:
+        logger.warning(f"mySites rows script extraction failed: {e}")
+        return None
+
+    if not isinstance(rows, list):
+        logger.warning("mySites rows script returned unexpected result")
+        return None
+
+    return rows
+
+
+def read_my_sites_page(
+    driver: webdriver.Chrome, logger: logging.Logger
+) -> List[Dict[str, Any]]:
+    """Parse site rows currently shown on mySites page.
+
+    Uses one execute_script call for the whole table and falls back to
+    WebElement parsing if the script fails.
+
+    Returns:
+        List of site dictionaries
+    """
+    row_data = extract_my_sites_rows_script(driver, logger)
+    if row_data is not None:
+        parsed = [parse_site_row_data(data) for data in row_data]
+    else:
+        parsed = [parse_site_row(row) for row in get_my_sites_rows(driver)]
+    return [site for site in parsed if site]
+
+
 def get_my_sites_rows(driver: webdriver.Chrome) -> List[WebElement]:
     """Return rows from mySites table that look like data rows."""
     return [
         row
-        for row in driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-        if len(row.find_elements(By.TAG_NAME, "td")) >= 10
+        for row in driver.find_elements(By.CSS_SELECTOR, MY_SITES_ROW_SELECTOR)
+        if len(row.find_elements(By.TAG_NAME, "td")) >= MY_SITES_MIN_CELLS
     ]
 
 
@@ -1654,10 +3511,26 @@ def get_page_marker(rows: List[WebElement]) -> str:
         return str(len(rows))
 
 
+def get_my_sites_marker(driver: webdriver.Chrome) -> str:
+    """Return page marker of mySites table in one script call.
+
+    Falls back to get_page_marker over WebElements if the script fails.
+
+    Returns:
+        Marker string, empty when there are no data rows
+    """
+    try:
+        marker = driver.execute_script(
+            JS_MY_SITES_MARKER, MY_SITES_ROW_SELECTOR, MY_SITES_MIN_CELLS
+        )
+    except WebDriverException:
+        return get_page_marker(get_my_sites_rows(driver))
+    return sanitize_text(marker) if isinstance(marker, str) else ""
+
+
 def go_to_next_my_sites_page(driver: webdriver.Chrome, logger: logging.Logger) -> bool:
     """Click next page button on mySites if available."""
-    current_rows = get_my_sites_rows(driver)
-    current_marker = get_page_marker(current_rows)
+    current_marker = get_my_sites_marker(driver)
     next_button: Optional[WebElement] = None
     next_page = None
 
@@ -1733,26 +3606,35 @@ def go_to_next_my_sites_page(driver: webdriver.Chrome, logger: logging.Logger) -
             driver.execute_script("arguments[0].click();", next_button)
 
         current_page_text = str(current_page) if current_page is not None else None
-        deadline = time.time() + (PAGE_LOAD_TIMEOUT * 3)
 
-        while time.time() < deadline:
+        def page_changed(d: webdriver.Chrome) -> bool:
             try:
-                new_marker = get_page_marker(get_my_sites_rows(driver))
-                new_page_text = driver.execute_script(
+                new_marker = get_my_sites_marker(d)
+                new_page_text = d.execute_script(
                     "const el = document.querySelector('.pagination .pagination__item_current');"
                     "return el ? (el.textContent || '').trim() : '';"
                 ) or ""
-
-                if new_marker and new_marker != current_marker:
-                    return True
-                if current_page_text and new_page_text and new_page_text != current_page_text:
-                    return True
-                if next_page is not None and new_page_text == str(next_page):
-                    return True
             except Exception:
-                pass
+                return False
 
-            time.sleep(0.25)
+            if new_marker and new_marker != current_marker:
+                return True
+            if (
+                current_page_text
+                and new_page_text
+                and new_page_text != current_page_text
+            ):
+                return True
+            return next_page is not None and new_page_text == str(next_page)
+
+        if wait_for(
+            driver,
+            page_changed,
+            PAGE_LOAD_TIMEOUT * 3,
+            description="mySites page",
+            required=False,
+        ):
+            return True
 
         logger.debug("mySites next page action did not change marker/current page")
         return False
@@ -1761,94 +3643,430 @@ def go_to_next_my_sites_page(driver: webdriver.Chrome, logger: logging.Logger) -
         return False
 
 
-def parse_my_sites(
-    driver: webdriver.Chrome,
-    logger: logging.Logger,
+def get_my_sites_page_count(driver: webdriver.Chrome) -> int:
+    """Return highest page number offered by mySites pagination (0 if unknown)."""
+    try:
+        count = driver.execute_script(JS_MY_SITES_PAGE_COUNT)
+    except WebDriverException:
+        return 0
+    return count if isinstance(count, int) else 0
+
+
+def capture_my_sites_request(
+    driver: webdriver.Chrome, page: int, logger: logging.Logger
+) -> Optional[Dict[str, str]]:
+    """Discover the AJAX request behind mySites.load(page).
+
+    Calls mySites.load(page) in the browser and records the request jQuery
+    sends (see JS_CAPTURE_MY_SITES_REQUEST).
+
+    Returns:
+        Dict with absolute url, method and form-encoded data, or None
+    """
+    try:
+        captured = driver.execute_async_script(
+            JS_CAPTURE_MY_SITES_REQUEST, page, int(PAGE_LOAD_TIMEOUT * 1000)
+        )
+    except WebDriverException as e:
+        logger.debug(f"mySites request capture failed: {e}")
+        return None
+
+    if not isinstance(captured, dict) or not captured.get("url"):
+        logger.debug("mySites.load() did not send a jQuery request")
+        return None
+
+    request = {
+        "url": urljoin(MY_SITES_URL, captured["url"]),
+        "method": str(captured.get("method") or "GET").upper(),
+        "data": captured.get("data") or "",
+    }
+    logger.debug(f"mySites page request: {request['method']} {request['url']}")
+    return request
+
+
+def build_my_sites_page_request(
+    request: Dict[str, str], captured_page: int, page: int
+) -> Optional[Dict[str, str]]:
+    """Derive request for another page from a captured one.
+
+    The page number is looked up in form data, then in the query string,
+    then in the URL path. Only parameters named like a page number
+    (MY_SITES_PAGE_PARAM_RE) and path segments following or containing
+    "page" are replaced, so a count or id that happens to equal the page
+    number is never mistaken for it.
+
+    Returns:
+        Request dict for page, or None if the page parameter is not found
+        (caller falls back to clicking through pagination)
+    """
+    old, new = str(captured_page), str(page)
+
+    def replace_param(pairs: List[Tuple[str, str]]) -> Optional[List[Tuple[str, str]]]:
+        targets = [
+            i for i, (key, value) in enumerate(pairs)
+            if value == old and MY_SITES_PAGE_PARAM_RE.match(key)
+        ]
+        if not targets:
+            return None
+        return [
+            (key, new if i in targets else value)
+            for i, (key, value) in enumerate(pairs)
+        ]
+
+    data_pairs = replace_param(parse_qsl(request["data"], keep_blank_values=True))
+    if data_pairs is not None:
+        return {**request, "data": urlencode(data_pairs)}
+
+    parsed = urlparse(request["url"])
+    query_pairs = replace_param(parse_qsl(parsed.query, keep_blank_values=True))
+    if query_pairs is not None:
+        query = urlencode(query_pairs)
+        return {**request, "url": parsed._replace(query=query).geturl()}
+
+    path, count = re.subn(
+        rf"(/[^/]*page[^/]*/|/page[-_]?){old}(?=/|$)",
+        rf"\g<1>{new}",
+        parsed.path,
+        flags=re.IGNORECASE,
+    )
+    if count == 1:
+        return {**request, "url": parsed._replace(path=path).geturl()}
+
+    return None
+
+
+def extract_my_sites_rows_html(
+    markup: str, logger: logging.Logger
 ) -> List[Dict[str, Any]]:
-    """Parse /mySites table and return normalized site metrics."""
-    logger.info("Parsing mySites page")
+    """Extract raw mySites rows from HTML or a JSON-wrapped HTML response.
 
+    Offline counterpart of extract_my_sites_rows_script, returning the same
+    row dicts for parse_site_row_data.
+    """
     try:
-        driver.get(MY_SITES_URL)
-        WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        payload = json.loads(markup)
+    except ValueError:
+        payload = None
+
+    if payload is not None:
+        # JSON response: join every string field that carries table rows
+        fragments: List[str] = []
+        stack = [payload]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                stack.extend(item.values())
+            elif isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, str) and "<tr" in item.lower():
+                fragments.append(item)
+        markup = "".join(reversed(fragments))
+
+    if "<table" not in markup.lower():
+        # Bare <tr> fragments are dropped by the parser outside a table
+        markup = f"<table><tbody>{markup}</tbody></table>"
+
+    root = parse_html_document(markup, logger)
+    if root is None:
+        return []
+
+    rows = []
+    for row in root.iter("tr"):
+        cells = list(row.iter("td"))
+        if len(cells) < MY_SITES_MIN_CELLS:
+            continue
+        site_info = row.cssselect(".site-link__info")
+        rows.append({
+            "cells": [html_element_text(cell) for cell in cells],
+            "site": html_element_text(site_info[0]) if site_info else None,
+        })
+    return rows
+
+
+def fetch_my_sites_page_http(
+    session: requests.Session, request: Dict[str, str]
+) -> Optional[str]:
+    """Send one mySites page request; None on network error or non-200."""
+    try:
+        response = session.request(
+            request["method"],
+            request["url"],
+            data=request["data"] if request["method"] != "GET" else None,
+            headers={
+                "X-Requested-With": "XMLHttpRequest",
+                "Referer": MY_SITES_URL,
+            },
+            timeout=MY_SITES_FETCH_TIMEOUT,
+            allow_redirects=False,
         )
+    except requests.RequestException:
+        return None
+
+    if response.status_code != 200:
+        return None
+    return response.text
+
+
+def fetch_my_sites_pages_http(
+    driver: webdriver.Chrome,
+    session: requests.Session,
+    logger: logging.Logger,
+    page_count: int,
+    known_sites: Iterable[str] = (),
+    max_workers: int = MY_SITES_FETCH_CONCURRENCY,
+    rate_limit: float = MY_SITES_FETCH_RATE_LIMIT,
+) -> Optional[List[Dict[str, Any]]]:
+    """Fetch mySites pages 2..N directly over HTTP.
+
+    The request behind mySites.load() is captured once in the browser, then
+    replayed for every page through the cookie session in parallel and
+    parsed offline. Pagination may only show a window of page links, so
+    pages past page_count are probed one by one until a page comes back
+    empty (or repeats known sites). A failed probe or hitting
+    MY_SITES_MAX_PAGES returns None: a truncated list is never returned.
+
+    Args:
+        driver: Chrome WebDriver on mySites page 1
+        session: Session with cookies from Selenium
+        logger: Logger instance
+        page_count: Highest known page number
+        known_sites: Sites already read from page 1
+        max_workers: Parallel page requests
+        rate_limit: Page requests per second (0 = unlimited)
+
+    Returns:
+        Sites from pages 2..N, or None if the endpoint could not be used
+        (caller falls back to browser pagination)
+    """
+    captured = capture_my_sites_request(driver, 2, logger)
+    if captured is None:
+        return None
+    if build_my_sites_page_request(captured, 2, 3) is None:
+        logger.info("mySites page parameter not found in AJAX request")
+        return None
 
-        set_my_sites_count_in_page(driver, logger)
+    wait_for_slot = make_rate_limiter(rate_limit)
 
-        # Reload page to apply count-in-page state and wait for rows.
-        driver.get(MY_SITES_URL)
-        wait = WebDriverWait(driver, PAGE_LOAD_TIMEOUT)
-        wait.until(
-            lambda d: len(
-                [
-                    row
-                    for row in d.find_elements(By.CSS_SELECTOR, "table tbody tr")
-                    if len(row.find_elements(By.TAG_NAME, "td")) >= 10
-                ]
+    def fetch_page(page: int) -> Optional[List[Dict[str, Any]]]:
+        request = build_my_sites_page_request(captured, 2, page)
+        wait_for_slot()
+        markup = fetch_my_sites_page_http(session, request)
+        if markup is None:
+            return None
+        parsed = [
+            parse_site_row_data(data)
+            for data in extract_my_sites_rows_html(markup, logger)
+        ]
+        return [site for site in parsed if site]
+
+    start = time.time()
+    pages = list(range(2, page_count + 1))
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        results = list(executor.map(fetch_page, pages))
+
+    for page, page_sites in zip(pages, results):
+        if not page_sites:
+            logger.warning(f"mySites page {page} returned no rows over HTTP")
+            return None
+
+    sites = [site for page_sites in results for site in page_sites]
+    seen = set(known_sites) | {site["site"] for site in sites}
+    last_page = page_count
+    while True:
+        if last_page >= MY_SITES_MAX_PAGES:
+            logger.warning(
+                f"mySites still had new sites on page {last_page}, "
+                "end of the list not found over HTTP"
             )
-            > 0
-            or "нет сайтов" in d.page_source.lower()
-        )
+            return None
+        page_sites = fetch_page(last_page + 1)
+        if page_sites is None:
+            logger.warning(f"mySites page {last_page + 1} failed over HTTP")
+            return None
+        new_sites = [site for site in page_sites if site["site"] not in seen]
+        if not new_sites:
+            break
+        sites.extend(new_sites)
+        seen.update(site["site"] for site in new_sites)
+        last_page += 1
 
-        rows = get_my_sites_rows(driver)
-        if len(rows) == 0:
-            logger.warning("No rows found on mySites page")
-            return []
+    logger.info(
+        f"Fetched mySites pages 2-{last_page} over HTTP: {len(sites)} rows "
+        f"in {time.time() - start:.1f}s"
+    )
+    return sites
 
-        sites_by_host: Dict[str, Dict[str, Any]] = {}
-        page_num = 1
 
-        while True:
-            page_rows = get_my_sites_rows(driver)
-            for row in page_rows:
-                site_data = parse_site_row(row)
-                if site_data:
-                    sites_by_host[site_data["site"]] = site_data
+def parse_my_sites(
+    driver: webdriver.Chrome,
+    logger: logging.Logger,
+    fast_probes: bool = FAST_PROBES,
+    session: Optional[requests.Session] = None,
+) -> List[Dict[str, Any]]:
+    """Parse /mySites table and return normalized site metrics.
 
-            logger.info(
-                f"mySites page {page_num}: rows={len(page_rows)}, "
-                f"accumulated={len(sites_by_host)}"
+    Args:
+        driver: Chrome WebDriver
+        logger: Logger instance
+        fast_probes: Parse with implicit wait disabled (see probe_element)
+        session: Optional cookie session. When provided, pages after the
+            first are fetched over HTTP (fetch_my_sites_pages_http), with
+            fallback to clicking through pagination in the browser.
+    """
+    logger.info("Parsing mySites page")
+
+    with implicit_wait_disabled(driver, fast_probes):
+        try:
+            driver.get(MY_SITES_URL)
+            wait_for(
+                driver,
+                EC.presence_of_element_located((By.TAG_NAME, "body")),
+                description="mySites page",
             )
 
-            if not go_to_next_my_sites_page(driver, logger):
-                break
+            set_my_sites_count_in_page(driver, logger)
+
+            def load_first_page() -> List[Dict[str, Any]]:
+                driver.get(MY_SITES_URL)
+                wait_for(
+                    driver,
+                    lambda d: get_my_sites_marker(d) != ""
+                    or "нет сайтов" in d.page_source.lower(),
+                    description="mySites rows",
+                )
+                return read_my_sites_page(driver, logger)
+
+            # Reload page to apply count-in-page state and wait for rows.
+            page_sites = load_first_page()
+            log_page_transfer(driver, logger, "mySites page")
+            if len(page_sites) == 0:
+                logger.warning("No rows found on mySites page")
+                return []
+
+            sites_by_host: Dict[str, Dict[str, Any]] = {}
+            page_num = 1
+
+            page_count = get_my_sites_page_count(driver) if session is not None else 0
+            if page_count > 1:
+                other_pages = fetch_my_sites_pages_http(
+                    driver,
+                    session,
+                    logger,
+                    page_count,
+                    known_sites=[site_data["site"] for site_data in page_sites],
+                )
+                if other_pages is not None:
+                    for site_data in page_sites + other_pages:
+                        sites_by_host[site_data["site"]] = site_data
+                    sites = list(sites_by_host.values())
+                    logger.info(f"mySites parsed: {len(sites)} sites (pages over HTTP)")
+                    return sites
+
+                # mySites.load() may have switched the page: start over
+                logger.info("Falling back to browser pagination for mySites")
+                page_sites = load_first_page()
+
+            while True:
+                for site_data in page_sites:
+                    sites_by_host[site_data["site"]] = site_data
+
+                logger.info(
+                    f"mySites page {page_num}: rows={len(page_sites)}, "
+                    f"accumulated={len(sites_by_host)}"
+                )
 
-            page_num += 1
+                if not go_to_next_my_sites_page(driver, logger):
+                    break
 
-        sites = list(sites_by_host.values())
-        logger.info(f"mySites parsed: {len(sites)} sites across {page_num} page(s)")
-        return sites
+                page_num += 1
+                page_sites = read_my_sites_page(driver, logger)
 
-    except TimeoutException:
-        logger.error("Timeout waiting for mySites table rows")
-        return []
+            sites = list(sites_by_host.values())
+            logger.info(f"mySites parsed: {len(sites)} sites across {page_num} page(s)")
+            return sites
 
-    except Exception as e:
-        logger.error(f"Failed to parse mySites page: {e}")
-        return []
+        except TimeoutException:
+            logger.error("Timeout waiting for mySites table rows")
+            return []
+
+        except Exception as e:
+            logger.error(f"Failed to parse mySites page: {e}")
+            return []
+
+
+def site_metrics_changed(old: Tuple[Any, ...], new: Tuple[Any, ...]) -> bool:
+    """Compare domain metric tuples column by column.
+
+    Numbers (and numeric strings) are compared as Decimal, so DECIMAL
+    columns match parsed ints ("12.00" equals 12). Empty strings equal
+    NULL, so a missing description does not force a write; other text is
+    compared as is.
+    """
+    def normalize(value: Any) -> Any:
+        if value is None or isinstance(value, bool):
+            return value
+        text = str(value)
+        if not text.strip():
+            return None
+        try:
+            return Decimal(text)
+        except InvalidOperation:
+            return text
+
+    return tuple(map(normalize, old)) != tuple(map(normalize, new))
 
 
 def save_sites_to_db(
     conn: MySQLConnection,
     sites: List[Dict[str, Any]],
     logger: logging.Logger,
+    batch_size: int = SITES_SAVE_BATCH_SIZE,
+    touch_unchanged: bool = SITES_TOUCH_UNCHANGED,
+    chunk_size: int = DB_IN_CHUNK_SIZE,
 ) -> tuple[int, List[Dict[str, str]]]:
-    """Update ddl.domain rows by host with metrics parsed from /mySites."""
+    """Update ddl.domain rows by host with metrics parsed from /mySites.
+
+    Current metrics of all hosts are prefetched and compared in memory;
+    only domains whose metrics changed are written. Those are loaded into
+    a temporary staging table with multi-row INSERT batches and applied
+    with a single ``UPDATE domain JOIN`` statement. Status changes are
+    detected against the prefetched statuses; a duplicate host keeps its
+    last occurrence.
+
+    Args:
+        conn: MySQL connection
+        sites: Parsed mySites rows
+        logger: Logger instance
+        batch_size: Rows per staging INSERT
+        touch_unchanged: Also set ggl_update_at = NOW() on unchanged
+            domains (one lightweight UPDATE per chunk of hosts)
+        chunk_size: Maximum hosts per IN list (prefetch and touch)
+
+    Returns:
+        Tuple of (updated rows, status changes)
+    """
     if len(sites) == 0:
         logger.info("No mySites data to save")
         return 0, []
 
-    query = """
-        UPDATE domain SET
-            ggl_status = %s,
-            ggl_description = %s,
-            ggl_traffic = %s,
-            ggl_sqi = %s,
-            ggl_cf_tf = %s,
-            ggl_trust = %s,
-            ggl_update_at = NOW()
-        WHERE host = %s
+    columns = (
+        "ggl_status, ggl_description, ggl_traffic, ggl_sqi, ggl_cf_tf, ggl_trust"
+    )
+    staging_insert = (
+        f"INSERT INTO {DB_SITES_STAGING_TABLE} (host, {columns})"
+        " VALUES (%s, %s, %s, %s, %s, %s, %s)"
+    )
+    update_query = f"""
+        UPDATE domain d
+        JOIN {DB_SITES_STAGING_TABLE} s ON s.host = d.host
+        SET
+            d.ggl_status = s.ggl_status,
+            d.ggl_description = s.ggl_description,
+            d.ggl_traffic = s.ggl_traffic,
+            d.ggl_sqi = s.ggl_sqi,
+            d.ggl_cf_tf = s.ggl_cf_tf,
+            d.ggl_trust = s.ggl_trust,
+            d.ggl_update_at = NOW()
     """
 
     updated_count = 0
@@ -1857,17 +4075,24 @@ def save_sites_to_db(
 
     try:
         hosts = [site.get("site") for site in sites if site.get("site")]
-        existing_status_map: Dict[str, Optional[str]] = {}
+        existing_metrics: Dict[str, Tuple[Any, ...]] = {}
         if len(hosts) > 0:
-            placeholders = ", ".join(["%s"] * len(hosts))
-            cursor.execute(
-                f"SELECT host, ggl_status FROM domain WHERE host IN ({placeholders})",
-                tuple(hosts),
+            rows, _ = execute_in_chunks(
+                cursor,
+                f"SELECT host, {columns} FROM domain WHERE host IN ({{placeholders}})",
+                hosts,
+                logger,
+                chunk_size,
+                fetch=True,
             )
-            for host, ggl_status in cursor.fetchall():
-                if host:
-                    existing_status_map[str(host).lower()] = ggl_status
+            for row in rows:
+                if row[0]:
+                    existing_metrics[str(row[0]).lower()] = tuple(row[1:])
+        existing_status_map = {
+            host: metrics[0] for host, metrics in existing_metrics.items()
+        }
 
+        rows_by_host: Dict[str, Tuple[Any, ...]] = {}
         for site in sites:
             host = site.get("site")
             new_status_raw = site.get("status")
@@ -1884,26 +4109,60 @@ def save_sites_to_db(
                     }
                 )
 
-            cursor.execute(
-                query,
-                (
+            if host:
+                rows_by_host[host] = (
+                    host,
                     new_status_raw,
                     site.get("description"),
                     site.get("traffic"),
                     site.get("sqi"),
                     site.get("cf_tf"),
                     site.get("trust"),
-                    host,
-                ),
+                )
+
+        # Hosts missing from domain would not match the UPDATE anyway
+        changed_rows = []
+        unchanged_hosts = []
+        for host, row in rows_by_host.items():
+            if host not in existing_metrics:
+                continue
+            if site_metrics_changed(existing_metrics[host], row[1:]):
+                changed_rows.append(row)
+            else:
+                unchanged_hosts.append(host)
+
+        if len(changed_rows) > 0:
+            # Copy column types from domain without its other columns/keys
+            cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {DB_SITES_STAGING_TABLE}")
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {DB_SITES_STAGING_TABLE}"
+                f" SELECT host, {columns} FROM domain LIMIT 0"
             )
+            for chunk in iter_chunks(changed_rows, batch_size):
+                cursor.executemany(staging_insert, chunk)
+
+            cursor.execute(update_query)
             if cursor.rowcount and cursor.rowcount > 0:
-                updated_count += cursor.rowcount
+                updated_count = cursor.rowcount
+            cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {DB_SITES_STAGING_TABLE}")
+
+        if touch_unchanged:
+            execute_in_chunks(
+                cursor,
+                "UPDATE domain SET ggl_update_at = NOW()"
+                " WHERE host IN ({placeholders})",
+                unchanged_hosts,
+                logger,
+                chunk_size,
+            )
 
         conn.commit()
 
         logger.info(
             "mySites DB update completed: "
             f"parsed={len(sites)}, updated={updated_count}, "
+            f"unchanged={len(unchanged_hosts)}"
+            f"{' (touched)' if touch_unchanged else ''}, "
             f"status_changed={len(status_changes)}"
         )
         return updated_count, status_changes
@@ -1931,7 +4190,11 @@ def get_selenium_cookies_session(
     session = requests.Session()
     for cookie in driver.get_cookies():
         session.cookies.set(
-            cookie["name"], cookie["value"], domain=cookie.get("domain")
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain"),
+            path=cookie.get("path", "/"),
+            secure=cookie.get("secure", False),
         )
     ua = driver.execute_script("return navigator.userAgent")
     session.headers["User-Agent"] = ua
@@ -1945,14 +4208,44 @@ def get_selenium_cookies_session(
     return session
 
 
-def download_csv_export(
+def iter_text_lines(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    """Decode byte chunks incrementally and yield lines (with "\\n").
+
+    Multi-byte sequences and lines split across chunk boundaries are
+    handled, so memory use is bounded by the longest line.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += decoder.decode(chunk)
+        parts = buffer.split("\n")
+        buffer = parts.pop()
+        for part in parts:
+            yield part + "\n"
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+def open_csv_export(
     session: requests.Session,
     download_url: str,
     post_data: Dict[str, str],
     logger: logging.Logger,
     referer: Optional[str] = None,
-) -> Optional[str]:
-    """Download CSV export via POST and return decoded text.
+) -> Optional[Iterator[str]]:
+    """Start CSV export download via POST and return a line iterator.
+
+    The response body is streamed (``stream=True``) and decoded from
+    windows-1251 chunk by chunk, so memory does not depend on export size.
+    The header row and the first link row are read up front (see
+    check_csv_export): an empty export or a login/error page is rejected
+    whatever its size. Errors while opening the export are logged and
+    reported as None; network errors while iterating propagate to the
+    caller.
 
     Args:
         session: requests session with auth cookies
@@ -1962,62 +4255,193 @@ def download_csv_export(
         referer: Referer header value (page the export was initiated from)
 
     Returns:
-        CSV text (decoded from windows-1251) or None on error
+        Iterator over decoded CSV lines or None on error
     """
     try:
         headers = {}
         if referer:
             headers["Referer"] = referer
         resp = session.post(
-            download_url, data=post_data, timeout=30, headers=headers
+            download_url, data=post_data, timeout=30, headers=headers, stream=True
         )
         resp.raise_for_status()
 
         content_type = resp.headers.get("Content-Type", "")
-        if "text/html" in content_type and len(resp.content) > 10000:
-            logger.error(
-                "Got HTML instead of CSV from %s (possibly not authenticated)",
-                download_url,
-            )
-            return None
+        if "text/html" in content_type:
+            # Small bodies may still be CSV; large HTML is a login/error page.
+            body = resp.content
+            if len(body) > 10000:
+                logger.error(
+                    "Got HTML instead of CSV from %s (possibly not authenticated)",
+                    download_url,
+                )
+                return None
+            chunks: Iterable[bytes] = [body]
+        else:
+            chunks = resp.iter_content(chunk_size=CSV_STREAM_CHUNK_SIZE)
+
+    except requests.RequestException as e:
+        logger.error("Failed to download CSV from %s: %s", download_url, e)
+        return None
+
+    def iter_lines() -> Iterator[str]:
+        total_bytes = 0
+        total_lines = 0
+
+        def counted(source: Iterable[bytes]) -> Iterator[bytes]:
+            nonlocal total_bytes
+            for chunk in source:
+                total_bytes += len(chunk)
+                yield chunk
+
+        try:
+            for line in iter_text_lines(counted(chunks), CSV_EXPORT_ENCODING):
+                total_lines += line.endswith("\n")
+                yield line
+        finally:
+            resp.close()
 
-        csv_text = resp.content.decode("windows-1251")
         logger.info(
             "Downloaded CSV from %s: %d bytes, %d lines",
             download_url,
-            len(resp.content),
-            csv_text.count("\n"),
+            total_bytes,
+            total_lines,
         )
-        return csv_text
 
+    try:
+        return check_csv_export(iter_lines(), download_url, logger)
     except requests.RequestException as e:
         logger.error("Failed to download CSV from %s: %s", download_url, e)
         return None
 
 
-def parse_links_csv(
-    csv_text: str, status: str, logger: logging.Logger
-) -> List[Dict[str, Any]]:
-    """Parse CSV export of paid/wait_indexation links.
+def check_csv_export(
+    lines: Generator[str, None, None], download_url: str, logger: logging.Logger
+) -> Optional[Iterator[str]]:
+    """Validate a links export by its header row and first link row.
+
+    Reads lines only until the first row with a URL, then returns an
+    iterator that replays them followed by the rest of the export.
+
+    Returns:
+        Line iterator, or None if the header is missing or wrong (e.g. an
+        HTML page) or there are no link rows; lines is closed then
+    """
+    head: List[str] = []
+
+    def recorded() -> Iterator[str]:
+        for line in lines:
+            head.append(line)
+            yield line
+
+    reader = csv.reader(recorded(), delimiter=";", quotechar='"')
+    header = next(reader, None)
+    first_cell = header[0].strip() if header else ""
+    if not first_cell or "<" in first_cell or first_cell.startswith("http"):
+        logger.error(
+            "Got no CSV header from %s (possibly not authenticated)", download_url
+        )
+        lines.close()
+        return None
+
+    for row in reader:
+        if row and row[0].strip().strip('"').startswith("http"):
+            return itertools.chain(head, lines)
+
+    logger.error("CSV export from %s has no link rows", download_url)
+    lines.close()
+    return None
+
+
+def download_csv_export(
+    session: requests.Session,
+    download_url: str,
+    post_data: Dict[str, str],
+    logger: logging.Logger,
+    referer: Optional[str] = None,
+) -> Optional[str]:
+    """Download whole CSV export and return decoded text.
+
+    Buffered convenience wrapper around open_csv_export; sync_links streams
+    the export instead.
+
+    Returns:
+        CSV text (decoded from windows-1251) or None on error
+    """
+    lines = open_csv_export(session, download_url, post_data, logger, referer)
+    if lines is None:
+        return None
+
+    try:
+        return "".join(lines)
+    except requests.RequestException as e:
+        logger.error("Failed to download CSV from %s: %s", download_url, e)
+        return None
+
+
+def fetch_csv_export(
+    session: requests.Session,
+    page_url: str,
+    download_url: str,
+    post_data: Dict[str, str],
+    logger: logging.Logger,
+) -> Optional[IO[str]]:
+    """Download one CSV export into a spooled temporary file.
+
+    Opens the export page over HTTP first (same session context the
+    browser would create), then streams the CSV into a
+    SpooledTemporaryFile: small exports stay in memory, large ones spill
+    to disk. Safe to run from a worker thread.
+
+    Returns:
+        Text file positioned at start, or None on error (caller closes it)
+    """
+    try:
+        session.get(page_url, timeout=30)
+    except requests.RequestException as e:
+        logger.warning("Failed to open %s before export: %s", page_url, e)
+
+    lines = open_csv_export(session, download_url, post_data, logger, referer=page_url)
+    if lines is None:
+        return None
+
+    spool = tempfile.SpooledTemporaryFile(
+        max_size=CSV_SPOOL_MAX_MEMORY, mode="w+", encoding="utf-8", newline=""
+    )
+    try:
+        spool.writelines(lines)
+    except requests.RequestException as e:
+        spool.close()
+        logger.error("CSV download from %s interrupted: %s", download_url, e)
+        return None
+
+    spool.seek(0)
+    return spool
+
+
+def iter_links_csv(
+    lines: Iterable[str], status: str, logger: logging.Logger
+) -> Iterator[Dict[str, Any]]:
+    """Parse CSV export of paid/wait_indexation links lazily.
 
     Args:
-        csv_text: CSV content (already decoded)
+        lines: CSV lines (already decoded)
         status: 'paid' or 'wait_indexation'
         logger: Logger instance
 
-    Returns:
-        List of dicts with keys: url, date_paid (str or None), status
+    Yields:
+        Dicts with keys: url, date_paid (str or None), status
     """
-    links: List[Dict[str, Any]] = []
-    reader = csv.reader(io.StringIO(csv_text), delimiter=";", quotechar='"')
+    reader = csv.reader(lines, delimiter=";", quotechar='"')
 
     header = next(reader, None)
     if header is None:
         logger.warning("Empty CSV for status=%s", status)
-        return links
+        return
 
     logger.debug("CSV header for %s: %s", status, header)
 
+    count = 0
     for row in reader:
         if not row or not row[0].strip():
             continue
@@ -2037,61 +4461,140 @@ def parse_links_csv(
             except (IndexError, ValueError):
                 logger.debug("Could not parse date: %s", raw_date)
 
-        links.append({"url": url, "date_paid": date_paid, "status": status})
+        count += 1
+        yield {"url": url, "date_paid": date_paid, "status": status}
+
+    logger.info("Parsed %d links with status=%s", count, status)
+
+
+def parse_links_csv(
+    csv_text: str, status: str, logger: logging.Logger
+) -> List[Dict[str, Any]]:
+    """Parse CSV export of paid/wait_indexation links.
+
+    Args:
+        csv_text: CSV content (already decoded)
+        status: 'paid' or 'wait_indexation'
+        logger: Logger instance
+
+    Returns:
+        List of dicts with keys: url, date_paid (str or None), status
+    """
+    return list(iter_links_csv(io.StringIO(csv_text), status, logger))
 
-    logger.info("Parsed %d links with status=%s", len(links), status)
-    return links
+
+def dedupe_links(links: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop duplicate URLs the way the staging upsert in sync_links_to_db does.
+
+    URLs are matched case-insensitively, like the uk_url unique key. A
+    duplicate keeps the first URL spelling but takes date_paid and status
+    from its last occurrence.
+    """
+    by_url: Dict[str, Dict[str, Any]] = {}
+    for link in links:
+        key = link["url"].lower()
+        first = by_url.get(key)
+        by_url[key] = link if first is None else dict(link, url=first["url"])
+    return list(by_url.values())
 
 
 def sync_links_to_db(
     conn: MySQLConnection,
-    links: List[Dict[str, Any]],
+    links: Iterable[Dict[str, Any]],
     logger: logging.Logger,
+    batch_size: int = LINKS_SYNC_BATCH_SIZE,
+    validate: Optional[Callable[[], bool]] = None,
 ) -> Tuple[int, int, int]:
     """Sync links to ggl_links table.
 
-    Inserts new, updates existing, deletes removed links.
+    Loads links into a temporary staging table with multi-row INSERT batches,
+    then inserts new, updates changed and deletes removed links set-wise
+    with a few JOIN statements (no per-link round trips and no giant
+    ``NOT IN`` list). links may be a generator: it is consumed one batch
+    at a time, and a duplicate URL keeps its last occurrence.
+
+    Args:
+        conn: MySQL connection
+        links: Parsed links (list or generator)
+        logger: Logger instance
+        batch_size: Rows per staging INSERT
+        validate: Called once links are consumed, before ggl_links is
+            touched; False aborts the sync (e.g. an export had no rows)
 
     Returns:
         Tuple of (inserted, updated, deleted) counts
     """
-    if not links:
-        logger.warning("No links to sync")
-        return 0, 0, 0
-
     cursor = conn.cursor()
-    inserted = 0
-    updated = 0
 
     try:
+        cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {DB_LINKS_STAGING_TABLE}")
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {DB_LINKS_STAGING_TABLE}"
+            f" LIKE {DB_FULL_LINKS_TABLE}"
+        )
+
+        loaded = 0
+        batch: List[Tuple[str, Optional[str], str]] = []
+        staging_insert = (
+            f"INSERT INTO {DB_LINKS_STAGING_TABLE} (url, date_paid, status)"
+            " VALUES (%s, %s, %s)"
+            " ON DUPLICATE KEY UPDATE"
+            " date_paid = VALUES(date_paid), status = VALUES(status)"
+        )
         for link in links:
-            cursor.execute(
-                f"""INSERT INTO {DB_FULL_LINKS_TABLE}
-                    (url, date_paid, status)
-                    VALUES (%s, %s, %s)
-                    ON DUPLICATE KEY UPDATE
-                        date_paid = VALUES(date_paid),
-                        status = VALUES(status)
-                """,
-                (link["url"], link["date_paid"], link["status"]),
-            )
-            if cursor.rowcount == 1:
-                inserted += 1
-            elif cursor.rowcount == 2:
-                updated += 1
+            batch.append((link["url"], link["date_paid"], link["status"]))
+            if len(batch) >= batch_size:
+                cursor.executemany(staging_insert, batch)
+                loaded += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(staging_insert, batch)
+            loaded += len(batch)
+
+        if validate is not None and not validate():
+            cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {DB_LINKS_STAGING_TABLE}")
+            return 0, 0, 0
+
+        if loaded == 0:
+            cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {DB_LINKS_STAGING_TABLE}")
+            logger.warning("No links to sync")
+            return 0, 0, 0
+
+        cursor.execute(
+            f"""SELECT COUNT(*) FROM {DB_LINKS_STAGING_TABLE} s
+                LEFT JOIN {DB_FULL_LINKS_TABLE} t ON t.url = s.url
+                WHERE t.id IS NULL
+            """
+        )
+        inserted = int(cursor.fetchone()[0])
+
+        cursor.execute(
+            f"""SELECT COUNT(*) FROM {DB_LINKS_STAGING_TABLE} s
+                JOIN {DB_FULL_LINKS_TABLE} t ON t.url = s.url
+                WHERE NOT (t.date_paid <=> s.date_paid) OR t.status <> s.status
+            """
+        )
+        updated = int(cursor.fetchone()[0])
+
+        cursor.execute(
+            f"""INSERT INTO {DB_FULL_LINKS_TABLE} (url, date_paid, status)
+                SELECT url, date_paid, status FROM {DB_LINKS_STAGING_TABLE}
+                ON DUPLICATE KEY UPDATE
+                    date_paid = VALUES(date_paid),
+                    status = VALUES(status)
+            """
+        )
 
         # Delete links that are no longer in either list
-        all_urls = [link["url"] for link in links]
-        if all_urls:
-            placeholders = ", ".join(["%s"] * len(all_urls))
-            cursor.execute(
-                f"DELETE FROM {DB_FULL_LINKS_TABLE} WHERE url NOT IN ({placeholders})",
-                tuple(all_urls),
-            )
-            deleted = cursor.rowcount
-        else:
-            deleted = 0
+        cursor.execute(
+            f"""DELETE t FROM {DB_FULL_LINKS_TABLE} t
+                LEFT JOIN {DB_LINKS_STAGING_TABLE} s ON s.url = t.url
+                WHERE s.url IS NULL
+            """
+        )
+        deleted = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 0
 
+        cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {DB_LINKS_STAGING_TABLE}")
         conn.commit()
         logger.info(
             "Links sync: inserted=%d, updated=%d, deleted=%d",
@@ -2110,71 +4613,446 @@ def sync_links_to_db(
         cursor.close()
 
 
+def normalize_link_date(value: Any) -> Optional[str]:
+    """Return date_paid as 'yyyy-mm-dd' string (DB date or CSV string)."""
+    if value is None:
+        return None
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def sync_links_incremental(
+    conn: MySQLConnection,
+    links: Iterable[Dict[str, Any]],
+    logger: logging.Logger,
+    batch_size: int = LINKS_SYNC_BATCH_SIZE,
+    chunk_size: int = DB_IN_CHUNK_SIZE,
+    validate: Optional[Callable[[], bool]] = None,
+) -> Tuple[int, int, int, int]:
+    """Sync links to ggl_links table writing only the delta.
+
+    Loads current (url, date_paid, status) once, diffs it in memory against
+    the parsed CSV links and then inserts new, updates changed and deletes
+    removed rows. Unchanged rows are not touched at all, which keeps
+    binlog volume proportional to the daily change.
+
+    URLs are matched case-insensitively, like the uk_url unique key.
+    Removed rows are deleted by id in chunks of chunk_size. validate is
+    called once links are consumed, before ggl_links is read or written;
+    False aborts the sync (see sync_links_to_db).
+
+    Returns:
+        Tuple of (inserted, updated, deleted, unchanged) counts
+    """
+    links = dedupe_links(links)
+    if validate is not None and not validate():
+        return 0, 0, 0, 0
+    if not links:
+        logger.warning("No links to sync")
+        return 0, 0, 0, 0
+
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(f"SELECT id, url, date_paid, status FROM {DB_FULL_LINKS_TABLE}")
+        current: Dict[str, Tuple[int, Optional[str], str]] = {}
+        for link_id, url, date_paid, status in cursor.fetchall():
+            current[str(url).lower()] = (
+                link_id,
+                normalize_link_date(date_paid),
+                status,
+            )
+
+        to_insert: List[Tuple[str, Optional[str], str]] = []
+        to_update: List[Tuple[Optional[str], str, int]] = []
+        seen: set = set()
+        unchanged = 0
+
+        for link in links:
+            key = link["url"].lower()
+            seen.add(key)
+
+            date_paid = normalize_link_date(link["date_paid"])
+            existing = current.get(key)
+            if existing is None:
+                to_insert.append((link["url"], date_paid, link["status"]))
+            elif existing[1:] != (date_paid, link["status"]):
+                to_update.append((date_paid, link["status"], existing[0]))
+            else:
+                unchanged += 1
+
+        to_delete = [
+            link_id for key, (link_id, _, _) in current.items() if key not in seen
+        ]
+
+        for chunk in iter_chunks(to_insert, batch_size):
+            cursor.executemany(
+                f"INSERT INTO {DB_FULL_LINKS_TABLE} (url, date_paid, status)"
+                " VALUES (%s, %s, %s)",
+                chunk,
+            )
+
+        if to_update:
+            cursor.executemany(
+                f"UPDATE {DB_FULL_LINKS_TABLE} SET date_paid = %s, status = %s"
+                " WHERE id = %s",
+                to_update,
+            )
+
+        execute_in_chunks(
+            cursor,
+            f"DELETE FROM {DB_FULL_LINKS_TABLE} WHERE id IN ({{placeholders}})",
+            to_delete,
+            logger,
+            chunk_size,
+        )
+
+        conn.commit()
+        logger.info(
+            "Links sync (incremental): inserted=%d, updated=%d, deleted=%d, "
+            "unchanged=%d",
+            len(to_insert),
+            len(to_update),
+            len(to_delete),
+            unchanged,
+        )
+        return len(to_insert), len(to_update), len(to_delete), unchanged
+
+    except mysql.connector.Error as e:
+        conn.rollback()
+        logger.error("Failed to sync links: %s", e)
+        return 0, 0, 0, 0
+
+    finally:
+        cursor.close()
+
+
 def sync_links(
-    driver: webdriver.Chrome,
+    driver: Optional[webdriver.Chrome],
     conn: MySQLConnection,
     logger: logging.Logger,
     proxy_server: Optional[str] = None,
+    config: Optional[Dict[str, Any]] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
-    """Download paid + wait_indexation CSVs and sync to ggl_links table."""
-    session = get_selenium_cookies_session(driver, logger, proxy_server)
+    """Download paid + wait_indexation CSVs and sync to ggl_links table.
+
+    Both exports are fetched concurrently over the cookie-transferred
+    requests session (no browser page loads), spooled, and then parsed
+    lazily and fed to the sync function in batches. An already
+    authenticated session (see load_cookies_session) can be passed instead
+    of the driver.
+    """
+    if session is None:
+        session = get_selenium_cookies_session(driver, logger, proxy_server)
+
+    logger.info("Downloading %d links exports", len(CSV_EXPORTS))
+    with ThreadPoolExecutor(max_workers=len(CSV_EXPORTS)) as executor:
+        futures = [
+            executor.submit(
+                fetch_csv_export, session, page_url, download_url, post_data, logger
+            )
+            for _, page_url, download_url, post_data in CSV_EXPORTS
+        ]
+        spools = [future.result() for future in futures]
+
+    try:
+        for (status, _, _, _), spool in zip(CSV_EXPORTS, spools):
+            if spool is None:
+                logger.error("Failed to download %s links CSV", status)
+                return False
+
+        counts = {status: 0 for status, _, _, _ in CSV_EXPORTS}
+
+        def counted(status: str, spool: IO[str]) -> Iterator[Dict[str, Any]]:
+            for link in iter_links_csv(spool, status, logger):
+                counts[status] += 1
+                yield link
+
+        def every_export_has_links() -> bool:
+            # An empty export would delete every stored link of its status
+            empty = [status for status, count in counts.items() if count == 0]
+            if empty:
+                logger.error(
+                    "No links in %s export, ggl_links left untouched",
+                    ", ".join(empty),
+                )
+            return not empty
+
+        all_links = itertools.chain.from_iterable(
+            counted(status, spool)
+            for (status, _, _, _), spool in zip(CSV_EXPORTS, spools)
+        )
+
+        sync_mode = (config or {}).get("links", {}).get("sync_mode", LINKS_SYNC_MODE)
+        if sync_mode == "incremental":
+            chunk_size = (config or {}).get("database", {}).get(
+                "in_chunk_size", DB_IN_CHUNK_SIZE
+            )
+            sync_links_incremental(
+                conn,
+                all_links,
+                logger,
+                chunk_size=chunk_size,
+                validate=every_export_has_links,
+            )
+        else:
+            sync_links_to_db(conn, all_links, logger, validate=every_export_has_links)
+        return all(counts.values())
+
+    finally:
+        for spool in spools:
+            if spool is not None:
+                spool.close()
+
+
+def get_link_host(url: str) -> str:
+    """Return lower-cased host of URL (key for per-host limits)."""
+    try:
+        return (urlparse(url).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+def create_link_session(config: Optional[Dict[str, Any]] = None) -> requests.Session:
+    """Create shared keep-alive session for link check/warm requests.
+
+    Mounts one HTTPAdapter sized by pool_connections/pool_maxsize from the
+    [links] config section, so connections to the same host are reused
+    across URLs and worker threads. Incoming cookies are not stored, so
+    every request looks like a fresh anonymous visit.
+
+    Args:
+        config: Application configuration (optional)
+
+    Returns:
+        Configured requests.Session
+    """
+    links_config = (config or {}).get("links", {})
+    adapter = HTTPAdapter(
+        pool_connections=links_config.get("pool_connections", HTTP_POOL_CONNECTIONS),
+        pool_maxsize=links_config.get("pool_maxsize", HTTP_POOL_MAXSIZE),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def get_session_reuse_stats(session: requests.Session) -> Tuple[int, int]:
+    """Return (requests sent, connections opened) for session's pools.
+
+    Counters come from urllib3 connection pools still held by the adapters;
+    pools evicted beyond pool_connections are not counted.
+    """
+    total_requests = 0
+    total_connections = 0
+    adapters = {id(a): a for a in session.adapters.values()}
+    for adapter in adapters.values():
+        poolmanager = getattr(adapter, "poolmanager", None)
+        if poolmanager is None:
+            continue
+        for key in list(poolmanager.pools.keys()):
+            pool = poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            total_requests += getattr(pool, "num_requests", 0)
+            total_connections += getattr(pool, "num_connections", 0)
+    return total_requests, total_connections
+
+
+def format_session_reuse(session: requests.Session) -> str:
+    """Format connection reuse ratio for end-of-run log lines."""
+    total_requests, total_connections = get_session_reuse_stats(session)
+    if total_requests == 0:
+        return "connections: no requests sent"
+
+    reused = max(0, total_requests - total_connections)
+    return (
+        f"connections: {total_connections} opened for {total_requests} requests, "
+        f"reuse {reused / total_requests:.0%}"
+    )
+
+
+def make_rate_limiter(rate_per_second: float) -> Callable[[], None]:
+    """Build thread-safe limiter that spaces calls to at most N per second.
+
+    Each call reserves the next free time slot under a lock and sleeps
+    outside of it until that slot, so concurrent workers share one budget.
+
+    Args:
+        rate_per_second: Maximum calls per second (0 or less disables limit)
+
+    Returns:
+        Function to call before each rate-limited operation
+    """
+    if rate_per_second <= 0:
+        return lambda: None
+
+    interval = 1.0 / rate_per_second
+    lock = threading.Lock()
+    next_slot = [0.0]
+
+    def acquire() -> None:
+        with lock:
+            now = time.monotonic()
+            slot = max(now, next_slot[0])
+            next_slot[0] = slot + interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    return acquire
+
+
+def run_link_requests(
+    rows: List[Dict[str, Any]],
+    fetch: Callable[[str], Any],
+    max_workers: int,
+    per_host_limit: int,
+    rate_limit: float = 0,
+    on_idle: Optional[Callable[[], None]] = None,
+    idle_interval: float = LINK_RESULTS_IDLE_POLL,
+) -> Iterator[Tuple[Dict[str, Any], Any, float]]:
+    """Run fetch(url) for each row in a thread pool with bounded parallelism.
+
+    At most max_workers requests are in flight overall and at most
+    per_host_limit per host. Hosts are served round-robin, so a single slow
+    domain cannot occupy the whole pool. Results are yielded on the calling
+    thread in completion order, which keeps DB writes single-threaded.
+
+    Args:
+        rows: Dicts with at least "url" key
+        fetch: Function doing the request; must not raise on network errors
+        max_workers: Global concurrency limit
+        per_host_limit: Concurrency limit per host
+        rate_limit: Global requests-per-second cap (0 = unlimited)
+        on_idle: Called on the calling thread whenever no request finished
+            for idle_interval seconds (e.g. to flush buffered results while
+            a slow host stalls)
+        idle_interval: Seconds between on_idle calls
+
+    Yields:
+        Tuples of (row, fetch result, elapsed seconds)
+    """
+    max_workers = max(1, max_workers)
+    per_host_limit = max(1, per_host_limit)
+    wait_for_slot = make_rate_limiter(rate_limit)
+
+    queues: Dict[str, Deque[Dict[str, Any]]] = {}
+    for row in rows:
+        queues.setdefault(get_link_host(row["url"]), deque()).append(row)
+
+    def timed_fetch(url: str) -> Tuple[Any, float]:
+        wait_for_slot()
+        start = time.time()
+        result = fetch(url)
+        return result, time.time() - start
+
+    in_flight: Dict[str, int] = {}
+    futures: Dict[Any, Tuple[Dict[str, Any], str]] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while queues or futures:
+            for host in list(queues):
+                if len(futures) >= max_workers:
+                    break
+                queue = queues[host]
+                while (
+                    queue
+                    and in_flight.get(host, 0) < per_host_limit
+                    and len(futures) < max_workers
+                ):
+                    row = queue.popleft()
+                    future = executor.submit(timed_fetch, row["url"])
+                    futures[future] = (row, host)
+                    in_flight[host] = in_flight.get(host, 0) + 1
+                if not queue:
+                    del queues[host]
+
+            done, _ = wait(
+                list(futures),
+                timeout=idle_interval if on_idle is not None else None,
+                return_when=FIRST_COMPLETED,
+            )
+            if not done and on_idle is not None:
+                on_idle()
+            for future in done:
+                row, host = futures.pop(future)
+                in_flight[host] -= 1
+                result, elapsed = future.result()
+                yield row, result, elapsed
+
 
-    all_links: List[Dict[str, Any]] = []
+def flush_link_results(
+    conn: MySQLConnection,
+    cursor: Any,
+    results: List[Tuple[int, int]],
+) -> None:
+    """Write buffered (link id, status code) results and commit.
 
-    # Navigate to paid page first (establishes session context),
-    # then download CSV with Referer header
-    logger.info("Navigating to paid links page")
-    driver.get(PAID_LINKS_URL)
-    time.sleep(2)
+    Results are grouped by status code, so a batch costs one
+    ``UPDATE ... WHERE id IN (...)`` per distinct code instead of one
+    round trip per link. The buffer is cleared after commit.
 
-    paid_csv = download_csv_export(
-        session,
-        CSV_DOWNLOAD_PAID_URL,
-        {"url": "true", "date_paid": "true"},
-        logger,
-        referer=PAID_LINKS_URL,
-    )
-    if paid_csv:
-        all_links.extend(parse_links_csv(paid_csv, "paid", logger))
-    else:
-        logger.error("Failed to download paid links CSV")
-        return False
+    Args:
+        conn: MySQL connection
+        cursor: Cursor to execute updates with
+        results: Buffer of (id, code) tuples
+    """
+    if not results:
+        return
 
-    # Navigate to wait_indexation page, then download CSV
-    logger.info("Navigating to wait_indexation links page")
-    driver.get(WAIT_INDEXATION_URL)
-    time.sleep(2)
+    ids_by_code: Dict[int, List[int]] = {}
+    for link_id, code in results:
+        ids_by_code.setdefault(code, []).append(link_id)
 
-    wait_csv = download_csv_export(
-        session,
-        CSV_DOWNLOAD_WAIT_URL,
-        {"url": "true"},
-        logger,
-        referer=WAIT_INDEXATION_URL,
+    for code, ids in ids_by_code.items():
+        placeholders = ", ".join(["%s"] * len(ids))
+        cursor.execute(
+            f"""UPDATE {DB_FULL_LINKS_TABLE}
+                SET last_check_at = NOW(), last_check_code = %s
+                WHERE id IN ({placeholders})
+            """,
+            (code, *ids),
+        )
+
+    conn.commit()
+    results.clear()
+
+
+def get_link_results_batching(config: Optional[Dict[str, Any]]) -> Tuple[int, float]:
+    """Return (batch size, flush interval seconds) for link result writes."""
+    links_config = (config or {}).get("links", {})
+    batch_size = links_config.get("db_batch_size", LINK_RESULTS_BATCH_SIZE)
+    flush_interval = links_config.get(
+        "db_flush_interval", LINK_RESULTS_FLUSH_INTERVAL
     )
-    if wait_csv:
-        all_links.extend(parse_links_csv(wait_csv, "wait_indexation", logger))
-    else:
-        logger.error("Failed to download wait_indexation links CSV")
-        return False
+    return max(1, batch_size), flush_interval
 
-    if not all_links:
-        logger.warning("No links found in CSVs")
-        return True
 
-    sync_links_to_db(conn, all_links, logger)
-    return True
+def fetch_link_status(session: requests.Session, url: str) -> int:
+    """Send HEAD request to URL and return status code (0 on network error)."""
+    try:
+        resp = session.head(url, timeout=LINK_CHECK_TIMEOUT, allow_redirects=True)
+        return resp.status_code
+    except requests.RequestException:
+        return 0
 
 
 def check_links(
     conn: MySQLConnection,
     config: Dict[str, Any],
     logger: logging.Logger,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """Check HTTP availability of all links in ggl_links table.
 
-    Performs HEAD request for each URL, updates last_check_at/last_check_code,
-    and sends Telegram alert for non-200 responses.
+    Performs HEAD request for each URL (concurrently, see run_link_requests),
+    updates last_check_at/last_check_code, and sends Telegram alert for
+    non-200 responses. A long-lived session (daemon mode) can be passed in;
+    it is left open.
     """
     cursor = conn.cursor(dictionary=True)
     try:
@@ -2190,41 +5068,69 @@ def check_links(
         logger.info("No links to check")
         return True
 
-    logger.info("Checking %d links", len(rows))
+    links_config = config.get("links", {})
+    concurrency = links_config.get("check_concurrency", LINK_CHECK_CONCURRENCY)
+    per_host = links_config.get("check_per_host", LINK_CHECK_PER_HOST)
+
+    logger.info(
+        "Checking %d links (concurrency=%d, per_host=%d)",
+        len(rows),
+        concurrency,
+        per_host,
+    )
     errors: List[Dict[str, Any]] = []
+    started_at = time.time()
+    batch_size, flush_interval = get_link_results_batching(config)
+    pending: List[Tuple[int, int]] = []
+    last_flush = time.time()
+    own_session = session is None
+    if own_session:
+        session = create_link_session(config)
 
     update_cursor = conn.cursor()
+
+    def flush_pending() -> None:
+        nonlocal last_flush
+        if pending and (
+            len(pending) >= batch_size
+            or time.time() - last_flush >= flush_interval
+        ):
+            flush_link_results(conn, update_cursor, pending)
+            last_flush = time.time()
+
     try:
-        for row in rows:
+        for row, code, _elapsed in run_link_requests(
+            rows,
+            functools.partial(fetch_link_status, session),
+            concurrency,
+            per_host,
+            on_idle=flush_pending,
+        ):
             url = row["url"]
-            try:
-                resp = requests.head(url, timeout=LINK_CHECK_TIMEOUT, allow_redirects=True)
-                code = resp.status_code
-            except requests.RequestException:
-                code = 0
-
-            update_cursor.execute(
-                f"""UPDATE {DB_FULL_LINKS_TABLE}
-                    SET last_check_at = NOW(), last_check_code = %s
-                    WHERE id = %s
-                """,
-                (code, row["id"]),
-            )
+            pending.append((row["id"], code))
+            flush_pending()
 
             if code != 200:
                 errors.append({"url": url, "code": code})
                 logger.warning("Link check failed: %s → %d", url, code)
 
-        conn.commit()
+        flush_link_results(conn, update_cursor, pending)
     except mysql.connector.Error as e:
         conn.rollback()
         logger.error("Failed to update link check results: %s", e)
         return False
     finally:
         update_cursor.close()
+        reuse_summary = format_session_reuse(session)
+        if own_session:
+            session.close()
 
     logger.info(
-        "Link check complete: %d total, %d errors", len(rows), len(errors)
+        "Link check complete: %d total, %d errors in %.1fs (%s)",
+        len(rows),
+        len(errors),
+        time.time() - started_at,
+        reuse_summary,
     )
 
     if errors:
@@ -2236,16 +5142,46 @@ def check_links(
 WARM_USER_AGENT = "DDL dashboard cron checker"
 WARM_COOKIE = {"abukreev": "wpadmin"}
 WARM_TIMEOUT = (10, 30)  # (connect, read)
+WARM_CONCURRENCY = 8
+WARM_PER_HOST = 2
+WARM_RATE_LIMIT = 5.0  # requests per second across all workers
+WARM_PROGRESS_EVERY = 50
+
+
+def fetch_warm_link(
+    session: requests.Session, url: str
+) -> Tuple[int, Optional[str]]:
+    """GET URL with warm-up headers/cookie.
+
+    Returns:
+        (status code, error text); code is 0 on network error
+    """
+    try:
+        resp = session.get(
+            url,
+            timeout=WARM_TIMEOUT,
+            headers={"User-Agent": WARM_USER_AGENT},
+            cookies=WARM_COOKIE,
+            allow_redirects=True,
+        )
+        return resp.status_code, None
+    except requests.RequestException as e:
+        return 0, str(e)
 
 
 def warm_links(
     conn: MySQLConnection,
     logger: logging.Logger,
+    config: Optional[Dict[str, Any]] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """Warm links by sending GET request to each URL.
 
-    Warms cache for paid links (date_paid >= 2025-01-01).
-    Updates last_check_at and last_check_code in ggl_links.
+    Warms cache for paid links (date_paid >= 2025-01-01) using a worker pool
+    limited by warm_concurrency, warm_per_host and warm_rps from the [links]
+    config section.
+    Updates last_check_at and last_check_code in ggl_links. A long-lived
+    session (daemon mode) can be passed in; it is left open.
     """
     cursor = conn.cursor(dictionary=True)
     try:
@@ -2261,37 +5197,55 @@ def warm_links(
         logger.info("No links to warm")
         return True
 
-    logger.info("Warming %d links", len(rows))
+    links_config = (config or {}).get("links", {})
+    concurrency = links_config.get("warm_concurrency", WARM_CONCURRENCY)
+    per_host = links_config.get("warm_per_host", WARM_PER_HOST)
+    rate_limit = links_config.get("warm_rps", WARM_RATE_LIMIT)
+
+    logger.info(
+        "Warming %d links (concurrency=%d, per_host=%d, rps=%s)",
+        len(rows),
+        concurrency,
+        per_host,
+        rate_limit or "unlimited",
+    )
     ok_count = 0
     err_count = 0
+    started_at = time.time()
+    batch_size, flush_interval = get_link_results_batching(config)
+    pending: List[Tuple[int, int]] = []
+    last_flush = time.time()
+    own_session = session is None
+    if own_session:
+        session = create_link_session(config)
 
     update_cursor = conn.cursor()
+
+    def flush_pending() -> None:
+        nonlocal last_flush
+        if pending and (
+            len(pending) >= batch_size
+            or time.time() - last_flush >= flush_interval
+        ):
+            flush_link_results(conn, update_cursor, pending)
+            last_flush = time.time()
+
     try:
-        for i, row in enumerate(rows, 1):
+        results = run_link_requests(
+            rows,
+            functools.partial(fetch_warm_link, session),
+            concurrency,
+            per_host,
+            rate_limit,
+            on_idle=flush_pending,
+        )
+        for i, (row, (code, error), elapsed) in enumerate(results, 1):
             url = row["url"]
-            start = time.time()
-            try:
-                resp = requests.get(
-                    url,
-                    timeout=WARM_TIMEOUT,
-                    headers={"User-Agent": WARM_USER_AGENT},
-                    cookies=WARM_COOKIE,
-                    allow_redirects=True,
-                )
-                code = resp.status_code
-                elapsed = time.time() - start
-            except requests.RequestException as e:
-                code = 0
-                elapsed = time.time() - start
-                logger.warning("Warm failed: %s → %s (%.1fs)", url, e, elapsed)
-
-            update_cursor.execute(
-                f"""UPDATE {DB_FULL_LINKS_TABLE}
-                    SET last_check_at = NOW(), last_check_code = %s
-                    WHERE id = %s
-                """,
-                (code, row["id"]),
-            )
+            if error:
+                logger.warning("Warm failed: %s → %s (%.1fs)", url, error, elapsed)
+
+            pending.append((row["id"], code))
+            flush_pending()
 
             if code == 200:
                 ok_count += 1
@@ -2300,19 +5254,27 @@ def warm_links(
                 err_count += 1
                 logger.warning("Warm error: %s → %d (%.1fs)", url, code, elapsed)
 
-            if i % 50 == 0:
+            if i % WARM_PROGRESS_EVERY == 0:
                 logger.info("Warm progress: %d/%d", i, len(rows))
 
-        conn.commit()
+        flush_link_results(conn, update_cursor, pending)
     except mysql.connector.Error as e:
         conn.rollback()
         logger.error("Failed to update warm results: %s", e)
         return False
     finally:
         update_cursor.close()
+        reuse_summary = format_session_reuse(session)
+        if own_session:
+            session.close()
 
     logger.info(
-        "Warm complete: %d total, %d ok, %d errors", len(rows), ok_count, err_count
+        "Warm complete: %d total, %d ok, %d errors in %.1fs (%s)",
+        len(rows),
+        ok_count,
+        err_count,
+        time.time() - started_at,
+        reuse_summary,
     )
     return True
 
@@ -2748,11 +5710,566 @@ def send_no_new_tasks_notification(
         return False
 
 
+# =============================================================================
+# DAEMON
+# =============================================================================
+
+# Stages in the order they run when due at the same time, and their default
+# intervals in seconds (0 = disabled), overridable in [daemon] section
+DAEMON_STAGES = ("sync_links", "tasks", "sites", "check_links", "warm_links")
+DAEMON_INTERVALS = {
+    "sync_links": 0,
+    "tasks": 3600,
+    "sites": 86400,
+    "check_links": 0,
+    "warm_links": 0,
+}
+DAEMON_DB_PING_ATTEMPTS = 3
+DAEMON_DB_PING_DELAY = 5
+
+
+def ensure_database(
+    state: Dict[str, Any], config: Dict[str, Any], logger: logging.Logger
+) -> MySQLConnection:
+    """Return live database connection, reconnecting if the ping fails."""
+    conn = state.get("conn")
+    if conn is not None:
+        try:
+            conn.ping(
+                reconnect=True,
+                attempts=DAEMON_DB_PING_ATTEMPTS,
+                delay=DAEMON_DB_PING_DELAY,
+            )
+            return conn
+        except mysql.connector.Error as e:
+            logger.warning(f"Database health check failed, reconnecting: {e}")
+            try:
+                conn.close()
+            except Exception:
+                pass
+            state["conn"] = None
+
+    state["conn"] = connect_to_database(config, logger)
+    return state["conn"]
+
+
+def is_driver_alive(driver: webdriver.Chrome) -> bool:
+    """Check that the browser still answers WebDriver commands."""
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+def close_browser(state: Dict[str, Any], logger: logging.Logger) -> None:
+    """Quit daemon browser (if any) and forget it.
+
+    An attached Chrome (debugger_address) is only detached from, see
+    close_driver.
+    """
+    driver = state.get("driver")
+    state["driver"] = None
+    if driver is None:
+        return
+    close_driver(driver, logger, attached=state.get("browser_attached", False))
+
+
+def ensure_browser(
+    state: Dict[str, Any], config: Dict[str, Any], logger: logging.Logger
+) -> Optional[webdriver.Chrome]:
+    """Return live authenticated browser, restarting it if it died.
+
+    Returns:
+        Chrome WebDriver, or None if it could not be started or logged in
+        (the stage is skipped until its next run)
+    """
+    driver = state.get("driver")
+    if driver is not None:
+        if is_driver_alive(driver):
+            return driver
+        logger.warning("Browser health check failed, restarting Chrome")
+        close_browser(state, logger)
+
+    driver, proxy, exit_code = start_browser_session(config, logger)
+    if driver is None:
+        logger.error(f"Browser session unavailable (exit code {exit_code})")
+        return None
+    state["driver"] = driver
+    state["proxy"] = proxy
+    state["browser_attached"] = bool(
+        config.get("browser", {}).get("debugger_address")
+    )
+    return driver
+
+
+def check_browser_session(state: Dict[str, Any], logger: logging.Logger) -> None:
+    """Drop the browser if the page it is on is no longer logged in.
+
+    Checked on the page a stage already loaded, so it costs no navigation;
+    the next stage then starts a fresh session (cookies or login form).
+    """
+    driver = state.get("driver")
+    if driver is None:
+        return
+    try:
+        with implicit_wait_disabled(driver):
+            logged_in = probe_element(
+                driver, By.CSS_SELECTOR, SELECTOR_PROFILE_LINK
+            ) is not None
+    except WebDriverException:
+        logged_in = False
+    if not logged_in:
+        logger.warning("Browser session lost, will re-authenticate")
+        close_browser(state, logger)
+
+
+def ensure_http_session(
+    state: Dict[str, Any], config: Dict[str, Any], logger: logging.Logger
+) -> Optional[requests.Session]:
+    """Return cookie session for browserless stages (session_mode = http)."""
+    if config["parser"]["session_mode"] != "http":
+        return None
+    if state.get("http_session") is None:
+        state["http_session"] = load_cookies_session(
+            logger, proxy_server=DEFAULT_FALLBACK_PROXY or None
+        )
+    return state["http_session"]
+
+
+def drop_http_session(state: Dict[str, Any]) -> None:
+    """Close cookie session so the next stage re-validates cached cookies."""
+    session = state.get("http_session")
+    state["http_session"] = None
+    if session is not None:
+        session.close()
+
+
+def daemon_sync_links(
+    state: Dict[str, Any], config: Dict[str, Any], logger: logging.Logger
+) -> None:
+    """Daemon stage: CSV links sync (over HTTP session when possible)."""
+    conn = ensure_database(state, config, logger)
+    session = ensure_http_session(state, config, logger)
+    proxy = DEFAULT_FALLBACK_PROXY or None
+    if session is not None:
+        if sync_links(
+            None, conn, logger, proxy_server=proxy, config=config, session=session
+        ):
+            return
+        drop_http_session(state)
+
+    driver = ensure_browser(state, config, logger)
+    if driver is not None:
+        sync_links(
+            driver, conn, logger, proxy_server=state.get("proxy"), config=config
+        )
+
+
+def daemon_tasks(
+    state: Dict[str, Any], config: Dict[str, Any], logger: logging.Logger
+) -> None:
+    """Daemon stage: task list, details, save and notifications.
+
+    The detail cache kept between cycles is pruned to the task IDs of this
+    cycle, so it stays bounded by the task list and tasks that left it are
+    checked against the database again if they come back.
+    """
+    conn = ensure_database(state, config, logger)
+    tasks = None
+    session = ensure_http_session(state, config, logger)
+    if session is not None:
+        tasks = parse_task_list_http(
+            session,
+            logger,
+            conn,
+            detail_cache=state["detail_cache"],
+            detail_concurrency=config["parser"]["detail_concurrency"],
+            detail_rps=config["parser"]["detail_rps"],
+            chunk_size=config["database"]["in_chunk_size"],
+        )
+        if tasks is None:
+            drop_http_session(state)
+
+    if tasks is None:
+        driver = ensure_browser(state, config, logger)
+        if driver is None:
+            return
+        tasks = parse_tasks_in_browser(
+            driver, conn, config, logger, state.get("proxy"), state["detail_cache"]
+        )
+        check_browser_session(state, logger)
+
+    state["detail_cache"].intersection_update(task["task_id"] for task in tasks)
+    save_parsed_tasks(conn, tasks, config, logger)
+
+
+def daemon_sites(
+    state: Dict[str, Any], config: Dict[str, Any], logger: logging.Logger
+) -> None:
+    """Daemon stage: mySites metrics (under the same lock as cron runs)."""
+    acquired, reason = acquire_sites_lock(logger)
+    if not acquired:
+        logger.warning(f"Skipping mySites stage, lock is active: {reason}")
+        return
+    try:
+        conn = ensure_database(state, config, logger)
+        driver = ensure_browser(state, config, logger)
+        if driver is None:
+            return
+        run_sites_stage(driver, conn, config, logger, state.get("proxy"))
+        check_browser_session(state, logger)
+    finally:
+        release_sites_lock(logger)
+
+
+def get_link_session(state: Dict[str, Any], config: Dict[str, Any]) -> requests.Session:
+    """Return keep-alive session shared by link check and warm stages."""
+    if state.get("link_session") is None:
+        state["link_session"] = create_link_session(config)
+    return state["link_session"]
+
+
+def daemon_check_links(
+    state: Dict[str, Any], config: Dict[str, Any], logger: logging.Logger
+) -> None:
+    """Daemon stage: link availability check."""
+    conn = ensure_database(state, config, logger)
+    check_links(conn, config, logger, session=get_link_session(state, config))
+
+
+def daemon_warm_links(
+    state: Dict[str, Any], config: Dict[str, Any], logger: logging.Logger
+) -> None:
+    """Daemon stage: link cache warm-up."""
+    conn = ensure_database(state, config, logger)
+    warm_links(conn, logger, config, session=get_link_session(state, config))
+
+
+DaemonRunner = Callable[[Dict[str, Any], Dict[str, Any], logging.Logger], None]
+DAEMON_RUNNERS: Dict[str, DaemonRunner] = {
+    "sync_links": daemon_sync_links,
+    "tasks": daemon_tasks,
+    "sites": daemon_sites,
+    "check_links": daemon_check_links,
+    "warm_links": daemon_warm_links,
+}
+
+
+def close_daemon_state(state: Dict[str, Any], logger: logging.Logger) -> None:
+    """Release browser, sessions and database connection kept by the daemon."""
+    close_browser(state, logger)
+    drop_http_session(state)
+    link_session = state.pop("link_session", None)
+    if link_session is not None:
+        link_session.close()
+    conn = state.pop("conn", None)
+    if conn is not None:
+        close_database(conn, logger)
+
+
+def run_daemon(
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    stop_event: Optional[threading.Event] = None,
+) -> int:
+    """Run stages on independent intervals, keeping resources warm.
+
+    The browser, database connection and HTTP sessions are created on first
+    use and reused across cycles; before each stage they are health-checked
+    and transparently recreated (DB ping with reconnect, WebDriver liveness,
+    login state on the page a stage loaded, cookie session re-validation).
+    A failing stage is logged and retried at its next interval. Browser wait
+    and probe stats are logged and reset after every stage.
+
+    Args:
+        config: Application configuration ([daemon] intervals)
+        logger: Logger instance
+        stop_event: Set to stop after the running stage (SIGTERM/SIGINT)
+
+    Returns:
+        Exit code
+    """
+    stop_event = stop_event or threading.Event()
+    intervals = {
+        stage: config["daemon"][f"{stage}_interval"]
+        for stage in DAEMON_STAGES
+        if config["daemon"][f"{stage}_interval"] > 0
+    }
+    if not intervals:
+        logger.error("Daemon mode: no stages enabled in [daemon] section")
+        return EXIT_CONFIG_ERROR
+
+    schedule = ", ".join(
+        f"{stage} every {interval}s" for stage, interval in intervals.items()
+    )
+    logger.info(f"Daemon started: {schedule}")
+    state: Dict[str, Any] = {"detail_cache": set()}
+    next_run = dict.fromkeys(intervals, time.monotonic())
+
+    try:
+        while not stop_event.is_set():
+            for stage in DAEMON_STAGES:
+                if (
+                    stage not in intervals
+                    or next_run[stage] > time.monotonic()
+                    or stop_event.is_set()
+                ):
+                    continue
+                started = time.monotonic()
+                logger.info(f"Daemon stage {stage} started")
+                try:
+                    DAEMON_RUNNERS[stage](state, config, logger)
+                except Exception as e:
+                    logger.error(f"Daemon stage {stage} failed: {e}", exc_info=True)
+                finished = time.monotonic()
+                logger.info(
+                    f"Daemon stage {stage} finished in {finished - started:.1f}s"
+                )
+                # Browser stats are per stage, so they do not grow for the
+                # daemon's whole life
+                if WAIT_STATS or PROBE_STATS:
+                    logger.info(f"Browser waits: {format_wait_stats()}")
+                    logger.info(f"Element probes: {format_probe_stats()}")
+                    reset_browser_stats()
+                # Fixed rate like cron; an overrunning stage runs again right away
+                next_run[stage] = max(started + intervals[stage], finished)
+
+            stop_event.wait(max(0.0, min(next_run.values()) - time.monotonic()))
+    finally:
+        close_daemon_state(state, logger)
+
+    logger.info("Daemon stopped")
+    return EXIT_SUCCESS
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
 
 
+def start_browser_session(
+    config: Dict[str, Any],
+    logger: logging.Logger,
+) -> Tuple[Optional[webdriver.Chrome], Optional[str], int]:
+    """Start Chrome and authenticate (cached cookies, then login form).
+
+    Skips direct connection attempt and goes straight to the proxy if one is
+    configured. With a persistent profile or an attached browser the session
+    the browser already has is checked first, before replaying COOKIE_FILE.
+    An attached browser keeps its own proxy flags, so it is attached to once
+    and never quit (see close_driver). On failure the browser is closed
+    before returning.
+
+    Args:
+        config: Application configuration
+        logger: Logger instance
+
+    Returns:
+        Tuple (driver, proxy, exit_code); driver is None on failure and
+        exit_code tells why
+    """
+    driver = None
+    browser_config = config.get("browser", {})
+    user_data_dir = browser_config.get("user_data_dir", CHROME_USER_DATA_DIR)
+    debugger_address = browser_config.get(
+        "debugger_address", CHROME_DEBUGGER_ADDRESS
+    )
+    reuses_browser_state = bool(user_data_dir or debugger_address)
+    launch = functools.partial(
+        initialize_driver,
+        logger,
+        user_data_dir=user_data_dir,
+        debugger_address=debugger_address,
+        block_resources=browser_config.get("block_resources", BLOCK_RESOURCES),
+        blocked_urls=browser_config.get("blocked_urls", ()),
+    )
+    proxy_attempts: List[Optional[str]] = []
+    if DEFAULT_FALLBACK_PROXY:
+        proxy_attempts.append(DEFAULT_FALLBACK_PROXY)
+    if not proxy_attempts:
+        proxy_attempts.append(None)  # fallback: direct only if no proxy set
+    if debugger_address:
+        # The proxy only applies to HTTP sessions; retrying through other
+        # proxies cannot change the attached browser
+        proxy_attempts = proxy_attempts[:1]
+
+    def quit_driver() -> None:
+        if driver is not None:
+            close_driver(driver, logger, attached=bool(debugger_address))
+
+    for proxy in proxy_attempts:
+        if proxy and not debugger_address:
+            logger.info(f"Connecting via proxy {proxy}")
+
+        # Recreate browser for each auth attempt to avoid stale state.
+        quit_driver()
+        driver = None
+
+        try:
+            driver = launch(proxy_server=proxy)
+        except WebDriverException as e:
+            logger.error(f"WebDriver error: {e}")
+            return None, proxy, EXIT_WEBDRIVER_ERROR
+
+        authenticated = reuses_browser_state and has_browser_session(driver, logger)
+        if not authenticated and not load_cookies(driver, logger):
+            max_auth_retries = 2
+            auth_success = False
+            for auth_try in range(1, max_auth_retries + 1):
+                auth_success = authenticate(
+                    driver=driver,
+                    credentials=config["gogetlinks"],
+                    anticaptcha_config=config["anticaptcha"],
+                    logger=logger,
+                )
+                if auth_success:
+                    break
+
+                if auth_try < max_auth_retries:
+                    logger.warning(
+                        f"Auth attempt {auth_try}/{max_auth_retries} failed, "
+                        "retrying with fresh browser..."
+                    )
+                    quit_driver()
+                    driver = None
+                    try:
+                        driver = launch(proxy_server=proxy)
+                    except WebDriverException as e:
+                        logger.error(f"WebDriver error: {e}")
+                        return None, proxy, EXIT_WEBDRIVER_ERROR
+                    continue
+
+            if not auth_success:
+                logger.error("Authentication failed")
+                quit_driver()
+                return None, proxy, EXIT_AUTH_FAILED
+
+            save_cookies(driver, logger)
+
+        if is_anti_bot_blocked(driver):
+            logger.error("Access blocked by anti-bot page")
+            quit_driver()
+            return None, proxy, EXIT_AUTH_FAILED
+
+        return driver, proxy, EXIT_SUCCESS
+
+    logger.error("Authentication failed")
+    quit_driver()
+    return None, None, EXIT_AUTH_FAILED
+
+
+def parse_tasks_in_browser(
+    driver: webdriver.Chrome,
+    conn: MySQLConnection,
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    proxy: Optional[str] = None,
+    detail_cache: Optional[set] = None,
+) -> List[Dict[str, Any]]:
+    """Parse task list in the browser, details over HTTP when configured."""
+    detail_session = None
+    if config["parser"]["detail_fetch"] == "http":
+        detail_session = get_selenium_cookies_session(driver, logger, proxy)
+    try:
+        return parse_task_list(
+            driver,
+            logger,
+            conn,
+            detail_cache=detail_cache,
+            extraction=config["parser"]["task_extraction"],
+            detail_session=detail_session,
+            detail_concurrency=config["parser"]["detail_concurrency"],
+            detail_rps=config["parser"]["detail_rps"],
+            fast_probes=config["parser"]["fast_probes"],
+            chunk_size=config["database"]["in_chunk_size"],
+        )
+    finally:
+        if detail_session is not None:
+            detail_session.close()
+
+
+def save_parsed_tasks(
+    conn: MySQLConnection,
+    tasks: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    logger: logging.Logger,
+) -> None:
+    """Save tasks, notify about new ones and print them (if enabled)."""
+    if not tasks:
+        logger.warning("No tasks parsed")
+        return
+
+    logger.info(f"Saving {len(tasks)} tasks to database")
+    success_count = 0
+    new_tasks = []
+    new_ids = save_tasks_bulk(
+        conn,
+        tasks,
+        logger,
+        chunk_size=config["database"]["in_chunk_size"],
+    )
+    if new_ids is not None:
+        success_count = len(tasks)
+        new_tasks = [t for t in tasks if t["task_id"] in new_ids]
+
+    logger.info(
+        f"Successfully saved {success_count}/{len(tasks)} tasks "
+        f"({len(new_tasks)} new)"
+    )
+
+    # Send Telegram notification for new tasks
+    if len(new_tasks) > 0:
+        send_telegram_notification(new_tasks, config, logger)
+
+    print_tasks(tasks, config["output"]["print_to_console"])
+
+
+def run_sites_stage(
+    driver: webdriver.Chrome,
+    conn: MySQLConnection,
+    config: Dict[str, Any],
+    logger: logging.Logger,
+    proxy: Optional[str] = None,
+) -> None:
+    """Parse /mySites, save metrics and check for stale tasks."""
+    sites_session = None
+    if config["parser"]["sites_pagination"] == "http":
+        sites_session = get_selenium_cookies_session(driver, logger, proxy)
+    try:
+        sites = parse_my_sites(
+            driver,
+            logger,
+            fast_probes=config["parser"]["fast_probes"],
+            session=sites_session,
+        )
+    finally:
+        if sites_session is not None:
+            sites_session.close()
+    updated_sites, status_changes = save_sites_to_db(
+        conn,
+        sites,
+        logger,
+        touch_unchanged=config["parser"]["sites_touch_unchanged"],
+        chunk_size=config["database"]["in_chunk_size"],
+    )
+    if len(status_changes) > 0:
+        send_status_changes_notification(status_changes, config, logger)
+    logger.info(
+        "mySites summary: "
+        f"parsed={len(sites)}, updated={updated_sites}, "
+        f"status_changed={len(status_changes)}"
+    )
+
+    # Check if no new tasks for too long
+    days = get_days_since_last_new_task(conn, logger)
+    if days is not None and days >= NO_NEW_TASKS_THRESHOLD_DAYS:
+        logger.warning(f"No new tasks for {days} days")
+        send_no_new_tasks_notification(days, config, logger)
+    elif days is not None:
+        logger.debug(f"Last new task was {days} day(s) ago")
+
+
 def parse_cli_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Gogetlinks Task Parser")
@@ -2781,6 +6298,18 @@ def parse_cli_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Warm link cache by sending GET to each URL in ggl_links",
     )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run continuously, scheduling stages by [daemon] intervals "
+        "(stage flags are ignored)",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Log module import time and lazily loaded dependencies "
+        "(Selenium, MySQL, lxml)",
+    )
     return parser.parse_args(argv)
 
 
@@ -2793,10 +6322,13 @@ def main(argv: Optional[List[str]] = None) -> int:
     logger = None
     conn = None
     driver = None
+    http_session = None
     sites_lock_acquired = False
+    profile_startup = False
 
     try:
         args = parse_cli_args(argv)
+        profile_startup = args.profile_startup
 
         needs_tasks = not args.skip_tasks
         needs_sites = not args.skip_sites
@@ -2805,7 +6337,13 @@ def main(argv: Optional[List[str]] = None) -> int:
         needs_warm_links = args.warm_links
         needs_selenium = needs_tasks or needs_sites or needs_sync_links
 
-        if not needs_tasks and not needs_sites and not needs_sync_links and not needs_check_links and not needs_warm_links:
+        if not args.daemon and not any((
+            needs_tasks,
+            needs_sites,
+            needs_sync_links,
+            needs_check_links,
+            needs_warm_links,
+        )):
             logger = setup_logger()
             logger.warning("Nothing to do (all stages skipped)")
             return EXIT_SUCCESS
@@ -2832,6 +6370,12 @@ def main(argv: Optional[List[str]] = None) -> int:
             log_level=config["logging"]["log_level"],
         )
 
+        if args.daemon:
+            stop_event = threading.Event()
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, lambda *_: stop_event.set())
+            return run_daemon(config, logger, stop_event)
+
         # Acquire mySites lock only for runs that include /mySites stage.
         if needs_sites:
             sites_lock_acquired, lock_reason = acquire_sites_lock(logger)
@@ -2852,7 +6396,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         # --warm-links / --check-links: no Selenium needed, just DB + HTTP
         if needs_warm_links:
             logger.info("Warming links (--warm-links)")
-            warm_links(conn, logger)
+            warm_links(conn, logger, config)
 
         if needs_check_links:
             logger.info("Checking link availability (--check-links)")
@@ -2862,133 +6406,61 @@ def main(argv: Optional[List[str]] = None) -> int:
             logger.info("Parsing completed successfully")
             return EXIT_SUCCESS
 
-        # 4-5. Initialize browser and authenticate.
-        # Skip direct connection attempt — go straight to proxy if configured.
-        auth_ok = False
-        proxy_attempts: List[Optional[str]] = []
-        if DEFAULT_FALLBACK_PROXY:
-            proxy_attempts.append(DEFAULT_FALLBACK_PROXY)
-        if not proxy_attempts:
-            proxy_attempts.append(None)  # fallback: direct only if no proxy set
-
-        for proxy in proxy_attempts:
-            if proxy:
-                logger.info(f"Connecting via proxy {proxy}")
-
-            # Recreate browser for each auth attempt to avoid stale state.
-            if driver is not None:
-                try:
-                    driver.quit()
-                except Exception:
-                    pass
-                driver = None
-
-            try:
-                driver = initialize_driver(logger, proxy_server=proxy)
-            except WebDriverException as e:
-                logger.error(f"WebDriver error: {e}")
-                return EXIT_WEBDRIVER_ERROR
-
-            if not load_cookies(driver, logger):
-                max_auth_retries = 2
-                auth_success = False
-                for auth_try in range(1, max_auth_retries + 1):
-                    auth_success = authenticate(
-                        driver=driver,
-                        credentials=config["gogetlinks"],
-                        anticaptcha_config=config["anticaptcha"],
-                        logger=logger,
-                    )
-                    if auth_success:
-                        break
-
-                    if auth_try < max_auth_retries:
-                        logger.warning(
-                            f"Auth attempt {auth_try}/{max_auth_retries} failed, "
-                            "retrying with fresh browser..."
-                        )
-                        try:
-                            driver.quit()
-                        except Exception:
-                            pass
-                        driver = initialize_driver(logger, proxy_server=proxy)
-                        continue
-
-                if not auth_success:
-                    logger.error("Authentication failed")
-                    return EXIT_AUTH_FAILED
-
-                save_cookies(driver, logger)
-
-            if is_anti_bot_blocked(driver):
-                logger.error("Access blocked by anti-bot page")
-                return EXIT_AUTH_FAILED
-
-            auth_ok = True
-            break
-
-        if not auth_ok:
-            logger.error("Authentication failed")
-            return EXIT_AUTH_FAILED
+        # 4-5. Authenticate: try cached cookies over plain HTTP first and
+        # start the browser only for stages that need it.
+        proxy = DEFAULT_FALLBACK_PROXY or None
+        if config["parser"]["session_mode"] == "http":
+            http_session = load_cookies_session(logger, proxy_server=proxy)
+
+        tasks_done = False
+        sync_done = False
+        if http_session is not None:
+            if needs_sync_links:
+                logger.info("Syncing paid links over HTTP (--sync-links)")
+                sync_done = sync_links(
+                    None, conn, logger, proxy_server=proxy, config=config,
+                    session=http_session,
+                )
+            if needs_tasks:
+                tasks = parse_task_list_http(
+                    http_session,
+                    logger,
+                    conn,
+                    detail_concurrency=config["parser"]["detail_concurrency"],
+                    detail_rps=config["parser"]["detail_rps"],
+                    chunk_size=config["database"]["in_chunk_size"],
+                )
+                tasks_done = tasks is not None
+
+        if (needs_tasks and not tasks_done) or needs_sites or (
+            needs_sync_links and not sync_done
+        ):
+            driver, proxy, exit_code = start_browser_session(config, logger)
+            if driver is None:
+                return exit_code
+        else:
+            logger.info("Browser not needed, skipped Chrome startup")
 
         # Sync paid links (--sync-links)
-        if needs_sync_links:
+        if needs_sync_links and not sync_done:
             logger.info("Syncing paid links (--sync-links)")
-            sync_links(driver, conn, logger, proxy_server=proxy)
+            sync_links(driver, conn, logger, proxy_server=proxy, config=config)
 
         if not needs_tasks:
             logger.info("Skipping task parsing (--skip-tasks)")
         else:
-            # 6. Parse task list
-            tasks = parse_task_list(driver, logger, conn)
-
-            if not tasks:
-                logger.warning("No tasks parsed")
-            else:
-                # 7. Save tasks to database
-                logger.info(f"Saving {len(tasks)} tasks to database")
-                success_count = 0
-                new_tasks = []
-                for task in tasks:
-                    result = insert_or_update_task(conn, task, logger)
-                    if result is not None:
-                        success_count += 1
-                        if result is True:
-                            new_tasks.append(task)
-
-                logger.info(
-                    f"Successfully saved {success_count}/{len(tasks)} tasks "
-                    f"({len(new_tasks)} new)"
-                )
-
-                # 8. Send Telegram notification for new tasks
-                if len(new_tasks) > 0:
-                    send_telegram_notification(new_tasks, config, logger)
+            # 6. Parse task list (unless already done over HTTP)
+            if not tasks_done:
+                tasks = parse_tasks_in_browser(driver, conn, config, logger, proxy)
 
-                # 9. Print output (if enabled)
-                print_tasks(tasks, config["output"]["print_to_console"])
+            # 7-9. Save, notify and print
+            save_parsed_tasks(conn, tasks, config, logger)
 
-        # 10. Parse and save mySites metrics
+        # 10-11. Parse and save mySites metrics, stale tasks alert
         if not needs_sites:
             logger.info("Skipping mySites parsing (--skip-sites)")
         else:
-            sites = parse_my_sites(driver, logger)
-            updated_sites, status_changes = save_sites_to_db(conn, sites, logger)
-            if len(status_changes) > 0:
-                send_status_changes_notification(status_changes, config, logger)
-            logger.info(
-                "mySites summary: "
-                f"parsed={len(sites)}, updated={updated_sites}, "
-                f"status_changed={len(status_changes)}"
-            )
-
-            # 11. Check if no new tasks for too long
-            days = get_days_since_last_new_task(conn, logger)
-            if days is not None and days >= NO_NEW_TASKS_THRESHOLD_DAYS:
-                logger.warning(f"No new tasks for {days} days")
-                send_no_new_tasks_notification(days, config, logger)
-            elif days is not None:
-                logger.debug(f"Last new task was {days} day(s) ago")
+            run_sites_stage(driver, conn, config, logger, proxy)
 
         logger.info("Parsing completed successfully")
         return EXIT_SUCCESS
@@ -3007,14 +6479,17 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     finally:
         # 9. Cleanup resources
-        if driver:
-            try:
-                driver.quit()
-                if logger:
-                    logger.info("WebDriver closed")
-            except Exception as e:
-                if logger:
-                    logger.warning(f"Error closing WebDriver: {e}")
+        if driver and logger:
+            logger.info(f"Browser waits: {format_wait_stats()}")
+            logger.info(f"Element probes: {format_probe_stats()}")
+            close_driver(
+                driver,
+                logger,
+                attached=bool(config.get("browser", {}).get("debugger_address")),
+            )
+
+        if http_session is not None:
+            http_session.close()
 
         if conn:
             close_database(conn, logger)
@@ -3022,6 +6497,11 @@ def main(argv: Optional[List[str]] = None) -> int:
         if logger and sites_lock_acquired:
             release_sites_lock(logger)
 
+        if logger and profile_startup:
+            logger.info(f"Startup profile: {format_startup_profile()}")
+
+
+MODULE_IMPORT_TIME = time.perf_counter() - MODULE_IMPORT_STARTED
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -60,7 +60,7 @@ COMMENT='Оплаченные ссылки с gogetlinks.net';
 
 -- Создание пользователя для парсера (выполните отдельно с правами root)
 -- CREATE USER 'gogetlinks_parser'@'localhost' IDENTIFIED BY 'STRONG_PASSWORD_HERE';
--- GRANT SELECT, INSERT, UPDATE, DELETE ON ddl.* TO 'gogetlinks_parser'@'localhost';
+-- GRANT SELECT, INSERT, UPDATE, DELETE, CREATE TEMPORARY TABLES ON ddl.* TO 'gogetlinks_parser'@'localhost';
 -- FLUSH PRIVILEGES;
 
 -- Проверка создания таблицы
@@ -0,0 +1,233 @@
+"""
+Тесты режима демона (--daemon)
+"""
+import logging
+import threading
+from unittest.mock import Mock, patch
+
+import mysql.connector
+import pytest
+
+from gogetlinks_parser import (
+    DAEMON_STAGES,
+    close_browser,
+    EXIT_CONFIG_ERROR,
+    EXIT_SUCCESS,
+    PROBE_STATS,
+    WAIT_STATS,
+    daemon_tasks,
+    ensure_browser,
+    ensure_database,
+    run_daemon,
+)
+
+
+@pytest.fixture
+def logger():
+    return logging.getLogger("test")
+
+
+def _config(**intervals):
+    daemon = {f"{stage}_interval": 0 for stage in DAEMON_STAGES}
+    daemon.update({f"{stage}_interval": value for stage, value in intervals.items()})
+    return {
+        "daemon": daemon,
+        "database": {"in_chunk_size": 1000},
+        "parser": {
+            "session_mode": "http",
+            "detail_concurrency": 4,
+            "detail_rps": 0,
+        },
+    }
+
+
+class TestRunDaemon:
+    """Тесты планировщика этапов"""
+
+    def test_runs_due_stages_in_order_and_closes_resources(self, logger):
+        stop = threading.Event()
+        calls = []
+
+        def runner(name):
+            def run(state, config, log):
+                calls.append(name)
+                state["conn"] = conn
+                if name == "check_links":
+                    stop.set()
+            return run
+
+        conn = Mock()
+        runners = {stage: runner(stage) for stage in DAEMON_STAGES}
+        with patch.dict("gogetlinks_parser.DAEMON_RUNNERS", runners), \
+             patch("gogetlinks_parser.close_database") as mock_close_db:
+            result = run_daemon(
+                _config(tasks=3600, check_links=60), logger, stop
+            )
+
+        assert result == EXIT_SUCCESS
+        assert calls == ["tasks", "check_links"]
+        mock_close_db.assert_called_once_with(conn, logger)
+
+    def test_failed_stage_does_not_stop_daemon(self, logger):
+        stop = threading.Event()
+        calls = []
+
+        def failing(state, config, log):
+            calls.append("tasks")
+            raise RuntimeError("boom")
+
+        def sites(state, config, log):
+            calls.append("sites")
+            stop.set()
+
+        with patch.dict(
+            "gogetlinks_parser.DAEMON_RUNNERS", {"tasks": failing, "sites": sites}
+        ):
+            result = run_daemon(_config(tasks=60, sites=60), logger, stop)
+
+        assert result == EXIT_SUCCESS
+        assert calls == ["tasks", "sites"]
+
+    def test_reschedules_by_interval(self, logger):
+        stop = threading.Event()
+        calls = []
+
+        def tasks(state, config, log):
+            calls.append(len(calls))
+            if len(calls) == 3:
+                stop.set()
+
+        clock = [1000.0]
+
+        def wait(timeout):
+            clock[0] += timeout
+
+        with patch.dict("gogetlinks_parser.DAEMON_RUNNERS", {"tasks": tasks}), \
+             patch("gogetlinks_parser.time.monotonic", side_effect=lambda: clock[0]), \
+             patch.object(stop, "wait", side_effect=wait) as mock_wait:
+            run_daemon(_config(tasks=300), logger, stop)
+
+        assert len(calls) == 3
+        # между запусками демон спит до следующего срока, а не крутит цикл
+        assert [call.args[0] for call in mock_wait.call_args_list][:2] == [300, 300]
+
+    def test_browser_stats_reset_after_each_stage(self, logger):
+        stop = threading.Event()
+        seen = []
+
+        def tasks(state, config, log):
+            # статистика предыдущего этапа уже сброшена
+            seen.append(dict(WAIT_STATS))
+            WAIT_STATS["task rows"] = [1, 0, 0.5]
+            PROBE_STATS[".modal"] = [1, 1]
+            if len(seen) == 2:
+                stop.set()
+
+        clock = [1000.0]
+
+        def wait(timeout):
+            clock[0] += timeout
+
+        WAIT_STATS.clear()
+        with patch.dict("gogetlinks_parser.DAEMON_RUNNERS", {"tasks": tasks}), \
+             patch("gogetlinks_parser.time.monotonic", side_effect=lambda: clock[0]), \
+             patch.object(stop, "wait", side_effect=wait):
+            run_daemon(_config(tasks=60), logger, stop)
+
+        assert seen == [{}, {}]
+        assert WAIT_STATS == {}
+        assert PROBE_STATS == {}
+
+    def test_no_stages_enabled(self, logger):
+        assert run_daemon(_config(), logger, threading.Event()) == EXIT_CONFIG_ERROR
+
+
+class TestDaemonHealthChecks:
+    """Тесты проверок ресурсов с прозрачным переподключением"""
+
+    def test_database_ping_keeps_connection(self, logger):
+        conn = Mock()
+        state = {"conn": conn}
+
+        with patch("gogetlinks_parser.connect_to_database") as mock_connect:
+            assert ensure_database(state, {}, logger) is conn
+
+        conn.ping.assert_called_once()
+        assert conn.ping.call_args.kwargs["reconnect"] is True
+        mock_connect.assert_not_called()
+
+    def test_database_reconnects_after_failed_ping(self, logger):
+        conn = Mock()
+        conn.ping.side_effect = mysql.connector.Error("gone away")
+        state = {"conn": conn}
+
+        with patch("gogetlinks_parser.connect_to_database") as mock_connect:
+            assert ensure_database(state, {}, logger) is mock_connect.return_value
+
+        conn.close.assert_called_once()
+        assert state["conn"] is mock_connect.return_value
+
+    def test_browser_reused_while_alive(self, logger):
+        driver = Mock()
+        state = {"driver": driver}
+
+        with patch("gogetlinks_parser.start_browser_session") as mock_start:
+            assert ensure_browser(state, {}, logger) is driver
+
+        mock_start.assert_not_called()
+
+    def test_dead_browser_restarted(self, logger):
+        from selenium.common.exceptions import WebDriverException
+
+        dead = Mock()
+        dead.execute_script.side_effect = WebDriverException("chrome not reachable")
+        fresh = Mock()
+        state = {"driver": dead}
+
+        with patch(
+            "gogetlinks_parser.start_browser_session",
+            return_value=(fresh, "127.0.0.1:3128", EXIT_SUCCESS),
+        ):
+            assert ensure_browser(state, {}, logger) is fresh
+
+        dead.quit.assert_called_once()
+        assert state["proxy"] == "127.0.0.1:3128"
+
+    def test_attached_browser_is_not_quit(self, logger):
+        driver = Mock()
+        state = {"driver": driver, "browser_attached": True}
+
+        close_browser(state, logger)
+
+        driver.quit.assert_not_called()
+        driver.service.stop.assert_called_once()
+        assert state["driver"] is None
+
+    def test_tasks_fall_back_to_browser_when_cookie_session_expires(self, logger):
+        session = Mock()
+        state = {"conn": Mock(), "http_session": session, "detail_cache": set()}
+        browser_tasks = [{"task_id": 1}]
+
+        with patch("gogetlinks_parser.parse_task_list_http", return_value=None), \
+             patch("gogetlinks_parser.ensure_browser", return_value=Mock()), \
+             patch("gogetlinks_parser.check_browser_session"), \
+             patch("gogetlinks_parser.parse_tasks_in_browser",
+                   return_value=browser_tasks) as mock_browser, \
+             patch("gogetlinks_parser.save_parsed_tasks") as mock_save:
+            daemon_tasks(state, _config(tasks=60), logger)
+
+        session.close.assert_called_once()
+        assert state["http_session"] is None
+        mock_browser.assert_called_once()
+        assert mock_save.call_args[0][1] == [{"task_id": 1}]
+
+    def test_detail_cache_pruned_to_current_tasks(self, logger):
+        # Кэш деталей не растёт бесконечно: остаются только задачи из списка
+        state = {"conn": Mock(), "http_session": Mock(), "detail_cache": {1, 2, 3}}
+
+        with patch("gogetlinks_parser.parse_task_list_http",
+                   return_value=[{"task_id": 2}, {"task_id": 4}]), \
+             patch("gogetlinks_parser.save_parsed_tasks"):
+            daemon_tasks(state, _config(tasks=60), logger)
+
+        assert state["detail_cache"] == {2}
@@ -2,14 +2,18 @@
 Тесты модуля базы данных
 """
 import logging
+from decimal import Decimal
 
 import mysql.connector
 import pytest
 from unittest.mock import Mock, call
 from gogetlinks_parser import (
     task_has_details,
+    get_task_ids_with_details,
+    save_tasks_bulk,
     extract_digits_only,
     save_sites_to_db,
+    execute_in_chunks,
 )
 
 
@@ -73,6 +77,190 @@ class TestTaskHasDetails:
         assert params == (42,)
 
 
+class TestExecuteInChunks:
+    """Тесты выполнения запросов со списком IN (...) частями"""
+
+    def test_splits_values_and_collects_rows(self):
+        cursor = Mock()
+        cursor.fetchall.side_effect = [[(1,), (2,)], [(5,)]]
+        logger = Mock()
+
+        rows, _ = execute_in_chunks(
+            cursor,
+            "SELECT id FROM t WHERE id IN ({placeholders})",
+            [1, 2, 3, 4, 5],
+            logger,
+            chunk_size=3,
+            fetch=True,
+        )
+
+        assert rows == [(1,), (2,), (5,)]
+        calls = cursor.execute.call_args_list
+        assert calls[0][0] == ("SELECT id FROM t WHERE id IN (%s, %s, %s)", (1, 2, 3))
+        assert calls[1][0] == ("SELECT id FROM t WHERE id IN (%s, %s)", (4, 5))
+        # по строке на часть + итог
+        assert logger.debug.call_count == 3
+
+    def test_params_before_and_affected_rows(self):
+        cursor = Mock()
+        cursor.rowcount = 2
+
+        rows, affected = execute_in_chunks(
+            cursor,
+            "UPDATE t SET code = %s WHERE id IN ({placeholders})",
+            [1, 2, 3],
+            chunk_size=2,
+            params_before=(404,),
+        )
+
+        assert rows == []
+        assert affected == 4
+        assert cursor.execute.call_args_list[1][0][1] == (404, 3)
+        cursor.fetchall.assert_not_called()
+
+    def test_no_values_no_query(self):
+        cursor = Mock()
+
+        assert execute_in_chunks(cursor, "{placeholders}", []) == ([], 0)
+        cursor.execute.assert_not_called()
+
+
+class TestGetTaskIdsWithDetails:
+    """Тесты пакетной проверки get_task_ids_with_details"""
+
+    def _make_conn(self, fetchall_result):
+        cursor = Mock()
+        cursor.fetchall.return_value = fetchall_result
+        conn = Mock()
+        conn.cursor.return_value = cursor
+        return conn, cursor
+
+    def test_single_query_for_all_ids(self):
+        """Один запрос с IN (...) на все задачи страницы."""
+        conn, cursor = self._make_conn([(1,), (3,)])
+
+        result = get_task_ids_with_details(conn, [1, 2, 3, 2])
+
+        assert result == {1, 3}
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args[0]
+        assert "IN (%s, %s, %s)" in sql
+        assert "description" in sql
+        assert params == (1, 2, 3)
+        cursor.close.assert_called_once()
+
+    def test_large_id_set_is_chunked(self):
+        conn, cursor = self._make_conn([])
+        cursor.fetchall.side_effect = [[(1,)], [(3,)]]
+
+        result = get_task_ids_with_details(conn, [1, 2, 3], chunk_size=2)
+
+        assert result == {1, 3}
+        assert cursor.execute.call_count == 2
+
+    def test_empty_ids_no_query(self):
+        """Пустой список → без запроса к БД."""
+        conn, cursor = self._make_conn([])
+
+        assert get_task_ids_with_details(conn, []) == set()
+        conn.cursor.assert_not_called()
+
+    def test_cache_hits_skip_query(self):
+        """ID из кэша не запрашиваются повторно, новые попадания кэшируются."""
+        conn, cursor = self._make_conn([(2,)])
+        cache = {1}
+
+        result = get_task_ids_with_details(conn, [1, 2, 3], cache)
+
+        assert result == {1, 2}
+        assert cursor.execute.call_args[0][1] == (2, 3)
+        assert cache == {1, 2}
+
+    def test_all_cached_no_query(self):
+        """Все ID в кэше → БД не трогаем."""
+        conn, cursor = self._make_conn([])
+
+        assert get_task_ids_with_details(conn, [5, 6], {5, 6, 7}) == {5, 6}
+        conn.cursor.assert_not_called()
+
+
+class TestSaveTasksBulk:
+    """Тесты пакетного сохранения задач"""
+
+    def _task(self, task_id, **extra):
+        task = {
+            "task_id": task_id,
+            "domain": "example.com",
+            "customer": "Client",
+            "customer_url": "",
+            "external_links": 0,
+            "title": "Заметка",
+            "time_passed": "1 час",
+            "price": 100,
+        }
+        task.update(extra)
+        return task
+
+    def _make_conn(self, existing_ids):
+        cursor = Mock()
+        cursor.fetchall.return_value = [(task_id,) for task_id in existing_ids]
+        conn = Mock()
+        conn.cursor.return_value = cursor
+        return conn, cursor
+
+    def test_reports_new_ids_and_commits_once(self):
+        conn, cursor = self._make_conn([1])
+        tasks = [self._task(1), self._task(2), self._task(3, description="Текст")]
+
+        new_ids = save_tasks_bulk(conn, tasks, logging.getLogger("test"))
+
+        assert new_ids == {2, 3}
+        conn.commit.assert_called_once()
+        cursor.executemany.assert_called_once()
+        sql, rows = cursor.executemany.call_args[0]
+        assert "ON DUPLICATE KEY UPDATE" in sql
+        assert [row[0] for row in rows] == [1, 2, 3]
+        assert rows[2][8] == "Текст"
+
+    def test_existing_ids_locked_before_upsert(self):
+        conn, cursor = self._make_conn([])
+
+        save_tasks_bulk(conn, [self._task(7)], logging.getLogger("test"))
+
+        select_sql = cursor.execute.call_args_list[0][0][0]
+        assert "FOR UPDATE" in select_sql
+
+    def test_detail_fields_not_overwritten_with_null(self):
+        conn, cursor = self._make_conn([1])
+
+        save_tasks_bulk(conn, [self._task(1)], logging.getLogger("test"))
+
+        sql = cursor.executemany.call_args[0][0]
+        assert "COALESCE(VALUES(description), description)" in sql
+
+    def test_chunked_inserts(self):
+        conn, cursor = self._make_conn([])
+        tasks = [self._task(i) for i in range(5)]
+
+        save_tasks_bulk(conn, tasks, logging.getLogger("test"), batch_size=2)
+
+        assert cursor.executemany.call_count == 3
+        conn.commit.assert_called_once()
+
+    def test_empty_list(self):
+        conn, cursor = self._make_conn([])
+        assert save_tasks_bulk(conn, [], logging.getLogger("test")) == set()
+        conn.cursor.assert_not_called()
+
+    def test_rollback_on_error(self):
+        conn, cursor = self._make_conn([])
+        cursor.executemany.side_effect = mysql.connector.Error("DB error")
+
+        assert save_tasks_bulk(conn, [self._task(1)], logging.getLogger("test")) is None
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+
+
 class TestMySitesHelpers:
     """Тесты helper-функций mySites."""
 
@@ -100,10 +288,10 @@ class TestSaveSitesToDb:
     def test_save_sites_to_db_updates_and_commits(self):
         logger = logging.getLogger("test")
         conn, cursor = self._make_conn()
-        cursor.rowcount = 1
+        cursor.rowcount = 2
         cursor.fetchall.return_value = [
-            ("example.com", "Отклонен"),
-            ("site.org", "Отклонен"),
+            ("example.com", "Отклонен", None, 1000, 500, 2011, 30),
+            ("site.org", "Отклонен", "Причина отказа", 40, 100, 105, 5),
         ]
 
         sites = [
@@ -135,16 +323,112 @@ class TestSaveSitesToDb:
         assert status_changes[0]["old_status"] == "Отклонен"
         assert status_changes[0]["new_status"] == "Одобрен"
 
-        # 1 select + 2 update
-        assert cursor.execute.call_count == 3
+        # select + drop/create staging + одно UPDATE ... JOIN + drop
+        assert cursor.execute.call_count == 5
         conn.commit.assert_called_once()
         cursor.close.assert_called_once()
 
-        # Проверяем host в последнем параметре UPDATE.
-        first_call_params = cursor.execute.call_args_list[1][0][1]
-        second_call_params = cursor.execute.call_args_list[2][0][1]
-        assert first_call_params[-1] == "example.com"
-        assert second_call_params[-1] == "site.org"
+        # Все метрики загружаются в staging одним executemany.
+        cursor.executemany.assert_called_once()
+        staged = cursor.executemany.call_args[0][1]
+        assert [row[0] for row in staged] == ["example.com", "site.org"]
+        assert staged[0] == ("example.com", "Одобрен", None, 1000, 500, 2011, 30)
+        update_sql = cursor.execute.call_args_list[3][0][0]
+        assert "UPDATE domain d" in update_sql and "JOIN" in update_sql
+
+    def test_save_sites_to_db_batches_staging_inserts(self):
+        logger = logging.getLogger("test")
+        conn, cursor = self._make_conn()
+        cursor.rowcount = 0
+        cursor.fetchall.return_value = [
+            (f"s{i}.ru", "Одобрен", None, None, None, None, None) for i in range(6)
+        ]
+
+        sites = [
+            {"site": f"s{i}.ru", "status": "Отклонен"} for i in range(5)
+        ] + [{"site": "s0.ru", "status": "Ждёт"}, {"site": None}]
+
+        updated, status_changes = save_sites_to_db(conn, sites, logger, batch_size=2)
+
+        assert updated == 0
+        assert len(status_changes) == 6
+        batches = [c[0][1] for c in cursor.executemany.call_args_list]
+        assert [len(b) for b in batches] == [2, 2, 1]
+        # Повторный host: побеждает последнее вхождение
+        assert batches[0][0][:2] == ("s0.ru", "Ждёт")
+
+    def test_save_sites_to_db_skips_unchanged_metrics(self):
+        logger = logging.getLogger("test")
+        conn, cursor = self._make_conn()
+        cursor.rowcount = 1
+        cursor.fetchall.return_value = [
+            ("same.ru", "Одобрен", None, 100, 5, 2011, 30),
+            ("changed.ru", "Одобрен", None, 100, 5, 2011, 30),
+        ]
+        site = {
+            "status": "Одобрен", "description": None,
+            "traffic": 100, "sqi": 5, "cf_tf": 2011, "trust": 30,
+        }
+        sites = [
+            {**site, "site": "same.ru"},
+            {**site, "site": "changed.ru", "traffic": 150},
+            {**site, "site": "unknown.ru"},
+        ]
+
+        updated, status_changes = save_sites_to_db(conn, sites, logger)
+
+        assert updated == 1
+        assert status_changes == []
+        staged = cursor.executemany.call_args[0][1]
+        assert [row[0] for row in staged] == ["changed.ru"]
+        assert not any(
+            "ggl_update_at = NOW() WHERE" in c[0][0]
+            for c in cursor.execute.call_args_list
+        )
+
+    def test_save_sites_to_db_compares_decimal_columns_numerically(self):
+        logger = logging.getLogger("test")
+        conn, cursor = self._make_conn()
+        cursor.rowcount = 1
+        # DECIMAL-колонки приходят из курсора как Decimal("12.00")
+        cursor.fetchall.return_value = [
+            ("same.ru", "Одобрен", "", Decimal("100.00"), Decimal("5"), 2011, 30),
+            ("changed.ru", "Одобрен", None, Decimal("100.00"), 5, 2011, 30),
+        ]
+        site = {
+            "status": "Одобрен", "description": None,
+            "traffic": 100, "sqi": 5, "cf_tf": 2011, "trust": 30,
+        }
+        sites = [
+            {**site, "site": "same.ru"},
+            {**site, "site": "changed.ru", "traffic": 101},
+        ]
+
+        updated, _ = save_sites_to_db(conn, sites, logger)
+
+        assert updated == 1
+        staged = cursor.executemany.call_args[0][1]
+        assert [row[0] for row in staged] == ["changed.ru"]
+
+    def test_save_sites_to_db_nothing_changed_touches_when_enabled(self):
+        logger = logging.getLogger("test")
+        conn, cursor = self._make_conn()
+        cursor.fetchall.return_value = [
+            ("same.ru", "Одобрен", None, 100, 5, 2011, 30),
+        ]
+        sites = [{
+            "site": "same.ru", "status": "Одобрен", "description": None,
+            "traffic": 100, "sqi": 5, "cf_tf": 2011, "trust": 30,
+        }]
+
+        updated, _ = save_sites_to_db(conn, sites, logger, touch_unchanged=True)
+
+        assert updated == 0
+        cursor.executemany.assert_not_called()
+        touch_sql, touch_params = cursor.execute.call_args_list[-1][0]
+        assert touch_sql.startswith("UPDATE domain SET ggl_update_at = NOW()")
+        assert touch_params == ("same.ru",)
+        conn.commit.assert_called_once()
 
     def test_save_sites_to_db_empty_sites(self):
         logger = logging.getLogger("test")
@@ -18,6 +18,18 @@ from gogetlinks_parser import (
     get_days_since_last_new_task,
     save_cookies,
     load_cookies,
+    load_cookies_session,
+    LazyImport,
+    LAZY_IMPORT_STATS,
+    format_startup_profile,
+    initialize_driver,
+    build_blocked_url_patterns,
+    log_page_transfer,
+    start_browser_session,
+    EXIT_SUCCESS,
+    EXIT_AUTH_FAILED,
+    main,
+    validate_config,
     COOKIE_FILE,
     NO_NEW_TASKS_THRESHOLD_DAYS,
 )
@@ -400,6 +412,345 @@ class TestCookieSession:
         assert result is False
 
 
+class TestMainHttpSession:
+    """Тесты запуска без браузера и возврата к нему."""
+
+    def test_failed_http_sync_is_retried_in_browser(self):
+        from argparse import Namespace
+
+        args = Namespace(
+            skip_tasks=True, skip_sites=True, sync_links=True, check_links=False,
+            warm_links=False, daemon=False, profile_startup=False,
+        )
+        config = {
+            "logging": {"log_file": "test.log", "log_level": "INFO"},
+            "parser": {"session_mode": "http"},
+            "browser": {"debugger_address": ""},
+        }
+        driver = Mock()
+
+        with patch("gogetlinks_parser.parse_cli_args", return_value=args), \
+             patch("gogetlinks_parser.setup_logger", return_value=Mock()), \
+             patch("gogetlinks_parser.load_config", return_value=config), \
+             patch("gogetlinks_parser.validate_config"), \
+             patch("gogetlinks_parser.connect_to_database"), \
+             patch("gogetlinks_parser.close_database"), \
+             patch("gogetlinks_parser.load_cookies_session", return_value=Mock()), \
+             patch("gogetlinks_parser.start_browser_session",
+                   return_value=(driver, None, EXIT_SUCCESS)) as mock_start, \
+             patch("gogetlinks_parser.sync_links",
+                   side_effect=[False, True]) as mock_sync:
+            assert main([]) == EXIT_SUCCESS
+
+        mock_start.assert_called_once()
+        assert mock_sync.call_count == 2
+        assert mock_sync.call_args.args[0] is driver
+
+
+class TestHttpCookieSession:
+    """Тесты проверки сохранённых cookies без запуска браузера."""
+
+    @pytest.fixture
+    def cookie_file(self, tmp_path):
+        import pickle
+        import os
+        path = tmp_path / "cookies.pkl"
+        with open(path, "wb") as f:
+            pickle.dump(
+                [
+                    {"name": "sid", "value": "abc", "domain": ".gogetlinks.net"},
+                    {
+                        "name": "auth",
+                        "value": "xyz",
+                        "domain": ".gogetlinks.net",
+                        "path": "/user",
+                        "secure": True,
+                    },
+                ],
+                f,
+            )
+        os.chmod(path, 0o600)
+        return path
+
+    @staticmethod
+    def _response(status=200, text="", url="https://gogetlinks.net/"):
+        response = Mock()
+        response.status_code = status
+        response.text = text
+        response.url = url
+        return response
+
+    def test_valid_session(self, logger, cookie_file):
+        page = '<html><body><a href="/profile">Профиль</a></body></html>'
+        with patch("gogetlinks_parser.COOKIE_FILE", str(cookie_file)), \
+             patch("gogetlinks_parser.requests.Session.get",
+                   return_value=self._response(text=page)) as mock_get:
+            session = load_cookies_session(logger, proxy_server="127.0.0.1:3128")
+
+        assert session is not None
+        assert session.cookies.get("sid") == "abc"
+        # path и secure переносятся из cookies Selenium
+        auth = next(c for c in session.cookies if c.name == "auth")
+        assert (auth.path, auth.secure) == ("/user", True)
+        assert session.proxies["https"] == "http://127.0.0.1:3128"
+        mock_get.assert_called_once()
+
+    def test_expired_session_removes_cookie_file(self, logger, cookie_file):
+        page = '<html><body><a href="/user/signIn">Вход</a></body></html>'
+        with patch("gogetlinks_parser.COOKIE_FILE", str(cookie_file)), \
+             patch("gogetlinks_parser.requests.Session.get",
+                   return_value=self._response(text=page)):
+            assert load_cookies_session(logger) is None
+
+        assert not cookie_file.exists()
+
+    def test_blocked_check_keeps_cookie_file(self, logger, cookie_file):
+        with patch("gogetlinks_parser.COOKIE_FILE", str(cookie_file)), \
+             patch("gogetlinks_parser.requests.Session.get",
+                   return_value=self._response(403, "Forbidden")):
+            assert load_cookies_session(logger) is None
+
+        assert cookie_file.exists()
+
+    def test_no_cookie_file(self, logger):
+        with patch("gogetlinks_parser.COOKIE_FILE", "/nonexistent/cookies.pkl"), \
+             patch("gogetlinks_parser.requests.Session.get") as mock_get:
+            assert load_cookies_session(logger) is None
+
+        mock_get.assert_not_called()
+
+    def test_invalid_session_mode_rejected(self):
+        config = {
+            "gogetlinks": {"username": "user@example.com"},
+            "anticaptcha": {"api_key": "a" * 32},
+            "database": {"port": 3306},
+            "parser": {"session_mode": "chrome"},
+        }
+        with pytest.raises(ValueError, match="session_mode"):
+            validate_config(config)
+
+
+class TestBrowserReuse:
+    """Тесты постоянного профиля Chrome и подключения к запущенному браузеру."""
+
+    @patch("gogetlinks_parser.webdriver")
+    def test_persistent_profile(self, mock_webdriver, logger):
+        initialize_driver(
+            logger, proxy_server="127.0.0.1:3128", user_data_dir="/var/ggl"
+        )
+
+        options = mock_webdriver.Chrome.call_args.kwargs["options"]
+        assert "--user-data-dir=/var/ggl" in options.arguments
+        assert "--headless=new" in options.arguments
+
+    @patch("gogetlinks_parser.webdriver")
+    def test_attach_to_running_chrome(self, mock_webdriver, logger):
+        initialize_driver(
+            logger, proxy_server="127.0.0.1:3128", debugger_address="127.0.0.1:9222"
+        )
+
+        options = mock_webdriver.Chrome.call_args.kwargs["options"]
+        assert options.experimental_options["debuggerAddress"] == "127.0.0.1:9222"
+        # флаги задаются при запуске долгоживущего Chrome
+        assert options.arguments == []
+
+    @patch("gogetlinks_parser.is_anti_bot_blocked", return_value=False)
+    @patch("gogetlinks_parser.load_cookies")
+    @patch("gogetlinks_parser.is_authenticated", return_value=True)
+    @patch("gogetlinks_parser.wait_for_page_ready")
+    @patch("gogetlinks_parser.initialize_driver")
+    def test_profile_session_skips_cookie_replay(
+        self, mock_init, _wait, _auth, mock_load_cookies, _blocked, logger
+    ):
+        config = {"browser": {"user_data_dir": "/var/ggl", "debugger_address": ""}}
+
+        driver, _, exit_code = start_browser_session(config, logger)
+
+        assert exit_code == EXIT_SUCCESS
+        assert driver is mock_init.return_value
+        assert mock_init.call_args.kwargs["user_data_dir"] == "/var/ggl"
+        mock_load_cookies.assert_not_called()
+
+    @patch("gogetlinks_parser.DEFAULT_FALLBACK_PROXY", "127.0.0.1:3128")
+    @patch("gogetlinks_parser.is_anti_bot_blocked", return_value=True)
+    @patch("gogetlinks_parser.has_browser_session", return_value=True)
+    @patch("gogetlinks_parser.initialize_driver")
+    def test_attached_chrome_is_detached_not_quit(
+        self, mock_init, _session, _blocked, logger
+    ):
+        config = {
+            "browser": {"user_data_dir": "", "debugger_address": "127.0.0.1:9222"}
+        }
+
+        driver, proxy, exit_code = start_browser_session(config, logger)
+
+        assert driver is None
+        assert exit_code == EXIT_AUTH_FAILED
+        # одна попытка подключения, прокси остаётся для HTTP-сессий
+        mock_init.assert_called_once()
+        assert proxy == "127.0.0.1:3128"
+        attached = mock_init.return_value
+        attached.quit.assert_not_called()
+        attached.service.stop.assert_called_once()
+
+    @patch("gogetlinks_parser.webdriver")
+    def test_resource_blocking(self, mock_webdriver, logger):
+        initialize_driver(logger, blocked_urls=["*hotjar.com*"])
+
+        options = mock_webdriver.Chrome.call_args.kwargs["options"]
+        prefs = options.experimental_options["prefs"]
+        assert prefs["profile.managed_default_content_settings.images"] == 2
+
+        driver = mock_webdriver.Chrome.return_value
+        driver.execute_cdp_cmd.assert_any_call("Network.enable", {})
+        blocked = driver.execute_cdp_cmd.call_args_list[-1][0]
+        assert blocked[0] == "Network.setBlockedURLs"
+        assert "*hotjar.com*" in blocked[1]["urls"]
+        assert "*.woff2" in blocked[1]["urls"]
+
+    @patch("gogetlinks_parser.webdriver")
+    def test_resource_blocking_disabled(self, mock_webdriver, logger):
+        initialize_driver(logger, block_resources=False)
+
+        options = mock_webdriver.Chrome.call_args.kwargs["options"]
+        assert "prefs" not in options.experimental_options
+        mock_webdriver.Chrome.return_value.execute_cdp_cmd.assert_not_called()
+
+    def test_allowlist_keeps_jquery_and_recaptcha(self):
+        patterns = build_blocked_url_patterns(
+            ["*google.com*", "*gstatic.com*", "*code.jquery.com/*", "*hotjar.com*"]
+        )
+
+        assert "*hotjar.com*" in patterns
+        assert not [p for p in patterns if "google.com" in p or "jquery" in p]
+        assert "*gstatic.com*" not in patterns
+
+    def test_log_page_transfer(self):
+        driver = Mock()
+        driver.execute_script.return_value = [2048, 12]
+        debug_logger = Mock()
+        debug_logger.isEnabledFor.return_value = True
+
+        assert log_page_transfer(driver, debug_logger, "Task list page") == 2048
+        assert "2.0 KB" in debug_logger.debug.call_args[0][0]
+
+        # без DEBUG лишнего обращения к браузеру нет
+        debug_logger.isEnabledFor.return_value = False
+        driver.execute_script.reset_mock()
+        assert log_page_transfer(driver, debug_logger, "Task list page") is None
+        driver.execute_script.assert_not_called()
+
+    def test_invalid_debugger_address_rejected(self):
+        config = {
+            "gogetlinks": {"username": "user@example.com"},
+            "anticaptcha": {"api_key": "a" * 32},
+            "database": {"port": 3306},
+            "browser": {"debugger_address": "http://localhost"},
+        }
+        with pytest.raises(ValueError, match="debugger_address"):
+            validate_config(config)
+
+    @pytest.mark.parametrize(
+        "pattern", ["*.js", "*/js/*", "*google.com*", "*recaptcha*"]
+    )
+    def test_blocked_url_pattern_hitting_required_resource_rejected(self, pattern):
+        config = {
+            "gogetlinks": {"username": "user@example.com"},
+            "anticaptcha": {"api_key": "a" * 32},
+            "database": {"port": 3306},
+            "browser": {"debugger_address": "", "blocked_urls": [pattern]},
+        }
+        with pytest.raises(ValueError, match="blocked_urls"):
+            validate_config(config)
+
+    def test_third_party_blocked_url_pattern_accepted(self):
+        config = {
+            "gogetlinks": {"username": "user@example.com"},
+            "anticaptcha": {"api_key": "a" * 32},
+            "database": {"port": 3306},
+            "browser": {
+                "debugger_address": "",
+                "blocked_urls": ["*hotjar.com*"],
+            },
+        }
+        validate_config(config)
+
+
+HEAVY_MODULES = (
+    "mysql.connector",
+    "lxml.html",
+    "selenium.webdriver.support.ui",
+    "selenium.webdriver.support.expected_conditions",
+)
+
+
+def _loaded_heavy_modules(code):
+    """Выполнить код в чистом интерпретаторе и вернуть загруженные тяжёлые модули."""
+    import json
+    import os
+    import subprocess
+    import sys
+
+    script = code + (
+        "\nimport json, sys\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=root, capture_output=True, text=True, timeout=60, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestLazyImports:
+    """Тесты ленивой загрузки Selenium, mysql.connector и lxml."""
+
+    def test_module_import_skips_heavy_dependencies(self):
+        assert _loaded_heavy_modules("import gogetlinks_parser") == []
+
+    def test_check_links_run_does_not_load_browser(self):
+        code = (
+            "from unittest.mock import Mock, patch\n"
+            "import gogetlinks_parser as g\n"
+            "config = {'logging': {'log_file': 'x.log', 'log_level': 'INFO'}}\n"
+            "with patch.object(g, 'load_config', return_value=config), "
+            "patch.object(g, 'validate_config'), "
+            "patch.object(g, 'setup_logger'), "
+            "patch.object(g, 'connect_to_database'), "
+            "patch.object(g, 'close_database'), "
+            "patch.object(g, 'check_links') as check:\n"
+            "    argv = ['--skip-tasks', '--skip-sites', '--check-links']\n"
+            "    assert g.main(argv) == 0\n"
+            "    assert check.called\n"
+        )
+        loaded = _loaded_heavy_modules(code)
+        assert not [m for m in loaded if m.startswith("selenium")]
+        assert "lxml.html" not in loaded
+
+    def test_lazy_import_resolves_attributes_and_submodules(self):
+        lazy_json = LazyImport("json")
+        assert lazy_json.dumps([1]) == "[1]"
+        assert "json" in LAZY_IMPORT_STATS
+
+        # подмодуль подгружается при обращении к атрибуту пакета
+        lazy_xml = LazyImport("xml")
+        assert lazy_xml.dom.__name__ == "xml.dom"
+        with pytest.raises(AttributeError):
+            lazy_xml.no_such_module
+
+        lazy_loads = LazyImport("json", "loads")
+        assert lazy_loads("[2]") == [2]
+        with pytest.raises(AttributeError):
+            LazyImport("json", "loads").missing_attribute
+
+    def test_startup_profile_lists_loaded_modules(self):
+        LazyImport("json").dumps
+        profile = format_startup_profile()
+        assert profile.startswith("module import ")
+        assert "json" in profile
+
+
 @pytest.mark.integration
 class TestFullParsingCycle:
     """Интеграционные тесты полного цикла парсинга"""
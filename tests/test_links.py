@@ -9,12 +9,24 @@ import pytest
 from gogetlinks_parser import (
     parse_links_csv,
     sync_links_to_db,
+    sync_links_incremental,
     format_links_check_message,
     download_csv_export,
+    open_csv_export,
+    iter_text_lines,
+    iter_links_csv,
+    sync_links,
     check_links,
     send_links_check_notification,
     get_selenium_cookies_session,
     warm_links,
+    run_link_requests,
+    get_link_host,
+    make_rate_limiter,
+    flush_link_results,
+    create_link_session,
+    get_session_reuse_stats,
+    format_session_reuse,
     DB_FULL_LINKS_TABLE,
     TELEGRAM_MAX_MESSAGE_LENGTH,
 )
@@ -129,9 +141,14 @@ class TestParseLinksCSV:
 
 
 class TestSyncLinksToDb:
+    @staticmethod
+    def _sql_calls(cursor):
+        return [" ".join(c[0][0].split()) for c in cursor.execute.call_args_list]
+
     def test_insert_new_links(self, mock_conn, logger):
         cursor = mock_conn.cursor.return_value
-        cursor.rowcount = 1  # INSERT (new row)
+        cursor.fetchone.side_effect = [(2,), (0,)]  # new, changed
+        cursor.rowcount = 0  # nothing deleted
 
         links = [
             {"url": "https://example.com/1", "date_paid": "2026-01-01", "status": "paid"},
@@ -142,11 +159,18 @@ class TestSyncLinksToDb:
 
         assert inserted == 2
         assert updated == 0
-        assert cursor.execute.call_count == 3  # 2 inserts + 1 delete
+        assert deleted == 0
+        # Staging load is a single multi-row INSERT
+        cursor.executemany.assert_called_once()
+        assert cursor.executemany.call_args[0][1] == [
+            ("https://example.com/1", "2026-01-01", "paid"),
+            ("https://example.com/2", None, "wait_indexation"),
+        ]
 
     def test_update_existing_links(self, mock_conn, logger):
         cursor = mock_conn.cursor.return_value
-        cursor.rowcount = 2  # ON DUPLICATE KEY UPDATE
+        cursor.fetchone.side_effect = [(0,), (1,)]
+        cursor.rowcount = 0
 
         links = [
             {"url": "https://example.com/1", "date_paid": "2026-01-01", "status": "paid"},
@@ -158,12 +182,17 @@ class TestSyncLinksToDb:
         assert updated == 1
 
     def test_empty_links_list(self, mock_conn, logger):
+        cursor = mock_conn.cursor.return_value
         inserted, updated, deleted = sync_links_to_db(mock_conn, [], logger)
         assert (inserted, updated, deleted) == (0, 0, 0)
+        # Nothing may be deleted when the exports were empty
+        assert not [sql for sql in self._sql_calls(cursor) if sql.startswith("DELETE")]
+        mock_conn.commit.assert_not_called()
 
     def test_commits_on_success(self, mock_conn, logger):
         cursor = mock_conn.cursor.return_value
-        cursor.rowcount = 1
+        cursor.fetchone.side_effect = [(1,), (0,)]
+        cursor.rowcount = 0
 
         links = [{"url": "https://example.com", "date_paid": None, "status": "paid"}]
         sync_links_to_db(mock_conn, links, logger)
@@ -184,15 +213,189 @@ class TestSyncLinksToDb:
 
     def test_delete_removed_links(self, mock_conn, logger):
         cursor = mock_conn.cursor.return_value
-        cursor.rowcount = 1
+        cursor.fetchone.side_effect = [(0,), (0,)]
+        cursor.rowcount = 3
 
         links = [{"url": "https://keep.com", "date_paid": None, "status": "paid"}]
+        _, _, deleted = sync_links_to_db(mock_conn, links, logger)
+
+        assert deleted == 3
+        delete_sql = [
+            sql for sql in self._sql_calls(cursor) if sql.startswith("DELETE")
+        ]
+        assert len(delete_sql) == 1
+        assert "LEFT JOIN" in delete_sql[0]
+        assert "NOT IN" not in delete_sql[0]
+
+    def test_statements_do_not_grow_with_links(self, mock_conn, logger):
+        cursor = mock_conn.cursor.return_value
+        cursor.fetchone.side_effect = [(2500,), (0,)]
+        cursor.rowcount = 0
+
+        links = [
+            {"url": f"https://example.com/{i}", "date_paid": None, "status": "paid"}
+            for i in range(2500)
+        ]
+        sync_links_to_db(mock_conn, links, logger, batch_size=1000)
+
+        assert cursor.executemany.call_count == 3
+        batches = [len(c[0][1]) for c in cursor.executemany.call_args_list]
+        assert batches == [1000, 1000, 500]
+        for sql in self._sql_calls(cursor):
+            assert "%s" not in sql
+
+    def test_duplicate_urls_last_wins(self, mock_conn, logger):
+        cursor = mock_conn.cursor.return_value
+        cursor.fetchone.side_effect = [(1,), (0,)]
+        cursor.rowcount = 0
+
+        links = [
+            {"url": "https://dup.com", "date_paid": "2026-01-01", "status": "paid"},
+            {"url": "https://dup.com", "date_paid": None, "status": "wait_indexation"},
+        ]
         sync_links_to_db(mock_conn, links, logger)
 
-        # Last execute should be DELETE with NOT IN
-        last_call = cursor.execute.call_args_list[-1]
-        assert "DELETE" in last_call[0][0]
-        assert "NOT IN" in last_call[0][0]
+        sql, rows = cursor.executemany.call_args[0]
+        assert "ON DUPLICATE KEY UPDATE" in sql
+        assert rows[-1] == ("https://dup.com", None, "wait_indexation")
+
+    def test_consumes_generator_in_batches(self, mock_conn, logger):
+        cursor = mock_conn.cursor.return_value
+        cursor.fetchone.side_effect = [(5,), (0,)]
+        cursor.rowcount = 0
+        consumed = []
+
+        def links():
+            for i in range(5):
+                consumed.append(i)
+                yield {
+                    "url": f"https://example.com/{i}",
+                    "date_paid": None,
+                    "status": "paid",
+                }
+
+        def check_lazy(sql, rows):
+            # Each batch is written before the rest of the stream is read
+            written = sum(len(c[0][1]) for c in cursor.executemany.call_args_list)
+            assert len(consumed) <= written
+
+        cursor.executemany.side_effect = check_lazy
+        sync_links_to_db(mock_conn, links(), logger, batch_size=2)
+
+        assert [len(c[0][1]) for c in cursor.executemany.call_args_list] == [2, 2, 1]
+
+
+# =============================================================================
+# sync_links_incremental
+# =============================================================================
+
+
+class TestSyncLinksIncremental:
+    def _make_cursor(self, mock_conn, existing_rows):
+        import datetime
+
+        cursor = mock_conn.cursor.return_value
+        cursor.fetchall.return_value = [
+            (
+                link_id,
+                url,
+                datetime.date.fromisoformat(date_paid) if date_paid else None,
+                status,
+            )
+            for link_id, url, date_paid, status in existing_rows
+        ]
+        return cursor
+
+    def test_writes_only_delta(self, mock_conn, logger):
+        cursor = self._make_cursor(
+            mock_conn,
+            [
+                (1, "https://same.com", "2026-01-01", "paid"),
+                (2, "https://changed.com", None, "wait_indexation"),
+                (3, "https://gone.com", "2025-05-05", "paid"),
+            ],
+        )
+        links = [
+            {"url": "https://same.com", "date_paid": "2026-01-01", "status": "paid"},
+            {"url": "https://changed.com", "date_paid": "2026-02-02", "status": "paid"},
+            {"url": "https://new.com", "date_paid": None, "status": "wait_indexation"},
+        ]
+
+        result = sync_links_incremental(mock_conn, links, logger)
+
+        assert result == (1, 1, 1, 1)
+        insert_call, update_call = cursor.executemany.call_args_list
+        assert insert_call[0][1] == [("https://new.com", None, "wait_indexation")]
+        assert update_call[0][1] == [("2026-02-02", "paid", 2)]
+        delete_sql, delete_params = cursor.execute.call_args_list[-1][0]
+        assert delete_sql.startswith("DELETE")
+        assert delete_params == (3,)
+        mock_conn.commit.assert_called_once()
+
+    def test_unchanged_run_writes_nothing(self, mock_conn, logger):
+        cursor = self._make_cursor(
+            mock_conn, [(1, "https://same.com", "2026-01-01", "paid")]
+        )
+        links = [
+            {"url": "https://same.com", "date_paid": "2026-01-01", "status": "paid"}
+        ]
+
+        result = sync_links_incremental(mock_conn, links, logger)
+
+        assert result == (0, 0, 0, 1)
+        cursor.executemany.assert_not_called()
+        assert cursor.execute.call_count == 1  # only the initial SELECT
+
+    def test_url_match_is_case_insensitive(self, mock_conn, logger):
+        cursor = self._make_cursor(
+            mock_conn, [(1, "https://Example.com/Page", None, "paid")]
+        )
+        links = [
+            {"url": "https://example.com/page", "date_paid": None, "status": "paid"}
+        ]
+
+        result = sync_links_incremental(mock_conn, links, logger)
+
+        assert result == (0, 0, 0, 1)
+        cursor.executemany.assert_not_called()
+
+    def test_case_differing_duplicates_keep_last(self, mock_conn, logger):
+        # Как и ON DUPLICATE KEY в sync_links_to_db: побеждает последняя строка
+        cursor = self._make_cursor(mock_conn, [])
+        links = [
+            {
+                "url": "https://Example.com/Page",
+                "date_paid": None,
+                "status": "wait_indexation",
+            },
+            {
+                "url": "https://example.com/page",
+                "date_paid": "2026-03-03",
+                "status": "paid",
+            },
+        ]
+
+        result = sync_links_incremental(mock_conn, links, logger)
+
+        assert result == (1, 0, 0, 0)
+        insert_call = cursor.executemany.call_args_list[0]
+        assert insert_call[0][1] == [
+            ("https://Example.com/Page", "2026-03-03", "paid")
+        ]
+
+    def test_empty_links_list(self, mock_conn, logger):
+        assert sync_links_incremental(mock_conn, [], logger) == (0, 0, 0, 0)
+        mock_conn.cursor.assert_not_called()
+
+    def test_rollback_on_error(self, mock_conn, logger):
+        import mysql.connector
+
+        cursor = self._make_cursor(mock_conn, [])
+        cursor.executemany.side_effect = mysql.connector.Error("DB error")
+        links = [{"url": "https://new.com", "date_paid": None, "status": "paid"}]
+
+        assert sync_links_incremental(mock_conn, links, logger) == (0, 0, 0, 0)
+        mock_conn.rollback.assert_called_once()
 
 
 # =============================================================================
@@ -240,7 +443,9 @@ class TestDownloadCsvExport:
         session = Mock()
         response = Mock()
         response.status_code = 200
-        response.content = "url;date\nhttps://example.com;01.01.2026\n".encode("windows-1251")
+        response.iter_content.return_value = [
+            "url;date\nhttps://example.com;01.01.2026\n".encode("windows-1251")
+        ]
         response.headers = {"Content-Type": "application/download"}
         session.post.return_value = response
 
@@ -248,6 +453,7 @@ class TestDownloadCsvExport:
 
         assert result is not None
         assert "https://example.com" in result
+        assert session.post.call_args[1]["stream"] is True
 
     @patch("gogetlinks_parser.requests.Session")
     def test_html_response_returns_none(self, _mock_cls, logger):
@@ -274,6 +480,204 @@ class TestDownloadCsvExport:
         assert result is None
 
 
+class TestCsvStreaming:
+    def test_iter_text_lines_handles_split_chunks(self):
+        text = "Заголовок;Дата\r\nhttps://пример.рф/страница;01.01.2026\r\nlast"
+        data = text.encode("windows-1251")
+        chunks = [data[i:i + 3] for i in range(0, len(data), 3)]
+
+        lines = list(iter_text_lines(chunks, "windows-1251"))
+
+        assert "".join(lines) == text
+        assert lines[1] == "https://пример.рф/страница;01.01.2026\r\n"
+        assert lines[-1] == "last"
+
+    def test_iter_text_lines_multibyte_encoding(self):
+        data = "строка\nвторая\n".encode("utf-8")
+        chunks = [data[i:i + 1] for i in range(len(data))]
+
+        assert list(iter_text_lines(chunks, "utf-8")) == ["строка\n", "вторая\n"]
+
+    def test_open_csv_export_streams_and_closes(self, logger, paid_csv_text):
+        session = Mock()
+        response = Mock()
+        response.headers = {"Content-Type": "application/download"}
+        data = paid_csv_text.encode("windows-1251")
+        response.iter_content.return_value = [data[:10], data[10:]]
+        session.post.return_value = response
+
+        lines = open_csv_export(
+            session, "https://example.com/csv", {"url": "true"}, logger
+        )
+        links = list(iter_links_csv(lines, "paid", logger))
+
+        assert [link["url"] for link in links] == [
+            "https://example.com/page1",
+            "https://example.com/page2",
+        ]
+        response.close.assert_called_once()
+
+    def test_open_csv_export_large_html_returns_none(self, logger):
+        session = Mock()
+        response = Mock()
+        response.content = b"<html>" * 3000
+        response.headers = {"Content-Type": "text/html"}
+        session.post.return_value = response
+
+        assert open_csv_export(session, "https://example.com/csv", {}, logger) is None
+
+    @pytest.mark.parametrize("body", [
+        b"",
+        b"<html><body>\xc2\xf5\xee\xe4</body></html>",
+        '"Страница с обзором";"Дата оплаты"\n'.encode("windows-1251"),
+    ])
+    def test_open_csv_export_rejects_export_without_links(self, logger, body):
+        # пустой ответ, небольшая страница входа или один заголовок
+        session = Mock()
+        response = Mock()
+        response.content = body
+        response.iter_content.return_value = [body]
+        response.headers = {"Content-Type": "text/html"}
+        session.post.return_value = response
+
+        assert open_csv_export(session, "https://example.com/csv", {}, logger) is None
+        response.close.assert_called_once()
+
+
+class TestSyncLinks:
+    def _make_session(self, paid_csv_text, wait_csv_text, delay=0.0):
+        import time
+
+        session = Mock()
+
+        def post(url, **kwargs):
+            time.sleep(delay)
+            response = Mock()
+            response.headers = {"Content-Type": "application/download"}
+            text = paid_csv_text if "web_paid" in url else wait_csv_text
+            response.iter_content.return_value = [text.encode("windows-1251")]
+            return response
+
+        session.post.side_effect = post
+        return session
+
+    def test_downloads_both_exports_over_http(
+        self, mock_conn, logger, paid_csv_text, wait_csv_text
+    ):
+        driver = Mock()
+        session = self._make_session(paid_csv_text, wait_csv_text)
+
+        with patch(
+            "gogetlinks_parser.get_selenium_cookies_session", return_value=session
+        ), patch("gogetlinks_parser.sync_links_to_db") as mock_sync:
+            mock_sync.side_effect = lambda conn, links, logger, **kw: list(links)
+            result = sync_links(driver, mock_conn, logger)
+
+        assert result is True
+        driver.get.assert_not_called()
+        referers = sorted(
+            c[1]["headers"]["Referer"] for c in session.post.call_args_list
+        )
+        assert referers == sorted(
+            ["https://gogetlinks.net/webTask/index/action/viewPaid",
+             "https://gogetlinks.net/webTask/index/action/viewWaitIndexation"]
+        )
+        assert session.get.call_count == 2
+
+    def test_syncs_links_from_both_exports(
+        self, mock_conn, logger, paid_csv_text, wait_csv_text
+    ):
+        session = self._make_session(paid_csv_text, wait_csv_text)
+        synced = []
+
+        with patch(
+            "gogetlinks_parser.get_selenium_cookies_session", return_value=session
+        ), patch("gogetlinks_parser.sync_links_to_db") as mock_sync:
+            mock_sync.side_effect = (
+                lambda conn, links, logger, **kw: synced.extend(links)
+            )
+            sync_links(Mock(), mock_conn, logger)
+
+        statuses = [link["status"] for link in synced]
+        assert statuses == ["paid"] * 2 + ["wait_indexation"] * 2
+
+    def test_downloads_run_concurrently(
+        self, mock_conn, logger, paid_csv_text, wait_csv_text
+    ):
+        import time
+
+        session = self._make_session(paid_csv_text, wait_csv_text, delay=0.3)
+
+        started = time.time()
+        with patch(
+            "gogetlinks_parser.get_selenium_cookies_session", return_value=session
+        ), patch("gogetlinks_parser.sync_links_to_db"):
+            sync_links(Mock(), mock_conn, logger)
+
+        assert time.time() - started < 0.55
+
+    @pytest.mark.parametrize("wait_body", [
+        "",
+        "<html><body>Вход</body></html>",
+    ])
+    def test_bogus_export_leaves_links_untouched(
+        self, mock_conn, logger, paid_csv_text, wait_body
+    ):
+        session = self._make_session(paid_csv_text, wait_body)
+
+        with patch(
+            "gogetlinks_parser.get_selenium_cookies_session", return_value=session
+        ):
+            result = sync_links(Mock(), mock_conn, logger)
+
+        assert result is False
+        mock_conn.cursor.assert_not_called()
+        mock_conn.commit.assert_not_called()
+
+    @pytest.mark.parametrize("sync_mode", ["bulk", "incremental"])
+    def test_export_without_links_aborts_before_delete(
+        self, mock_conn, logger, paid_csv_text, sync_mode
+    ):
+        # экспорт прошёл проверку, но не дал ни одной ссылки своего статуса
+        session = self._make_session(paid_csv_text, '"Страница с обзором"\n')
+        cursor = mock_conn.cursor.return_value
+        cursor.fetchall.return_value = [(1, "https://example.com/wait1", None, "x")]
+        config = {"links": {"sync_mode": sync_mode}}
+
+        with patch(
+            "gogetlinks_parser.get_selenium_cookies_session", return_value=session
+        ), patch(
+            "gogetlinks_parser.check_csv_export", side_effect=lambda lines, *a: lines
+        ):
+            result = sync_links(Mock(), mock_conn, logger, config=config)
+
+        assert result is False
+        statements = [c[0][0] for c in cursor.execute.call_args_list]
+        assert not [sql for sql in statements if "DELETE" in sql]
+        mock_conn.commit.assert_not_called()
+
+    def test_failed_export_skips_sync(self, mock_conn, logger, paid_csv_text):
+        import requests as req
+
+        session = self._make_session(paid_csv_text, "")
+        original_post = session.post.side_effect
+
+        def post(url, **kwargs):
+            if "web_wait_indexation" in url:
+                raise req.RequestException("boom")
+            return original_post(url, **kwargs)
+
+        session.post.side_effect = post
+
+        with patch(
+            "gogetlinks_parser.get_selenium_cookies_session", return_value=session
+        ), patch("gogetlinks_parser.sync_links_to_db") as mock_sync:
+            result = sync_links(Mock(), mock_conn, logger)
+
+        assert result is False
+        mock_sync.assert_not_called()
+
+
 # =============================================================================
 # check_links
 # =============================================================================
@@ -288,7 +692,7 @@ class TestCheckLinks:
             {"id": 1, "url": "https://example.com"},
         ]
 
-        with patch("gogetlinks_parser.requests.head") as mock_head:
+        with patch("gogetlinks_parser.requests.Session.head") as mock_head:
             mock_head.return_value = Mock(status_code=200)
             result = check_links(mock_conn, telegram_config, logger)
 
@@ -304,7 +708,7 @@ class TestCheckLinks:
             {"id": 2, "url": "https://broken.com"},
         ]
 
-        with patch("gogetlinks_parser.requests.head") as mock_head, \
+        with patch("gogetlinks_parser.requests.Session.head") as mock_head, \
              patch("gogetlinks_parser.send_links_check_notification") as mock_notify:
             mock_head.side_effect = [
                 Mock(status_code=200),
@@ -337,7 +741,7 @@ class TestCheckLinks:
             {"id": 1, "url": "https://timeout.com"},
         ]
 
-        with patch("gogetlinks_parser.requests.head") as mock_head, \
+        with patch("gogetlinks_parser.requests.Session.head") as mock_head, \
              patch("gogetlinks_parser.send_links_check_notification"):
             mock_head.side_effect = requests.RequestException("Timeout")
             result = check_links(mock_conn, telegram_config, logger)
@@ -347,6 +751,254 @@ class TestCheckLinks:
         update_call = cursor_update.execute.call_args
         assert update_call[0][1][0] == 0  # code
 
+    def test_check_links_uses_configured_concurrency(
+        self, mock_conn, telegram_config, logger
+    ):
+        cursor_select = Mock()
+        cursor_update = Mock()
+        mock_conn.cursor.side_effect = [cursor_select, cursor_update]
+        cursor_select.fetchall.return_value = [
+            {"id": i, "url": f"https://site{i}.com"} for i in range(5)
+        ]
+        config = dict(
+            telegram_config, links={"check_concurrency": 3, "check_per_host": 1}
+        )
+
+        with patch(
+            "gogetlinks_parser.run_link_requests", wraps=run_link_requests
+        ) as mock_run, patch("gogetlinks_parser.requests.Session.head") as mock_head:
+            mock_head.return_value = Mock(status_code=200)
+            result = check_links(mock_conn, config, logger)
+
+        assert result is True
+        assert mock_run.call_args[0][2:] == (3, 1)
+        # All five results share code 200 → one batched UPDATE
+        assert cursor_update.execute.call_count == 1
+        sql, params = cursor_update.execute.call_args[0]
+        assert "WHERE id IN" in sql
+        assert params[0] == 200
+        assert sorted(params[1:]) == [0, 1, 2, 3, 4]
+
+    def test_check_links_flushes_every_batch(self, mock_conn, telegram_config, logger):
+        cursor_select = Mock()
+        cursor_update = Mock()
+        mock_conn.cursor.side_effect = [cursor_select, cursor_update]
+        cursor_select.fetchall.return_value = [
+            {"id": i, "url": f"https://site{i}.com"} for i in range(5)
+        ]
+        config = dict(
+            telegram_config, links={"db_batch_size": 2, "db_flush_interval": 60}
+        )
+
+        with patch("gogetlinks_parser.requests.Session.head") as mock_head:
+            mock_head.return_value = Mock(status_code=200)
+            result = check_links(mock_conn, config, logger)
+
+        assert result is True
+        # 2 + 2 + 1 results → three incremental commits
+        assert cursor_update.execute.call_count == 3
+        assert mock_conn.commit.call_count == 3
+
+
+# =============================================================================
+# create_link_session
+# =============================================================================
+
+
+@pytest.fixture
+def keepalive_server():
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.send_header("Set-Cookie", "tracking=1; Path=/")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestLinkSession:
+    def test_pool_sizes_from_config(self):
+        session = create_link_session(
+            {"links": {"pool_connections": 7, "pool_maxsize": 3}}
+        )
+        adapter = session.get_adapter("https://example.com")
+
+        assert adapter._pool_connections == 7
+        assert adapter._pool_maxsize == 3
+        assert session.get_adapter("http://example.com") is adapter
+
+    def test_reuses_connections_and_ignores_cookies(self, keepalive_server):
+        session = create_link_session()
+
+        for i in range(3):
+            response = session.head(f"{keepalive_server}/page{i}", timeout=5)
+            assert response.status_code == 200
+
+        assert get_session_reuse_stats(session) == (3, 1)
+        assert "1 opened for 3 requests, reuse 67%" in format_session_reuse(session)
+        assert len(session.cookies) == 0
+
+    def test_format_without_requests(self):
+        assert "no requests" in format_session_reuse(create_link_session())
+
+
+# =============================================================================
+# flush_link_results
+# =============================================================================
+
+
+class TestFlushLinkResults:
+    def test_groups_updates_by_code(self, mock_conn):
+        cursor = Mock()
+        pending = [(1, 200), (2, 404), (3, 200), (4, 0)]
+
+        flush_link_results(mock_conn, cursor, pending)
+
+        params = sorted(c[0][1] for c in cursor.execute.call_args_list)
+        assert params == [(0, 4), (200, 1, 3), (404, 2)]
+        mock_conn.commit.assert_called_once()
+        assert pending == []
+
+    def test_empty_buffer_is_noop(self, mock_conn):
+        cursor = Mock()
+
+        flush_link_results(mock_conn, cursor, [])
+
+        cursor.execute.assert_not_called()
+        mock_conn.commit.assert_not_called()
+
+
+# =============================================================================
+# run_link_requests
+# =============================================================================
+
+
+class TestRunLinkRequests:
+    def test_get_link_host(self):
+        assert get_link_host("https://Example.COM:8080/page") == "example.com"
+        assert get_link_host("not a url") == ""
+
+    def test_yields_every_row(self):
+        rows = [{"id": i, "url": f"https://h{i % 3}.com/{i}"} for i in range(10)]
+
+        results = list(run_link_requests(rows, lambda url: len(url), 4, 2))
+
+        assert sorted(row["id"] for row, _, _ in results) == list(range(10))
+        for row, result, elapsed in results:
+            assert result == len(row["url"])
+            assert elapsed >= 0
+
+    def test_respects_global_and_per_host_limits(self):
+        import threading
+        import time
+
+        lock = threading.Lock()
+        active = {"total": 0, "max_total": 0}
+        per_host: dict = {}
+        max_per_host: dict = {}
+
+        def fetch(url):
+            host = get_link_host(url)
+            with lock:
+                active["total"] += 1
+                active["max_total"] = max(active["max_total"], active["total"])
+                per_host[host] = per_host.get(host, 0) + 1
+                max_per_host[host] = max(max_per_host.get(host, 0), per_host[host])
+            time.sleep(0.02)
+            with lock:
+                active["total"] -= 1
+                per_host[host] -= 1
+            return 200
+
+        rows = [{"id": i, "url": f"https://h{i % 2}.com/{i}"} for i in range(12)]
+        rows += [{"id": 100 + i, "url": f"https://solo{i}.com/"} for i in range(6)]
+
+        results = list(run_link_requests(rows, fetch, 5, 2))
+
+        assert len(results) == len(rows)
+        assert active["max_total"] <= 5
+        assert max_per_host["h0.com"] <= 2
+        assert max_per_host["h1.com"] <= 2
+
+    def test_runs_concurrently(self):
+        import time
+
+        rows = [{"id": i, "url": f"https://h{i}.com/"} for i in range(8)]
+
+        started = time.time()
+        list(run_link_requests(rows, lambda url: time.sleep(0.1), 8, 1))
+
+        assert time.time() - started < 0.5
+
+    def test_empty_rows(self):
+        assert list(run_link_requests([], lambda url: 200, 4, 2)) == []
+
+    def test_on_idle_called_while_requests_stall(self):
+        import time
+
+        rows = [{"id": 1, "url": "https://slow.com/"}]
+        on_idle = Mock()
+
+        results = list(
+            run_link_requests(
+                rows,
+                lambda url: time.sleep(0.3) or 200,
+                2,
+                1,
+                on_idle=on_idle,
+                idle_interval=0.05,
+            )
+        )
+
+        assert [(row, result) for row, result, _ in results] == [(rows[0], 200)]
+        # Пока медленный запрос не завершён, буфер проверяется по таймеру
+        assert on_idle.call_count >= 2
+
+    def test_rate_limit_caps_requests_per_second(self):
+        import time
+
+        rows = [{"id": i, "url": f"https://h{i}.com/"} for i in range(5)]
+
+        started = time.time()
+        list(run_link_requests(rows, lambda url: 200, 5, 1, rate_limit=20))
+
+        # 5 requests at 20 rps → at least 4 intervals of 50ms
+        assert time.time() - started >= 0.19
+
+
+class TestMakeRateLimiter:
+    def test_disabled_limit_does_not_sleep(self):
+        with patch("gogetlinks_parser.time.sleep") as mock_sleep:
+            limiter = make_rate_limiter(0)
+            for _ in range(10):
+                limiter()
+        mock_sleep.assert_not_called()
+
+    def test_spaces_calls(self):
+        with patch("gogetlinks_parser.time.monotonic", return_value=100.0), \
+             patch("gogetlinks_parser.time.sleep") as mock_sleep:
+            limiter = make_rate_limiter(4)
+            limiter()
+            limiter()
+            limiter()
+
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0.25, 0.5])
+
 
 # =============================================================================
 # send_links_check_notification
@@ -460,7 +1112,7 @@ class TestWarmLinks:
             {"id": 1, "url": "https://example.com"},
         ]
 
-        with patch("gogetlinks_parser.requests.get") as mock_get:
+        with patch("gogetlinks_parser.requests.Session.get") as mock_get:
             mock_get.return_value = Mock(status_code=200)
             result = warm_links(mock_conn, logger)
 
@@ -480,7 +1132,7 @@ class TestWarmLinks:
             {"id": 2, "url": "https://broken.com"},
         ]
 
-        with patch("gogetlinks_parser.requests.get") as mock_get:
+        with patch("gogetlinks_parser.requests.Session.get") as mock_get:
             mock_get.side_effect = [
                 Mock(status_code=200),
                 Mock(status_code=503),
@@ -509,7 +1161,7 @@ class TestWarmLinks:
             {"id": 1, "url": "https://timeout.com"},
         ]
 
-        with patch("gogetlinks_parser.requests.get") as mock_get:
+        with patch("gogetlinks_parser.requests.Session.get") as mock_get:
             mock_get.side_effect = req.RequestException("Timeout")
             result = warm_links(mock_conn, logger)
 
@@ -517,6 +1169,26 @@ class TestWarmLinks:
         update_call = cursor_update.execute.call_args
         assert update_call[0][1][0] == 0  # code
 
+    def test_warm_uses_configured_limits(self, mock_conn, logger):
+        cursor_select = Mock()
+        cursor_update = Mock()
+        mock_conn.cursor.side_effect = [cursor_select, cursor_update]
+        cursor_select.fetchall.return_value = [
+            {"id": i, "url": f"https://site{i}.com"} for i in range(3)
+        ]
+        config = {"links": {"warm_concurrency": 2, "warm_per_host": 1, "warm_rps": 0}}
+
+        with patch(
+            "gogetlinks_parser.run_link_requests", wraps=run_link_requests
+        ) as mock_run, patch("gogetlinks_parser.requests.Session.get") as mock_get:
+            mock_get.return_value = Mock(status_code=200)
+            result = warm_links(mock_conn, logger, config)
+
+        assert result is True
+        assert mock_run.call_args[0][2:] == (2, 1, 0)
+        assert cursor_update.execute.call_count == 1
+        mock_conn.commit.assert_called_once()
+
     def test_warm_db_error_rollback(self, mock_conn, logger):
         import mysql.connector
 
@@ -528,7 +1200,7 @@ class TestWarmLinks:
         ]
         cursor_update.execute.side_effect = mysql.connector.Error("DB error")
 
-        with patch("gogetlinks_parser.requests.get") as mock_get:
+        with patch("gogetlinks_parser.requests.Session.get") as mock_get:
             mock_get.return_value = Mock(status_code=200)
             result = warm_links(mock_conn, logger)
 
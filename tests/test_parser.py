@@ -5,15 +5,43 @@ import logging
 
 import pytest
 from decimal import Decimal
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import ANY, Mock, patch, MagicMock
 
 from gogetlinks_parser import (
     parse_price,
     extract_task_id,
     parse_task_row,
+    parse_task_row_data,
+    parse_task_list,
     parse_task_details,
+    parse_task_details_html,
+    fetch_task_detail_html,
+    fetch_task_details_http,
+    parse_task_list_html,
+    parse_task_list_http,
+    extract_task_rows_html,
+    html_element_text,
     sanitize_text,
     is_anti_bot_blocked,
+    wait_for,
+    wait_for_page_ready,
+    format_wait_stats,
+    WAIT_STATS,
+    probe_element,
+    implicit_wait_disabled,
+    format_probe_stats,
+    PROBE_STATS,
+    IMPLICIT_WAIT,
+    parse_site_row_data,
+    read_my_sites_page,
+    parse_my_sites,
+    set_my_sites_count_in_page,
+    JS_EXTRACT_MY_SITES_ROWS,
+    JS_MY_SITES_MARKER,
+    JS_MY_SITES_PAGE_COUNT,
+    build_my_sites_page_request,
+    extract_my_sites_rows_html,
+    fetch_my_sites_pages_http,
 )
 
 
@@ -99,6 +127,363 @@ class TestTaskRowParser:
         assert task is None
 
 
+class TestTaskRowDataParser:
+    """Тесты парсинга строк, извлечённых одним вызовом execute_script"""
+
+    def _row(self, **overrides):
+        data = {
+            "id": "col_row_123456",
+            "cells": [
+                "example.com\nЗаметка",
+                "Test Client",
+                " 5 ",
+                "",
+                "2 часа назад",
+                "500 Р",
+            ],
+            "domain": "example.com",
+            "campaign": "Заметка",
+            "customer": "Test Client",
+            "customer_url": "https://gogetlinks.net/client/123",
+        }
+        data.update(overrides)
+        return data
+
+    def test_parse_row_data_success(self, logger):
+        task = parse_task_row_data(self._row(), logger)
+
+        assert task == {
+            "task_id": 123456,
+            "domain": "example.com",
+            "customer": "Test Client",
+            "customer_url": "https://gogetlinks.net/client/123",
+            "external_links": 5,
+            "title": "Заметка",
+            "time_passed": "2 часа назад",
+            "price": Decimal("500"),
+        }
+
+    def test_missing_optional_elements_fall_back_to_cells(self, logger):
+        task = parse_task_row_data(
+            self._row(domain=None, campaign=None, customer=None, customer_url=None),
+            logger,
+        )
+
+        assert task["domain"] == "example.com Заметка"
+        assert task["title"] == ""
+        assert task["customer"] == "Test Client"
+        assert task["customer_url"] == ""
+
+    def test_no_id(self, logger):
+        assert parse_task_row_data(self._row(id=""), logger) is None
+
+    def test_few_cells(self, logger):
+        assert parse_task_row_data(self._row(cells=["a", "b"]), logger) is None
+
+    def test_parse_task_list_uses_single_script_call(self, logger):
+        driver = Mock()
+        driver.execute_script.return_value = [self._row(), self._row(id="col_row_7")]
+
+        with patch("gogetlinks_parser.WebDriverWait"), patch(
+            "gogetlinks_parser.parse_task_details", return_value={}
+        ) as mock_details:
+            tasks = parse_task_list(driver, logger)
+
+        assert [t["task_id"] for t in tasks] == [123456, 7]
+        driver.execute_script.assert_called_once()
+        driver.find_elements.assert_not_called()
+        assert mock_details.call_count == 2
+
+    def test_parse_task_list_falls_back_to_webdriver(self, logger, sample_task_row):
+        driver = Mock()
+        driver.execute_script.return_value = None
+        driver.find_elements.return_value = [sample_task_row]
+
+        with patch("gogetlinks_parser.WebDriverWait"), \
+             patch("gogetlinks_parser.parse_task_details", return_value={}):
+            tasks = parse_task_list(driver, logger)
+
+        assert [t["task_id"] for t in tasks] == [123456]
+
+
+TASK_LIST_HTML = """
+<html><body><table>
+<tr><th>Сайт</th></tr>
+<tr id="col_row_123456">
+  <td><a href="http://example.com">example.com</a>
+      <div class="site-link__campaign">Заметка</div></td>
+  <td><a href="/client/123">Test&nbsp;Client</a></td>
+  <td> 5 </td>
+  <td><script>var x = 1;</script></td>
+  <td>2 часа<br>назад</td>
+  <td><span>500</span> Р</td>
+</tr>
+<tr id="col_row_7">
+  <td>plain.org</td><td>Anon</td><td></td><td></td><td>1 день</td><td>1 200 руб.</td>
+</tr>
+</table></body></html>
+"""
+
+TASK_DETAIL_HTML = """
+<div class="modal">
+  <input type="hidden" id="copy_url" value=" http://example.com/page ">
+  <div class="tv_params_block">
+    <div class="block_title">Требования к странице</div>
+    <div class="param"><div class="block_name">Индексация</div>
+      <div class="block_value">Да</div></div>
+    <div class="param"><div class="block_name">Пусто</div></div>
+  </div>
+  <div class="tv_params_block">
+    <div class="block_title">Текст задания</div>
+    <div class="params"><div class="block_value">Place link<br>at top</div></div>
+  </div>
+  <div class="tv_params_block">
+    <div class="block_title">Комментарий оптимизатора</div>
+    <div class="params"><div class="block_value">Срочно</div></div>
+  </div>
+  <div class="tv_params_block">
+    <div class="block_title">Ссылка</div>
+    <div class="param unchor"><div class="block_value">купить слона</div></div>
+  </div>
+</div>
+"""
+
+
+class TestHtmlParser:
+    """Тесты офлайн-разбора HTML (page_source, сохранённые снимки)"""
+
+    def test_html_element_text_breaks_blocks_and_skips_scripts(self):
+        import lxml.html
+
+        element = lxml.html.fromstring(
+            "<td>a<div>b</div>c<br>d<script>x()</script><b>e</b>f</td>"
+        )
+        assert html_element_text(element).split() == ["a", "b", "c", "def"]
+
+    def test_extract_rows_matches_script_format(self, logger):
+        rows = extract_task_rows_html(TASK_LIST_HTML, logger)
+
+        assert [r["id"] for r in rows] == ["col_row_123456", "col_row_7"]
+        assert rows[0]["domain"] == "example.com"
+        assert rows[0]["campaign"] == "Заметка"
+        assert rows[0]["customer_url"] == "https://gogetlinks.net/client/123"
+        assert len(rows[0]["cells"]) == 6
+        assert rows[1]["domain"] is None
+        assert rows[1]["customer"] is None
+        assert rows[1]["customer_url"] is None
+
+    def test_parse_task_list_html(self, logger):
+        tasks = parse_task_list_html(TASK_LIST_HTML, logger)
+
+        assert tasks[0] == {
+            "task_id": 123456,
+            "domain": "example.com",
+            "customer": "Test Client",
+            "customer_url": "https://gogetlinks.net/client/123",
+            "external_links": 5,
+            "title": "Заметка",
+            "time_passed": "2 часа назад",
+            "price": Decimal("500"),
+        }
+        assert tasks[1]["domain"] == "plain.org"
+        assert tasks[1]["customer"] == "Anon"
+        assert tasks[1]["external_links"] == 0
+        assert tasks[1]["price"] == Decimal("1200")
+
+    def test_empty_html(self, logger):
+        assert extract_task_rows_html("", logger) is None
+        assert parse_task_list_html("  ", logger) == []
+
+    def test_parse_task_details_html(self, logger):
+        details = parse_task_details_html(TASK_DETAIL_HTML, 123456, logger)
+
+        assert details == {
+            "description": (
+                "Place link at top\n[Комментарий] Срочно\n[Анкор] купить слона"
+            ),
+            "url": "http://example.com/page",
+            "requirements": "Индексация: Да",
+            "contacts": None,
+            "deadline": None,
+        }
+
+    def test_parse_task_details_html_link_fallback(self, logger):
+        html_text = (
+            '<div class="param link_to"><div class="block_value">'
+            '<a href="https://target.com/p">target</a></div></div>'
+            '<div class="param link_to"><div class="block_value">'
+            '<a href="https://gogetlinks.net/x">internal</a></div></div>'
+        )
+        details = parse_task_details_html(html_text, 1, logger)
+
+        assert details["url"] == "https://target.com/p"
+        assert details["description"] is None
+
+    def test_parse_task_details_html_empty(self, logger):
+        details = parse_task_details_html("", 1, logger)
+        assert set(details.values()) == {None}
+
+    def test_parse_task_list_html_mode_uses_page_source(self, logger):
+        driver = Mock()
+        driver.page_source = TASK_LIST_HTML
+
+        with patch("gogetlinks_parser.WebDriverWait"), \
+             patch("gogetlinks_parser.parse_task_details", return_value={}):
+            tasks = parse_task_list(driver, logger, extraction="html")
+
+        assert [t["task_id"] for t in tasks] == [123456, 7]
+        driver.execute_script.assert_not_called()
+        driver.find_elements.assert_not_called()
+
+
+def _detail_response(status=200, text=TASK_DETAIL_HTML):
+    response = Mock()
+    response.status_code = status
+    response.headers = {"Content-Type": "text/html; charset=utf-8"}
+    response.text = text
+    return response
+
+
+class TestHttpDetailFetch:
+    """Тесты загрузки деталей задач через requests"""
+
+    def test_fetch_detail_html_sends_ajax_request(self):
+        session = Mock()
+        session.get.return_value = _detail_response()
+
+        page = fetch_task_detail_html(session, "https://x/view?curr_id=1")
+        assert page == TASK_DETAIL_HTML
+
+        kwargs = session.get.call_args.kwargs
+        assert kwargs["headers"]["X-Requested-With"] == "XMLHttpRequest"
+        assert kwargs["allow_redirects"] is False
+
+    def test_fetch_detail_html_errors(self):
+        import requests
+
+        session = Mock()
+        session.get.return_value = _detail_response(status=302)
+        assert fetch_task_detail_html(session, "u") is None
+
+        session.get.side_effect = requests.ConnectionError()
+        assert fetch_task_detail_html(session, "u") is None
+
+    def test_fetch_details_parallel(self, logger):
+        session = Mock()
+
+        def get(url, **kwargs):
+            if url.endswith("=2"):
+                return _detail_response(text="<html>Вход</html>")
+            return _detail_response()
+
+        session.get.side_effect = get
+
+        results = fetch_task_details_http(
+            session, [1, 2, 3], logger, max_workers=3, rate_limit=0
+        )
+
+        assert set(results) == {1, 3}
+        assert results[1]["url"] == "http://example.com/page"
+        assert session.get.call_count == 3
+
+    def test_parse_task_list_falls_back_to_modal(self, logger):
+        driver = Mock()
+        driver.page_source = TASK_LIST_HTML
+        session = Mock()
+        session.get.side_effect = lambda url, **kw: (
+            _detail_response() if url.endswith("=123456") else _detail_response(404)
+        )
+
+        with patch("gogetlinks_parser.WebDriverWait"), \
+             patch(
+                 "gogetlinks_parser.parse_task_details",
+                 return_value={"description": "modal"},
+             ) as mock_modal:
+            tasks = parse_task_list(
+                driver, logger, extraction="html",
+                detail_session=session, detail_rps=0,
+            )
+
+        assert tasks[0]["requirements"] == "Индексация: Да"
+        assert tasks[1]["description"] == "modal"
+        mock_modal.assert_called_once_with(driver, 7, logger, throttle=ANY)
+
+    def test_parse_task_list_http_without_browser(self, logger):
+        list_html = TASK_LIST_HTML.replace(
+            "<body>", '<body><a href="/profile">Профиль</a>'
+        )
+        session = Mock()
+        session.get.side_effect = lambda url, **kw: (
+            _detail_response(text=list_html) if "webTask" in url
+            else _detail_response()
+        )
+
+        tasks = parse_task_list_http(session, logger, detail_rps=0)
+
+        assert [t["task_id"] for t in tasks] == [123456, 7]
+        assert tasks[0]["requirements"] == "Индексация: Да"
+        assert tasks[1]["requirements"] == "Индексация: Да"
+
+    def test_parse_task_list_http_failed_details_fall_back(self, logger):
+        list_html = TASK_LIST_HTML.replace(
+            "<body>", '<body><a href="/profile">Профиль</a>'
+        )
+        session = Mock()
+        session.get.side_effect = lambda url, **kw: (
+            _detail_response(text=list_html) if "webTask" in url
+            else _detail_response() if url.endswith("=123456")
+            else _detail_response(404)
+        )
+
+        # детали задачи 7 не загрузились — повтор через браузер с модалкой
+        assert parse_task_list_http(session, logger, detail_rps=0) is None
+
+    def test_parse_task_list_http_passes_in_chunk_size(self, logger):
+        list_html = TASK_LIST_HTML.replace(
+            "<body>", '<body><a href="/profile">Профиль</a>'
+        )
+        session = Mock()
+        session.get.return_value = _detail_response(text=list_html)
+        conn = Mock()
+
+        with patch(
+            "gogetlinks_parser.get_task_ids_with_details",
+            return_value={123456, 7},
+        ) as mock_lookup:
+            parse_task_list_http(session, logger, conn, chunk_size=50)
+
+        assert mock_lookup.call_args.kwargs["chunk_size"] == 50
+        # все задачи уже с деталями — запрашивается только список
+        session.get.assert_called_once()
+
+    def test_parse_task_list_http_without_rows_falls_back(self, logger):
+        # авторизованная страница без строк задач — повтор через браузер
+        session = Mock()
+        session.get.return_value = _detail_response(
+            text=(
+                '<html><body><a href="/profile">Профиль</a>'
+                "<table></table></body></html>"
+            )
+        )
+
+        assert parse_task_list_http(session, logger) is None
+        session.get.assert_called_once()
+
+        with patch(
+            "gogetlinks_parser.parse_task_list_html", side_effect=ValueError("bad")
+        ):
+            assert parse_task_list_http(session, logger) is None
+
+    def test_parse_task_list_http_not_authenticated(self, logger):
+        session = Mock()
+        session.get.return_value = _detail_response(text=TASK_LIST_HTML)
+        assert parse_task_list_http(session, logger) is None
+
+        session.get.return_value = _detail_response(status=302)
+        assert parse_task_list_http(session, logger) is None
+        assert session.get.call_args.kwargs["allow_redirects"] is False
+
+
 class TestTaskDetailsParser:
     """Тесты парсинга деталей задачи"""
 
@@ -178,6 +563,395 @@ class TestTaskDetailsParser:
         assert set(details.keys()) == expected_keys
 
 
+class TestExplicitWaits:
+    """Тесты слоя явных ожиданий вместо фиксированных sleep"""
+
+    @pytest.fixture(autouse=True)
+    def clean_stats(self):
+        WAIT_STATS.clear()
+        yield
+        WAIT_STATS.clear()
+
+    def test_wait_for_returns_as_soon_as_condition_holds(self):
+        driver = Mock()
+        calls = []
+
+        def condition(d):
+            calls.append(d)
+            return len(calls) >= 2 and "ready"
+
+        assert wait_for(driver, condition, timeout=5, description="x") == "ready"
+        assert WAIT_STATS["x"][:2] == [1, 0]
+        assert WAIT_STATS["x"][2] < 1
+
+    def test_wait_for_timeout(self):
+        from selenium.common.exceptions import TimeoutException
+
+        driver = Mock()
+        with pytest.raises(TimeoutException):
+            wait_for(driver, lambda d: False, timeout=0.2, description="x")
+        assert wait_for(
+            driver, lambda d: False, timeout=0.2, description="x", required=False
+        ) is None
+        assert WAIT_STATS["x"][:2] == [2, 2]
+        assert "2 timed out" in format_wait_stats()
+
+    def test_wait_for_page_ready_checks_ready_state_and_ajax(self):
+        driver = Mock()
+        driver.execute_script.side_effect = [False, True]
+
+        assert wait_for_page_ready(driver, timeout=5) is True
+        assert "jQuery.active" in driver.execute_script.call_args[0][0]
+
+    def test_format_wait_stats_empty(self):
+        assert format_wait_stats() == "no explicit waits"
+
+    def test_parse_task_details_does_not_sleep(self, logger):
+        driver = Mock()
+        throttle = Mock()
+
+        with patch("gogetlinks_parser.WebDriverWait"), \
+             patch("gogetlinks_parser.time.sleep") as mock_sleep:
+            parse_task_details(driver, 1, logger, throttle=throttle)
+
+        throttle.assert_called_once_with()
+        mock_sleep.assert_not_called()
+
+
+class TestFastProbes:
+    """Тесты быстрых проверок необязательных элементов"""
+
+    @pytest.fixture(autouse=True)
+    def clean_stats(self):
+        PROBE_STATS.clear()
+        yield
+        PROBE_STATS.clear()
+
+    def test_probe_hit_and_miss_are_counted(self):
+        from selenium.common.exceptions import NoSuchElementException
+
+        parent = Mock()
+        found = Mock()
+        parent.find_element.side_effect = [found, NoSuchElementException()]
+
+        assert probe_element(parent, "css selector", ".x") is found
+        assert probe_element(parent, "css selector", ".x") is None
+        assert PROBE_STATS[".x"] == [2, 1]
+        assert format_probe_stats() == "1/2 optional lookups missed (.x 1)"
+
+    def test_implicit_wait_disabled_restores_wait(self):
+        driver = Mock()
+
+        with implicit_wait_disabled(driver):
+            driver.implicitly_wait.assert_called_once_with(0)
+
+        driver.implicitly_wait.assert_called_with(IMPLICIT_WAIT)
+
+    def test_implicit_wait_disabled_noop(self):
+        driver = Mock()
+
+        with implicit_wait_disabled(driver, enabled=False):
+            pass
+
+        driver.implicitly_wait.assert_not_called()
+
+    def test_parse_task_row_without_optional_elements(self, logger):
+        from selenium.common.exceptions import NoSuchElementException
+
+        row = Mock()
+        row.get_attribute.return_value = "col_row_5"
+        cells = [Mock() for _ in range(6)]
+        for cell, text in zip(cells, ["site.ru", "Client", "0", "", "1 ч", "100"]):
+            cell.text = text
+            cell.find_element.side_effect = NoSuchElementException()
+        row.find_elements.return_value = cells
+
+        task = parse_task_row(row, logger)
+
+        assert task["domain"] == "site.ru"
+        assert task["title"] == ""
+        assert task["customer_url"] == ""
+        assert PROBE_STATS["a"] == [2, 2]
+        assert PROBE_STATS[".site-link__campaign"] == [1, 1]
+
+    def test_parse_task_list_runs_without_implicit_wait(self, logger):
+        driver = Mock()
+        driver.execute_script.return_value = []
+
+        with patch("gogetlinks_parser.WebDriverWait"):
+            parse_task_list(driver, logger)
+
+        assert [c.args for c in driver.implicitly_wait.call_args_list] == [
+            (0,), (IMPLICIT_WAIT,)
+        ]
+
+    def test_page_size_selector_is_waited_for_explicitly(self, logger):
+        from selenium.common.exceptions import NoSuchElementException
+
+        # Селектор появляется не сразу, а неявное ожидание выключено
+        element = Mock()
+        driver = Mock()
+        driver.find_element.side_effect = [NoSuchElementException()] * 2 + [element]
+        driver.find_elements.return_value = [element]
+
+        with patch("gogetlinks_parser.Select") as mock_select, \
+             patch("gogetlinks_parser.wait_for_page_ready"), \
+             patch("gogetlinks_parser.WAIT_POLL_INTERVAL", 0.01):
+            mock_select.return_value.options = [Mock(text="50"), Mock(text="500")]
+            for option in mock_select.return_value.options:
+                option.get_attribute.return_value = option.text
+            set_my_sites_count_in_page(driver, logger)
+
+        assert driver.find_element.call_count == 3
+        mock_select.return_value.select_by_value.assert_called_once_with("500")
+        driver.execute_async_script.assert_not_called()
+
+
+def _site_row(site="Example.COM", **overrides):
+    data = {
+        "cells": [
+            "example.com", "Активен", "SQI 120", "CF 20 / TF 11", "",
+            "1 500", "", "", "", "35",
+        ],
+        "site": site,
+    }
+    data.update(overrides)
+    return data
+
+
+class TestMySitesScriptExtraction:
+    """Тесты извлечения таблицы mySites одним вызовом execute_script"""
+
+    def test_parse_site_row_data(self):
+        assert parse_site_row_data(_site_row()) == {
+            "site": "example.com",
+            "status": "Активен",
+            "sqi": 120,
+            "cf_tf": 2011,
+            "traffic": 1500,
+            "trust": 35,
+            "description": None,
+        }
+
+    def test_parse_site_row_data_fallbacks(self):
+        assert parse_site_row_data(_site_row(site=None))["site"] == "example.com"
+        assert parse_site_row_data(_site_row(site=" ")) is None
+        assert parse_site_row_data(_site_row(cells=["a"] * 9)) is None
+
+    def test_read_page_in_one_call(self, logger):
+        driver = Mock()
+        driver.execute_script.return_value = [_site_row(), _site_row(site="b.ru")]
+
+        sites = read_my_sites_page(driver, logger)
+
+        assert [s["site"] for s in sites] == ["example.com", "b.ru"]
+        driver.execute_script.assert_called_once()
+        driver.find_elements.assert_not_called()
+
+    def test_read_page_falls_back_to_webdriver(self, logger):
+        from selenium.common.exceptions import WebDriverException
+
+        driver = Mock()
+        driver.execute_script.side_effect = WebDriverException("no js")
+        driver.find_elements.return_value = []
+
+        assert read_my_sites_page(driver, logger) == []
+        driver.find_elements.assert_called_once()
+
+    def test_parse_my_sites_single_page(self, logger):
+        driver = Mock()
+        driver.find_elements.return_value = []
+
+        def execute_script(script, *args):
+            if script == JS_EXTRACT_MY_SITES_ROWS:
+                return [_site_row(), _site_row(site="b.ru")]
+            if script == JS_MY_SITES_MARKER:
+                return "a|b|2"
+            return None
+
+        driver.execute_script.side_effect = execute_script
+
+        with patch("gogetlinks_parser.WebDriverWait"), \
+             patch("gogetlinks_parser.go_to_next_my_sites_page", return_value=False):
+            sites = parse_my_sites(driver, logger)
+
+        assert sorted(s["site"] for s in sites) == ["b.ru", "example.com"]
+
+
+def _sites_html(*hosts):
+    cells = "<td>Активен</td><td>SQI 1</td><td>0</td><td></td><td>10</td>"
+    cells += "<td></td><td></td><td></td><td>5</td>"
+    return "".join(
+        f'<tr><td><a class="site-link__info">{host}</a></td>{cells}</tr>'
+        for host in hosts
+    )
+
+
+def _page_response(text):
+    response = Mock()
+    response.status_code = 200
+    response.text = text
+    return response
+
+
+class TestMySitesHttpPagination:
+    """Тесты прямой HTTP-пагинации mySites"""
+
+    REQUEST = {
+        "url": "https://gogetlinks.net/mySites/load",
+        "method": "POST",
+        "data": "page=2&count=2&sort=",
+    }
+
+    def test_build_request_prefers_page_param(self):
+        request = build_my_sites_page_request(self.REQUEST, 2, 5)
+
+        assert request["data"] == "page=5&count=2&sort="
+        assert request["url"] == self.REQUEST["url"]
+
+    def test_build_request_from_query_and_path(self):
+        query = {"url": "https://x/mySites?p=2", "method": "GET", "data": ""}
+        request = build_my_sites_page_request(query, 2, 3)
+        assert request["url"] == "https://x/mySites?p=3"
+
+        path = {"url": "https://x/mySites/page/2", "method": "GET", "data": ""}
+        request = build_my_sites_page_request(path, 2, 3)
+        assert request["url"] == "https://x/mySites/page/3"
+
+        none = {"url": "https://x/mySites", "method": "GET", "data": "a=1"}
+        assert build_my_sites_page_request(none, 2, 3) is None
+
+    def test_build_request_ignores_unnamed_page_values(self):
+        # совпадение значения с номером страницы без имени page не считается
+        data = {"url": "https://x/mySites/load", "method": "POST", "data": "count=2"}
+        assert build_my_sites_page_request(data, 2, 3) is None
+
+        path = {"url": "https://x/mySites/load/2", "method": "GET", "data": ""}
+        assert build_my_sites_page_request(path, 2, 3) is None
+
+    def test_extract_rows_from_fragment_and_json(self, logger):
+        import json
+
+        rows = extract_my_sites_rows_html(_sites_html("a.ru", "b.ru"), logger)
+        assert [r["site"] for r in rows] == ["a.ru", "b.ru"]
+        assert rows[0]["cells"][9] == "5"
+
+        wrapped = json.dumps({"status": "ok", "html": _sites_html("c.ru")})
+        rows = extract_my_sites_rows_html(wrapped, logger)
+        assert [r["site"] for r in rows] == ["c.ru"]
+
+    def test_fetch_pages_in_parallel_and_probe_past_window(self, logger):
+        from urllib.parse import parse_qs
+
+        driver = Mock()
+        driver.execute_async_script.return_value = {
+            "url": "/mySites/load", "method": "POST", "data": "page=2",
+        }
+        pages = {2: ["b.ru"], 3: ["c.ru"], 4: ["d.ru"], 5: ["d.ru"]}
+        session = Mock()
+        session.request.side_effect = lambda method, url, data=None, **kw: (
+            _page_response(_sites_html(*pages[int(parse_qs(data)["page"][0])]))
+        )
+
+        sites = fetch_my_sites_pages_http(
+            driver, session, logger, 3, known_sites=["a.ru"], rate_limit=0
+        )
+
+        assert [s["site"] for s in sites] == ["b.ru", "c.ru", "d.ru"]
+        assert session.request.call_count == 4
+        url = session.request.call_args.args[1]
+        assert url == "https://gogetlinks.net/mySites/load"
+
+    def test_fetch_pages_fails_on_empty_page(self, logger):
+        driver = Mock()
+        driver.execute_async_script.return_value = self.REQUEST
+        session = Mock()
+        session.request.return_value = _page_response("<html>login</html>")
+
+        pages = fetch_my_sites_pages_http(driver, session, logger, 3, rate_limit=0)
+        assert pages is None
+
+    def test_probing_continues_until_empty_page(self, logger):
+        from urllib.parse import parse_qs
+
+        driver = Mock()
+        driver.execute_async_script.return_value = self.REQUEST
+        session = Mock()
+
+        # окно пагинации показывает 3 страницы, а их на самом деле 7
+        def request(method, url, data=None, **kw):
+            page = int(parse_qs(data)["page"][0])
+            return _page_response(_sites_html(f"site{page}.ru") if page <= 7 else "")
+
+        session.request.side_effect = request
+
+        sites = fetch_my_sites_pages_http(driver, session, logger, 3, rate_limit=0)
+
+        assert [s["site"] for s in sites] == [f"site{n}.ru" for n in range(2, 8)]
+        assert session.request.call_count == 7
+
+    def test_failed_probe_falls_back_to_browser(self, logger):
+        from urllib.parse import parse_qs
+
+        driver = Mock()
+        driver.execute_async_script.return_value = self.REQUEST
+        session = Mock()
+
+        def request(method, url, data=None, **kw):
+            page = int(parse_qs(data)["page"][0])
+            if page == 5:
+                return Mock(status_code=502)
+            return _page_response(_sites_html(f"site{page}.ru"))
+
+        session.request.side_effect = request
+
+        # неполный список сайтов не возвращается
+        pages = fetch_my_sites_pages_http(driver, session, logger, 3, rate_limit=0)
+        assert pages is None
+
+    def test_probing_stops_at_max_pages(self, logger):
+        from urllib.parse import parse_qs
+
+        driver = Mock()
+        driver.execute_async_script.return_value = self.REQUEST
+        session = Mock()
+        session.request.side_effect = lambda method, url, data=None, **kw: (
+            _page_response(_sites_html(f"site{parse_qs(data)['page'][0]}.ru"))
+        )
+
+        with patch("gogetlinks_parser.MY_SITES_MAX_PAGES", 6):
+            assert fetch_my_sites_pages_http(
+                driver, session, logger, 3, rate_limit=0
+            ) is None
+        assert session.request.call_count == 5
+
+    def test_fetch_pages_without_jquery(self, logger):
+        driver = Mock()
+        driver.execute_async_script.return_value = None
+
+        assert fetch_my_sites_pages_http(driver, Mock(), logger, 3) is None
+
+    def test_parse_my_sites_uses_http_pages(self, logger):
+        driver = Mock()
+        driver.find_elements.return_value = []
+        driver.execute_script.side_effect = lambda script, *args: {
+            JS_EXTRACT_MY_SITES_ROWS: [_site_row()],
+            JS_MY_SITES_MARKER: "a|a|1",
+            JS_MY_SITES_PAGE_COUNT: 2,
+        }.get(script)
+
+        other_pages = [parse_site_row_data(_site_row(site="b.ru"))]
+        fetch_pages = "gogetlinks_parser.fetch_my_sites_pages_http"
+
+        with patch("gogetlinks_parser.WebDriverWait"), \
+             patch(fetch_pages, return_value=other_pages), \
+             patch("gogetlinks_parser.go_to_next_my_sites_page") as mock_next:
+            sites = parse_my_sites(driver, logger, session=Mock())
+
+        assert sorted(s["site"] for s in sites) == ["b.ru", "example.com"]
+        mock_next.assert_not_called()
+
+
 class TestHTMLCleaning:
     """Тесты очистки HTML"""
 